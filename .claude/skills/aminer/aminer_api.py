@@ -96,6 +96,64 @@ def make_get_request(endpoint: str, params: Optional[dict] = None) -> dict:
         sys.exit(1)
 
 
+# Shared async client for concurrent callers (e.g. fetch_scholar_data.py).
+# All endpoints live on one host, so HTTP/2 lets concurrent requests share a
+# single multiplexed connection. httpx is imported lazily so the CLI keeps
+# working with the standard library only.
+_ACLIENT = None
+
+
+def get_async_client():
+    """
+    Get (or lazily create) the shared httpx.AsyncClient.
+
+    Uses HTTP/2 when the h2 package is installed (httpx[http2]) and HTTP/1.1
+    with keep-alive otherwise. Raises ImportError if httpx is missing.
+    """
+    global _ACLIENT
+    if _ACLIENT is None:
+        import httpx
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:  # Optional: HTTP/2 multiplexing
+            http2 = False
+
+        _ACLIENT = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            timeout=httpx.Timeout(30, connect=10),
+        )
+    return _ACLIENT
+
+
+async def close_async_client() -> None:
+    """Close the shared async client if it was created."""
+    global _ACLIENT
+    if _ACLIENT is not None:
+        await _ACLIENT.aclose()
+        _ACLIENT = None
+
+
+async def make_get_request_async(endpoint: str, params: Optional[dict] = None) -> dict:
+    """
+    Make a GET request to the AMiner API using the shared async client.
+
+    Unlike make_get_request, HTTP errors are raised (httpx.HTTPStatusError)
+    instead of exiting, so concurrent callers can handle them per request.
+    """
+    api_key = get_api_key()
+    headers = {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json;charset=utf-8"
+    }
+
+    response = await get_async_client().get(f"{BASE_URL}{endpoint}", params=params, headers=headers)
+    response.raise_for_status()
+    return response.json()
+
+
 def search_organization(org_names: list[str]) -> dict:
     """
     Search for organization IDs by name.
@@ -266,6 +324,31 @@ def get_person_patents(person_id: str) -> dict:
     return make_get_request("/person/patent/relation", {"id": person_id})
 
 
+async def get_person_detail_async(person_id: str) -> dict:
+    """Async variant of get_person_detail."""
+    return await make_get_request_async("/person/detail", {"id": person_id})
+
+
+async def get_person_projects_async(person_id: str) -> dict:
+    """Async variant of get_person_projects."""
+    return await make_get_request_async("/project/person/v3/open", {"id": person_id})
+
+
+async def get_person_figure_async(person_id: str) -> dict:
+    """Async variant of get_person_figure."""
+    return await make_get_request_async("/person/figure", {"id": person_id})
+
+
+async def get_person_all_papers_async(person_id: str) -> dict:
+    """Async variant of get_person_all_papers."""
+    return await make_get_request_async("/person/paper/relation", {"id": person_id})
+
+
+async def get_person_patents_async(person_id: str) -> dict:
+    """Async variant of get_person_patents."""
+    return await make_get_request_async("/person/patent/relation", {"id": person_id})
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="AMiner Academic Query API Client",
@@ -7,11 +7,18 @@ scholar validation, and terminal output formatting.
 """
 
 import json
+import os
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON file I/O
+    orjson = None
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -24,6 +31,7 @@ class Colors:
     ENDC = '\033[0m'
 
 
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory (parent of agent_scripts)."""
     return Path(__file__).parent.parent.resolve()
@@ -31,15 +39,82 @@ def get_project_root() -> Path:
 
 def load_json_file(file_path: Path) -> dict:
     """Load and parse a JSON file."""
+    if orjson is not None:
+        return orjson.loads(Path(file_path).read_bytes())
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 def save_json_file(file_path: Path, data: dict) -> None:
-    """Save data to a JSON file with proper formatting."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write('\n')
+    """
+    Save data to a JSON file with proper formatting.
+
+    Writes to a temporary file and renames it over the target, so an
+    interrupted run never leaves a truncated file behind.
+    """
+    tmp_path = Path(file_path).with_name(Path(file_path).name + '.tmp')
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        ))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+    os.replace(tmp_path, file_path)
+
+
+# JSON documents shared between pipeline steps running in one process, keyed by
+# resolved path and validated against the file's (mtime_ns, size)
+_documents: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def load_json_document(file_path: Path) -> dict:
+    """
+    Load a JSON document, reusing the in-memory copy from an earlier
+    load_json_document/save_json_document call if the file is unchanged.
+
+    Lets pipeline steps that run in one process (see papers/build_pipeline.py)
+    hand papers.json/authors.json to each other without re-parsing. The
+    returned object is shared: callers that modify it must save it back with
+    save_json_document.
+    """
+    path = Path(file_path).resolve()
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _documents.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    data = load_json_file(path)
+    _documents[path] = (key, data)
+    return data
+
+
+def save_json_document(file_path: Path, data: dict) -> None:
+    """Save a JSON document and remember it for later load_json_document calls."""
+    path = Path(file_path).resolve()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    save_json_file(path, data)
+    st = path.stat()
+    _documents[path] = ((st.st_mtime_ns, st.st_size), data)
+
+
+@lru_cache(maxsize=8192)
+def _load_cached(path_str: str, mtime_ns: int, size: int) -> dict:
+    return load_json_file(Path(path_str))
+
+
+def load_json_cached(file_path: Path) -> dict:
+    """
+    Load a small JSON file through an LRU cache keyed by path and (mtime_ns, size).
+
+    For per-item cache files (scholars, paper details) that can be read more
+    than once in a run; a rewritten file gets a new key and is parsed again.
+    The returned object is shared between callers, so treat it as read-only.
+    """
+    path = Path(file_path)
+    st = path.stat()
+    return _load_cached(str(path), st.st_mtime_ns, st.st_size)
 
 
 def archive_file(file_path: Path) -> Path:
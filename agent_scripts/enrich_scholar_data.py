@@ -26,6 +26,10 @@ from pathlib import Path
 
 from agent_utils import MessageFormatter
 
+# Code-block patterns used by parse_agent_result, tried in order
+_JSON_BLOCK_RE = re.compile(r'```json\s*\n?(.*?)\n?```', re.DOTALL)
+_ANY_BLOCK_RE = re.compile(r'```\s*\n?(.*?)\n?```', re.DOTALL)
+
 
 def get_project_root() -> Path:
     """Get the project root directory (parent of agent_scripts)."""
@@ -248,14 +252,8 @@ def parse_agent_result(result_text: str) -> dict:
         return {"status": "error", "error": "Empty response from agent"}
 
     # Try to find JSON in code blocks first
-    json_patterns = [
-        r'```json\s*\n?(.*?)\n?```',
-        r'```\s*\n?(.*?)\n?```',
-    ]
-
-    for pattern in json_patterns:
-        matches = re.findall(pattern, result_text, re.DOTALL)
-        for match in matches:
+    for pattern in (_JSON_BLOCK_RE, _ANY_BLOCK_RE):
+        for match in pattern.findall(result_text):
             try:
                 json_str = match.strip()
                 if json_str.startswith('{'):
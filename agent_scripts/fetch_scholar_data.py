@@ -6,6 +6,9 @@ This script reads a JSON file containing scholar information with validated
 AMiner IDs, fetches specified data from AMiner APIs, and saves the data to
 individual JSON files. By default, only fetches basic detail information.
 
+Requests are issued through a shared httpx client, over HTTP/2 if the h2
+package is installed (pip install 'httpx[http2]') and HTTP/1.1 otherwise.
+
 Usage:
     python fetch_scholar_data.py <json_file_path> [options]
 
@@ -27,9 +30,11 @@ Example:
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
+import pickle
 import sys
-import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -44,11 +49,13 @@ def get_project_root() -> Path:
 sys.path.insert(0, str(get_project_root() / ".claude/skills/aminer"))
 
 from aminer_api import (
-    get_person_detail,
-    get_person_figure,
-    get_person_projects,
-    get_person_all_papers,
-    get_person_patents,
+    close_async_client,
+    get_async_client,
+    get_person_detail_async,
+    get_person_figure_async,
+    get_person_projects_async,
+    get_person_all_papers_async,
+    get_person_patents_async,
 )
 
 
@@ -76,6 +83,38 @@ def save_json_file(file_path: Path, data: dict) -> None:
         f.write('\n')
 
 
+CACHE_DIR = Path.home() / ".cache" / "aaai_scholar"
+
+
+def _cached_load(file_path: Path) -> dict:
+    """
+    Load a JSON file, reusing a pickled copy from a previous run if unchanged.
+
+    The cache entry is keyed by (path, mtime_ns, size), so any modification
+    of the input file invalidates it. Cache failures fall back to parsing.
+    """
+    stat = file_path.stat()
+    key = f"{file_path}:{stat.st_mtime_ns}:{stat.st_size}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    cache_file = CACHE_DIR / f"talents_{digest}.pkl"
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            pass
+
+    data = load_json_file(file_path)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return data
+
+
 def get_validated_scholars(data: dict) -> list[dict]:
     """
     Extract scholars with validated AMiner IDs from the data.
@@ -117,7 +156,18 @@ def get_validated_scholars(data: dict) -> list[dict]:
     return scholars
 
 
-def fetch_scholar_data(
+# Fetchable fields: (field name, endpoint label, async API function, count label).
+# The count label is used for verbose output of list-valued fields.
+FETCH_ENDPOINTS = [
+    ("detail", "person-detail", get_person_detail_async, None),
+    ("figure", "person-figure", get_person_figure_async, None),
+    ("projects", "person-projects", get_person_projects_async, "projects"),
+    ("papers", "person-papers", get_person_all_papers_async, "papers"),
+    ("patents", "person-patents", get_person_patents_async, "patents"),
+]
+
+
+async def fetch_scholar_data(
     aminer_id: str,
     fetch_fields: set[str] = None,
     verbose: bool = False
@@ -125,6 +175,9 @@ def fetch_scholar_data(
     """
     Fetch specified data for a scholar from AMiner APIs.
 
+    All requested endpoints are fetched concurrently over the shared HTTP
+    client, then reported in a fixed order.
+
     Args:
         aminer_id: The scholar's AMiner ID
         fetch_fields: Set of fields to fetch (detail, figure, projects, papers, patents)
@@ -144,111 +197,36 @@ def fetch_scholar_data(
     }
     errors = []
 
-    # Fetch person detail
-    if 'detail' in fetch_fields:
-        if verbose:
-            print(f"       person-detail... ", end="", flush=True)
-        try:
-            detail_resp = get_person_detail(aminer_id)
-            if detail_resp.get("success"):
-                result["detail"] = detail_resp.get("data")
-                if verbose:
-                    print(f"{Colors.GREEN}OK{Colors.ENDC}")
-            else:
-                error_msg = detail_resp.get("message", "Unknown error")
-                errors.append(f"person-detail: {error_msg}")
-                if verbose:
-                    print(f"{Colors.RED}FAILED{Colors.ENDC} ({error_msg})")
-        except Exception as e:
-            errors.append(f"person-detail: {str(e)}")
-            if verbose:
-                print(f"{Colors.RED}ERROR{Colors.ENDC} ({str(e)})")
-
-    # Fetch person figure (profile)
-    if 'figure' in fetch_fields:
-        if verbose:
-            print(f"       person-figure... ", end="", flush=True)
-        try:
-            figure_resp = get_person_figure(aminer_id)
-            if figure_resp.get("success"):
-                result["figure"] = figure_resp.get("data")
-                if verbose:
-                    print(f"{Colors.GREEN}OK{Colors.ENDC}")
-            else:
-                error_msg = figure_resp.get("message", "Unknown error")
-                errors.append(f"person-figure: {error_msg}")
-                if verbose:
-                    print(f"{Colors.RED}FAILED{Colors.ENDC} ({error_msg})")
-        except Exception as e:
-            errors.append(f"person-figure: {str(e)}")
-            if verbose:
-                print(f"{Colors.RED}ERROR{Colors.ENDC} ({str(e)})")
+    endpoints = [e for e in FETCH_ENDPOINTS if e[0] in fetch_fields]
+    responses = await asyncio.gather(
+        *(api_func(aminer_id) for _, _, api_func, _ in endpoints),
+        return_exceptions=True
+    )
 
-    # Fetch person projects
-    if 'projects' in fetch_fields:
+    for (field, label, _, count_label), resp in zip(endpoints, responses):
         if verbose:
-            print(f"       person-projects... ", end="", flush=True)
-        try:
-            projects_resp = get_person_projects(aminer_id)
-            if projects_resp.get("success"):
-                projects_data = projects_resp.get("data", [])
-                result["projects"] = projects_data
-                if verbose:
-                    count = len(projects_data) if projects_data else 0
-                    print(f"{Colors.GREEN}OK{Colors.ENDC} ({count} projects)")
-            else:
-                error_msg = projects_resp.get("message", "Unknown error")
-                errors.append(f"person-projects: {error_msg}")
-                if verbose:
-                    print(f"{Colors.RED}FAILED{Colors.ENDC} ({error_msg})")
-        except Exception as e:
-            errors.append(f"person-projects: {str(e)}")
-            if verbose:
-                print(f"{Colors.RED}ERROR{Colors.ENDC} ({str(e)})")
+            print(f"       {label}... ", end="", flush=True)
 
-    # Fetch all papers
-    if 'papers' in fetch_fields:
-        if verbose:
-            print(f"       person-papers... ", end="", flush=True)
-        try:
-            papers_resp = get_person_all_papers(aminer_id)
-            if papers_resp.get("success"):
-                papers_data = papers_resp.get("data", [])
-                result["papers"] = papers_data
-                if verbose:
-                    count = len(papers_data) if papers_data else 0
-                    print(f"{Colors.GREEN}OK{Colors.ENDC} ({count} papers)")
-            else:
-                error_msg = papers_resp.get("message", "Unknown error")
-                errors.append(f"person-papers: {error_msg}")
-                if verbose:
-                    print(f"{Colors.RED}FAILED{Colors.ENDC} ({error_msg})")
-        except Exception as e:
-            errors.append(f"person-papers: {str(e)}")
+        if isinstance(resp, Exception):
+            errors.append(f"{label}: {str(resp)}")
             if verbose:
-                print(f"{Colors.RED}ERROR{Colors.ENDC} ({str(e)})")
-
-    # Fetch patents
-    if 'patents' in fetch_fields:
-        if verbose:
-            print(f"       person-patents... ", end="", flush=True)
-        try:
-            patents_resp = get_person_patents(aminer_id)
-            if patents_resp.get("success"):
-                patents_data = patents_resp.get("data", [])
-                result["patents"] = patents_data
+                print(f"{Colors.RED}ERROR{Colors.ENDC} ({str(resp)})")
+        elif resp.get("success"):
+            if count_label is None:
+                result[field] = resp.get("data")
                 if verbose:
-                    count = len(patents_data) if patents_data else 0
-                    print(f"{Colors.GREEN}OK{Colors.ENDC} ({count} patents)")
+                    print(f"{Colors.GREEN}OK{Colors.ENDC}")
             else:
-                error_msg = patents_resp.get("message", "Unknown error")
-                errors.append(f"person-patents: {error_msg}")
+                field_data = resp.get("data", [])
+                result[field] = field_data
                 if verbose:
-                    print(f"{Colors.RED}FAILED{Colors.ENDC} ({error_msg})")
-        except Exception as e:
-            errors.append(f"person-patents: {str(e)}")
+                    count = len(field_data) if field_data else 0
+                    print(f"{Colors.GREEN}OK{Colors.ENDC} ({count} {count_label})")
+        else:
+            error_msg = resp.get("message", "Unknown error")
+            errors.append(f"{label}: {error_msg}")
             if verbose:
-                print(f"{Colors.RED}ERROR{Colors.ENDC} ({str(e)})")
+                print(f"{Colors.RED}FAILED{Colors.ENDC} ({error_msg})")
 
     # Only add errors list if there are errors
     if errors:
@@ -285,7 +263,7 @@ def merge_scholar_data(existing: dict, new_data: dict) -> dict:
     return merged
 
 
-def process_scholars(
+async def process_scholars(
     json_file_path: Path,
     output_dir: Path,
     mode: str = "skip",
@@ -311,7 +289,7 @@ def process_scholars(
     """
     # Load the JSON file
     print(f"Loading JSON file: {json_file_path}")
-    data = load_json_file(json_file_path)
+    data = _cached_load(json_file_path)
 
     # Get validated scholars
     scholars = get_validated_scholars(data)
@@ -319,7 +297,8 @@ def process_scholars(
 
     # Filter by target IDs if specified
     if target_ids:
-        scholars = [s for s in scholars if s.get("aminer_id") in target_ids]
+        target_id_set = frozenset(target_ids)
+        scholars = [s for s in scholars if s.get("aminer_id") in target_id_set]
         print(f"Filtered to {len(scholars)} scholars matching target IDs")
 
     # Ensure output directory exists
@@ -354,7 +333,7 @@ def process_scholars(
         print(f"[{idx}/{stats['total']}] {Colors.CYAN}Fetching{Colors.ENDC} {name} ({aminer_id})")
 
         # Fetch data from AMiner APIs
-        scholar_data = fetch_scholar_data(aminer_id, fetch_fields=fetch_fields, verbose=verbose)
+        scholar_data = await fetch_scholar_data(aminer_id, fetch_fields=fetch_fields, verbose=verbose)
 
         # Merge with existing data if in merge mode
         if mode == "merge" and output_file.exists():
@@ -388,11 +367,22 @@ def process_scholars(
 
         # Rate limiting
         if idx < stats["total"] and delay > 0:
-            time.sleep(delay)
+            await asyncio.sleep(delay)
 
     return stats
 
 
+async def run_processing(**kwargs) -> dict:
+    """Run process_scholars and close the shared HTTP client afterwards."""
+    # Create the client up front, so setup errors (e.g. httpx not installed) abort
+    # the run instead of being saved as failed endpoints for every scholar
+    get_async_client()
+    try:
+        return await process_scholars(**kwargs)
+    finally:
+        await close_async_client()
+
+
 def print_summary(stats: dict) -> None:
     """Print processing summary."""
     print("\n" + "=" * 60)
@@ -519,7 +509,7 @@ Examples:
         else:
             print(f"Warning: IDs file not found: {ids_file_path}")
 
-    target_ids = list(set(target_ids)) if target_ids else None
+    target_ids = list(dict.fromkeys(target_ids)) or None
 
     # Process fetch fields
     fetch_fields = set(args.fetch)
@@ -535,7 +525,7 @@ Examples:
     print()
 
     # Process scholars
-    stats = process_scholars(
+    stats = asyncio.run(run_processing(
         json_file_path=json_file_path,
         output_dir=output_dir,
         mode=args.mode,
@@ -543,7 +533,7 @@ Examples:
         target_ids=target_ids,
         delay=args.delay,
         verbose=args.verbose
-    )
+    ))
 
     # Print summary
     print_summary(stats)
@@ -12,55 +12,268 @@ Usage:
 
 import json
 import os
+import pickle
 from pathlib import Path
-from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Set, Optional, Any
+from operator import itemgetter
+from typing import Dict, List, Set, Optional, Any, Tuple
 import argparse
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON parsing and serialization
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Optional: typed decoding of AMiner paper files
+    msgspec = None
+
+# On-disk cache of the parsed AMiner corpus, reused while input files are unchanged
+AMINER_CACHE_FILE = Path.home() / '.cache' / 'aaai' / 'aminer.pkl'
+# Bump when the cached per-paper structure changes
+AMINER_CACHE_VERSION = 2
+
+
+def read_json(path: Path) -> Any:
+    """
+    Parse a JSON file with orjson, falling back to the stdlib parser.
+
+    orjson is stricter than json (e.g. it rejects NaN), so files it cannot
+    decode are retried with json before giving up.
+    """
+    raw = path.read_bytes()
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+def dumps_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson if available (2-space indent with `indent`)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def list_json_files(directory: Path) -> List[str]:
+    """List JSON file paths in a directory with a single scandir pass."""
+    with os.scandir(directory) as entries:
+        return [e.path for e in entries if e.name.endswith('.json') and e.is_file()]
+
+
+if msgspec is not None:
+    class _AminerAuthor(msgspec.Struct):
+        name: Optional[str] = ''
+        id: Optional[str] = None
+        org: Optional[str] = None
+
+    class _AminerDetail(msgspec.Struct):
+        authors: List[_AminerAuthor] = []
+
+    class _AminerPaper(msgspec.Struct):
+        """Only the AMiner paper fields used for author matching; others are skipped."""
+        aminer_id: Optional[str] = None
+        detail: _AminerDetail = msgspec.field(default_factory=_AminerDetail)
+
+    _aminer_decoder = msgspec.json.Decoder(_AminerPaper)
+
+
+def _decode_aminer_authors(raw: bytes) -> Tuple[Optional[str], List[Tuple[str, str, Optional[str]]]]:
+    """
+    Decode an AMiner paper file into (aminer_id, [(name, aminer_author_id, org), ...]).
+
+    Uses the msgspec schema decoder when available, which never materializes
+    unused fields; otherwise (or if the file does not fit the schema) falls
+    back to generic JSON parsing.
+    """
+    if msgspec is not None:
+        try:
+            paper = _aminer_decoder.decode(raw)
+            return paper.aminer_id, [
+                (a.name, a.id, a.org)
+                for a in paper.detail.authors
+                if a.id
+            ]
+        except msgspec.DecodeError:
+            pass
+
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    if data is None:
+        data = json.loads(raw)
+    return data.get('aminer_id'), [
+        (a.get('name', ''), a.get('id'), a.get('org'))
+        for a in data.get('detail', {}).get('authors', [])
+        if a.get('id')
+    ]
+
+
+def _parse_aminer_file(path: str) -> Optional[Tuple[str, List[Tuple[str, str, Optional[str]]]]]:
+    """
+    Parse one AMiner paper JSON file (runs in a worker process).
+
+    Only the author fields used for matching are kept, so abstracts,
+    references, venues, etc. are never sent back to the parent process.
+
+    Args:
+        path: Path to the AMiner paper JSON file
+
+    Returns:
+        (aminer_id, [(name, aminer_author_id, org), ...]) tuple,
+        or None if the file has no ID or fails to load
+    """
+    try:
+        aminer_id, authors = _decode_aminer_authors(Path(path).read_bytes())
+        if aminer_id:
+            return aminer_id, authors
+    except Exception as e:
+        print(f"Warning: Failed to load {path}: {e}")
+    return None
+
+
+@dataclass(slots=True)
+class AuthorAgg:
+    """
+    Per-author data aggregated from program files.
+
+    The set fields are replaced with sorted tuples by finalize_authors()
+    once ingestion is complete.
+    """
+    paper_idx: List[int] = field(default_factory=list)  # Rows in the paper columns
+    collaborators: Set[str] = field(default_factory=set)
+    tracks: Set[str] = field(default_factory=set)
+    sources: Set[str] = field(default_factory=set)
+    source_urls: Set[str] = field(default_factory=set)
+
+
+# Column order of the paper store; aminer_paper_id is omitted from output when empty
+PAPER_COLUMNS = ('paper_id', 'title', 'track', 'session', 'date', 'room', 'aminer_paper_id')
+
+# Below this many authors, building entries serially beats process-pool overhead
+PARALLEL_MIN_AUTHORS = 5000
+
 
 class AuthorDataGenerator:
     """Generator for creating authors.json from program and AMiner data."""
 
-    def __init__(self, program_dir: str, aminer_papers_dir: str):
+    def __init__(self, program_dir: str, aminer_papers_dir: str, use_cache: bool = True):
         """
         Initialize the generator.
 
         Args:
             program_dir: Directory containing program JSON files
             aminer_papers_dir: Directory containing AMiner paper JSON files
+            use_cache: Reuse the on-disk cache of parsed AMiner papers when valid
         """
         self.program_dir = Path(program_dir)
         self.aminer_papers_dir = Path(aminer_papers_dir)
+        self.use_cache = use_cache
 
         # Data structures
-        self.authors_data = defaultdict(lambda: {
-            'papers': [],
-            'collaborators': set(),
-            'tracks': set(),
-            'sources': set(),
-            'source_urls': set()
-        })
+        self.authors_data: Dict[str, AuthorAgg] = {}
+
+        # Intern table so repeated names/tracks share one string object
+        self._names: Dict[str, str] = {}
+
+        # Prefetched markdown source URLs: {md_path: source_url}
+        self._md_url_cache: Dict[Path, Optional[str]] = {}
 
-        # AMiner paper cache: {paper_id: paper_data}
-        self.aminer_papers_cache = {}
+        # Papers stored column-wise: {column: [value per paper row]}.
+        # Authors reference rows by index; dicts are only built for output.
+        self._papers_cols: Dict[str, List] = {column: [] for column in PAPER_COLUMNS}
+
+        # AMiner paper cache: {paper_id: [(author_name, aminer_author_id, org), ...]}
+        self.aminer_papers_cache: Dict[str, List[Tuple[str, str, Optional[str]]]] = {}
+
+        # AMiner author index: {(aminer_paper_id, author_name): (aminer_author_id, org)}
+        self._author_index: Dict[Tuple[str, str], Tuple[str, Optional[str]]] = {}
+
+        # Run timestamps, computed once instead of per matched author
+        self._set_run_timestamp()
+
+    def _set_run_timestamp(self) -> None:
+        """Capture the timestamp and date used for all records in this run."""
+        now = datetime.now()
+        self._run_timestamp = now.isoformat()
+        self._run_date = now.strftime('%Y-%m-%d')
+
+    def _intern(self, value: str) -> str:
+        """Return the canonical instance of a string seen during ingestion."""
+        return self._names.setdefault(value, value)
 
     def load_aminer_papers(self) -> None:
         """Load all AMiner paper JSON files into cache."""
         print(f"Loading AMiner papers from {self.aminer_papers_dir}...")
 
-        json_files = list(self.aminer_papers_dir.glob("*.json"))
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    aminer_id = data.get('aminer_id')
-                    if aminer_id:
-                        self.aminer_papers_cache[aminer_id] = data
-            except Exception as e:
-                print(f"Warning: Failed to load {json_file}: {e}")
+        paths = list_json_files(self.aminer_papers_dir)
+
+        # Reuse the parsed corpus from a previous run if no file changed
+        cache_key = (
+            AMINER_CACHE_VERSION,
+            str(self.aminer_papers_dir.resolve()),
+            len(paths),
+            max((os.stat(p).st_mtime_ns for p in paths), default=0)
+        )
+        cached = self._load_aminer_pickle(cache_key) if self.use_cache else None
+        if cached is not None:
+            self.aminer_papers_cache = cached
+            print(f"Loaded {len(self.aminer_papers_cache)} AMiner papers (from cache)")
+        else:
+            with ProcessPoolExecutor() as executor:
+                for parsed in executor.map(_parse_aminer_file, paths, chunksize=64):
+                    if parsed:
+                        self.aminer_papers_cache[parsed[0]] = parsed[1]
+
+            print(f"Loaded {len(self.aminer_papers_cache)} AMiner papers")
+            if self.use_cache:
+                self._save_aminer_pickle(cache_key)
+
+        self.build_author_index()
 
-        print(f"Loaded {len(self.aminer_papers_cache)} AMiner papers")
+    def _load_aminer_pickle(self, cache_key: tuple) -> Optional[Dict]:
+        """Return the cached AMiner corpus if it was built from the same files."""
+        if not AMINER_CACHE_FILE.exists():
+            return None
+        try:
+            with open(AMINER_CACHE_FILE, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('key') == cache_key:
+                return cached['papers']
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable AMiner cache {AMINER_CACHE_FILE}: {e}")
+        return None
+
+    def _save_aminer_pickle(self, cache_key: tuple) -> None:
+        """Persist the parsed AMiner corpus for the next run."""
+        try:
+            AMINER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(AMINER_CACHE_FILE, 'wb') as f:
+                pickle.dump(
+                    {'key': cache_key, 'papers': self.aminer_papers_cache},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+        except OSError as e:
+            print(f"Warning: Failed to write AMiner cache {AMINER_CACHE_FILE}: {e}")
+
+    def build_author_index(self) -> None:
+        """Index AMiner authors by (aminer_paper_id, name) for O(1) matching."""
+        self._author_index = {}
+        for aminer_paper_id, aminer_authors in self.aminer_papers_cache.items():
+            for name, aminer_author_id, org in aminer_authors:
+                # Keep the first author with this name, as a linear scan would
+                self._author_index.setdefault((aminer_paper_id, name), (aminer_author_id, org))
 
     def extract_source_url_from_md(self, md_file: Path) -> Optional[str]:
         """
@@ -73,22 +286,48 @@ class AuthorDataGenerator:
             Source URL if found, None otherwise
         """
         try:
-            with open(md_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            # Lines are read lazily, so only the file's head up to the closing
+            # `---` is read, however long the frontmatter is
+            with open(md_file, 'rb') as f:
                 in_frontmatter = False
-                for line in lines:
-                    if line.strip() == '---':
-                        if not in_frontmatter:
-                            in_frontmatter = True
-                        else:
+                for line in f:
+                    if line.strip() == b'---':
+                        if in_frontmatter:
                             break
-                    elif in_frontmatter and line.startswith('source_url:'):
-                        return line.split('source_url:', 1)[1].strip()
+                        in_frontmatter = True
+                    elif in_frontmatter and line.startswith(b'source_url:'):
+                        return line.split(b'source_url:', 1)[1].decode('utf-8', 'ignore').strip()
         except Exception as e:
             print(f"Warning: Failed to extract URL from {md_file}: {e}")
 
         return None
 
+    def prefetch_source_urls(self, json_files: List[Path]) -> None:
+        """
+        Read markdown frontmatter for all program files concurrently.
+
+        Args:
+            json_files: Program JSON files whose sibling .md files to read
+        """
+        # One scandir per directory instead of an exists() stat per file
+        md_names: Dict[Path, Set[str]] = {}
+        for directory in {jf.parent for jf in json_files}:
+            with os.scandir(directory) as entries:
+                md_names[directory] = {e.name for e in entries if e.name.endswith('.md')}
+
+        md_files = []
+        for jf in json_files:
+            md_file = jf.with_suffix('.md')
+            if md_file.name in md_names[jf.parent]:
+                md_files.append(md_file)
+            else:
+                # Record misses too, so process_program_file never stats them
+                self._md_url_cache[md_file] = None
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            urls = executor.map(self.extract_source_url_from_md, md_files)
+            self._md_url_cache.update(zip(md_files, urls))
+
     def process_program_file(self, json_file: Path) -> None:
         """
         Process a single program JSON file.
@@ -97,60 +336,64 @@ class AuthorDataGenerator:
             json_file: Path to program JSON file
         """
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = read_json(json_file)
 
             papers = data.get('papers', [])
 
-            # Get source URL from corresponding markdown file
+            # Get source URL from corresponding markdown file (prefetched in run())
             md_file = json_file.with_suffix('.md')
-            source_url = None
-            if md_file.exists():
+            if md_file in self._md_url_cache:
+                source_url = self._md_url_cache[md_file]
+            elif md_file.exists():
                 source_url = self.extract_source_url_from_md(md_file)
+            else:
+                source_url = None
 
             # Relative path for sources field
             relative_source = f"program/{json_file.name}"
 
             for paper in papers:
-                authors = paper.get('authors', [])
-                track = paper.get('track') or 'Unknown'
-
-                # Paper information
-                paper_info = {
-                    'paper_id': paper.get('paper_id'),
-                    'title': paper.get('title'),
-                    'track': track,
-                    'session': paper.get('session'),
-                    'date': paper.get('date'),
-                    'room': paper.get('room')
-                }
-
-                # AMiner paper ID if available
-                aminer_paper_id = paper.get('aminer_paper_id')
-                if aminer_paper_id:
-                    paper_info['aminer_paper_id'] = aminer_paper_id
+                authors = [self._intern(a) for a in paper.get('authors', [])]
+                authors_set = set(authors)
+                track = self._intern(paper.get('track') or 'Unknown')
+
+                # Paper information, stored once as a row in the paper columns
+                row = (
+                    paper.get('paper_id'),
+                    paper.get('title'),
+                    track,
+                    paper.get('session'),
+                    paper.get('date'),
+                    paper.get('room'),
+                    paper.get('aminer_paper_id') or None
+                )
+                paper_idx = len(self._papers_cols['paper_id'])
+                for column, value in zip(PAPER_COLUMNS, row):
+                    self._papers_cols[column].append(value)
 
                 # Process each author
                 for author_name in authors:
-                    author_data = self.authors_data[author_name]
+                    author_data = self.authors_data.get(author_name)
+                    if author_data is None:
+                        author_data = self.authors_data[author_name] = AuthorAgg()
 
                     # Add paper
-                    author_data['papers'].append(paper_info)
+                    author_data.paper_idx.append(paper_idx)
 
                     # Add track
-                    author_data['tracks'].add(track)
+                    author_data.tracks.add(track)
 
-                    # Add collaborators (all other authors)
-                    for other_author in authors:
-                        if other_author != author_name:
-                            author_data['collaborators'].add(other_author)
+                    # Add collaborators (all other authors). An author is never
+                    # their own collaborator, so discarding after the union is safe.
+                    author_data.collaborators.update(authors_set)
+                    author_data.collaborators.discard(author_name)
 
                     # Add source
-                    author_data['sources'].add(relative_source)
+                    author_data.sources.add(relative_source)
 
                     # Add source URL
                     if source_url:
-                        author_data['source_urls'].add(source_url)
+                        author_data.source_urls.add(source_url)
 
         except Exception as e:
             print(f"Error processing {json_file}: {e}")
@@ -171,125 +414,156 @@ class AuthorDataGenerator:
             if not aminer_paper_id:
                 continue
 
-            # Get AMiner paper data
-            aminer_paper = self.aminer_papers_cache.get(aminer_paper_id)
-            if not aminer_paper:
-                continue
-
-            # Try to match author name
-            aminer_authors = aminer_paper.get('detail', {}).get('authors', [])
-            for aminer_author in aminer_authors:
-                aminer_author_name = aminer_author.get('name', '')
-                aminer_author_id = aminer_author.get('id')
-
-                # Simple name matching (exact match for now)
-                if aminer_author_name == author_name and aminer_author_id:
-                    return {
-                        'aminer_id': aminer_author_id,
-                        'aminer_validation': {
-                            'status': 'success',
-                            'matched_via': f"paper:{paper['paper_id']},aminer_paper:{aminer_paper_id}",
-                            'confidence': 'high',
-                            'matched_at': datetime.now().isoformat()
-                        },
-                        'affiliation': aminer_author.get('org')  # May be None
-                    }
+            # Simple name matching (exact match for now)
+            hit = self._author_index.get((aminer_paper_id, author_name))
+            if hit:
+                aminer_author_id, org = hit
+                return {
+                    'aminer_id': aminer_author_id,
+                    'aminer_validation': {
+                        'status': 'success',
+                        'matched_via': f"paper:{paper['paper_id']},aminer_paper:{aminer_paper_id}",
+                        'confidence': 'high',
+                        'matched_at': self._run_timestamp
+                    },
+                    'affiliation': org  # May be None
+                }
 
         return None
 
-    def generate_description(self, author_name: str, author_data: Dict) -> str:
+    def finalize_authors(self) -> None:
+        """Freeze each author's sets into sorted tuples after ingestion."""
+        for author_data in self.authors_data.values():
+            author_data.tracks = tuple(sorted(t for t in author_data.tracks if t is not None))
+            author_data.collaborators = tuple(sorted(author_data.collaborators))
+            author_data.sources = tuple(sorted(author_data.sources))
+            author_data.source_urls = tuple(sorted(author_data.source_urls))
+
+    def generate_description(self, author_name: str, author_data: AuthorAgg) -> str:
         """
         Generate description for an author.
 
         Args:
             author_name: Name of the author
-            author_data: Author's data including papers, collaborators, etc.
+            author_data: Finalized author data including papers, collaborators, etc.
 
         Returns:
             Generated description text
         """
-        papers = author_data['papers']
-        tracks = sorted([t for t in author_data['tracks'] if t is not None])
-        collaborators = sorted(list(author_data['collaborators']))[:5]  # Top 5
-
-        # Build description
-        desc_parts = [
-            f"{author_name} is an author at AAAI-26"
-        ]
+        paper_count = len(author_data.paper_idx)
+        tracks = author_data.tracks
+        collaborators = author_data.collaborators
 
         # Paper count and tracks
-        paper_count = len(papers)
         if paper_count == 1:
-            desc_parts.append(f"presenting 1 paper in the {tracks[0]} track")
+            head = f"{author_name} is an author at AAAI-26, presenting 1 paper in the {tracks[0]} track."
         else:
-            track_str = ", ".join(tracks)
-            desc_parts.append(f"presenting {paper_count} papers across {track_str} track{'s' if len(tracks) > 1 else ''}")
-
-        description = ", ".join(desc_parts) + "."
-
-        # Add collaborators
-        if collaborators:
-            collab_str = ", ".join(collaborators)
-            if len(author_data['collaborators']) > 5:
-                collab_str += ", and others"
-            description += f" Collaborating with {collab_str}."
-
-        return description
+            head = (
+                f"{author_name} is an author at AAAI-26, presenting {paper_count} papers "
+                f"across {', '.join(tracks)} track{'s' if len(tracks) > 1 else ''}."
+            )
+
+        # Add collaborators (top 5)
+        if not collaborators:
+            return head
+        others = ", and others" if len(collaborators) > 5 else ""
+        return f"{head} Collaborating with {', '.join(collaborators[:5])}{others}."
+
+    def materialize_papers(self) -> List[Dict]:
+        """
+        Build one output dict per paper row from the paper columns.
 
-    def generate_authors_json(self) -> Dict:
+        Returns:
+            List of paper dicts, indexed like AuthorAgg.paper_idx
         """
-        Generate the final authors.json structure.
+        cols = self._papers_cols
+        papers = []
+        for values in zip(*(cols[column] for column in PAPER_COLUMNS)):
+            paper = dict(zip(PAPER_COLUMNS[:-1], values[:-1]))
+            # AMiner paper ID if available
+            if values[-1]:
+                paper['aminer_paper_id'] = values[-1]
+            papers.append(paper)
+        return papers
+
+    def build_talent(self, author_name: str, author_data: AuthorAgg, papers: List[Dict]) -> Dict:
+        """
+        Build the authors.json entry for one author.
+
+        Args:
+            author_name: Name of the author
+            author_data: Finalized author data
+            papers: Materialized papers of this author
 
         Returns:
-            Dictionary ready to be serialized as JSON
+            Talent dictionary for the output file
         """
-        talents = []
+        # Build talent entry (tracks are already filtered and sorted)
+        valid_tracks = author_data.tracks
+        talent = {
+            'name': author_name,
+            'roles': [f"{track} Track Author" for track in valid_tracks]
+        }
 
-        print(f"\nProcessing {len(self.authors_data)} authors...")
+        # Add papers
+        talent['papers'] = papers
 
-        for author_name in sorted(self.authors_data.keys()):
-            author_data = self.authors_data[author_name]
+        # Add statistics
+        talent['statistics'] = {
+            'total_papers': len(papers),
+            'tracks': valid_tracks,
+            'collaborators_count': len(author_data.collaborators)
+        }
 
-            # Build talent entry
-            # Filter out None values and sort tracks
-            valid_tracks = sorted([t for t in author_data['tracks'] if t is not None])
-            talent = {
-                'name': author_name,
-                'roles': [f"{track} Track Author" for track in valid_tracks]
-            }
+        # Add collaborators
+        if author_data.collaborators:
+            talent['collaborators'] = author_data.collaborators
 
-            # Add papers
-            talent['papers'] = author_data['papers']
+        # Generate description
+        talent['description'] = self.generate_description(author_name, author_data)
 
-            # Add statistics
-            talent['statistics'] = {
-                'total_papers': len(author_data['papers']),
-                'tracks': valid_tracks,
-                'collaborators_count': len(author_data['collaborators'])
-            }
+        # Add sources
+        talent['sources'] = author_data.sources
+        talent['source_urls'] = author_data.source_urls
 
-            # Add collaborators
-            if author_data['collaborators']:
-                talent['collaborators'] = sorted(list(author_data['collaborators']))
+        # Try to match AMiner ID
+        aminer_match = self.match_aminer_id(author_name, papers)
+        if aminer_match:
+            talent['aminer_id'] = aminer_match['aminer_id']
+            talent['aminer_validation'] = aminer_match['aminer_validation']
 
-            # Generate description
-            talent['description'] = self.generate_description(author_name, author_data)
+            # Add affiliation if available
+            if aminer_match.get('affiliation'):
+                talent['affiliation'] = aminer_match['affiliation']
 
-            # Add sources
-            talent['sources'] = sorted(author_data['sources'])
-            talent['source_urls'] = sorted(author_data['source_urls'])
+        return talent
+
+    def generate_authors_json(self) -> Dict:
+        """
+        Generate the final authors.json structure.
 
-            # Try to match AMiner ID
-            aminer_match = self.match_aminer_id(author_name, author_data['papers'])
-            if aminer_match:
-                talent['aminer_id'] = aminer_match['aminer_id']
-                talent['aminer_validation'] = aminer_match['aminer_validation']
+        Returns:
+            Dictionary ready to be serialized as JSON
+        """
+        print(f"\nProcessing {len(self.authors_data)} authors...")
 
-                # Add affiliation if available
-                if aminer_match.get('affiliation'):
-                    talent['affiliation'] = aminer_match['affiliation']
+        all_papers = self.materialize_papers()
+        items = [
+            (name, author_data, [all_papers[i] for i in author_data.paper_idx])
+            for name, author_data in self.authors_data.items()
+        ]
+        if len(items) < PARALLEL_MIN_AUTHORS:
+            talents = [self.build_talent(*item) for item in items]
+        else:
+            # Workers only need the AMiner index and run timestamp, not the whole generator
+            with ProcessPoolExecutor(
+                initializer=_init_talent_worker,
+                initargs=(self._author_index, self._run_timestamp)
+            ) as executor:
+                talents = list(executor.map(_build_talent, items, chunksize=256))
 
-            talents.append(talent)
+        # Order the output by name once, after building entries in insertion order
+        talents.sort(key=itemgetter('name'))
 
         # Build final structure
         result = {
@@ -299,7 +573,7 @@ class AuthorDataGenerator:
                 'dates': 'January 20-27, 2026',
                 'location': 'Singapore EXPO, Singapore',
                 'extracted_from': 'AAAI 2026 Program Schedule',
-                'extraction_date': datetime.now().strftime('%Y-%m-%d'),
+                'extraction_date': self._run_date,
                 'total_authors': len(talents),
                 'base_path': 'data/aaai-26'
             },
@@ -308,24 +582,60 @@ class AuthorDataGenerator:
 
         return result
 
-    def run(self, output_file: str) -> None:
+    def write_authors_json(self, result: Dict, output_path: Path, compact: bool = False) -> None:
+        """
+        Stream the authors.json structure to disk one author at a time.
+
+        Produces the same bytes as a single dumps_json of the whole
+        document, without building the full serialized string in memory.
+
+        Args:
+            result: Structure returned by generate_authors_json
+            output_path: Path to output JSON file
+            compact: Write without indentation (smaller and faster to serialize)
+        """
+        authors = result['authors']
+
+        if compact:
+            with open(output_path, 'wb') as f:
+                f.write(b'{"metadata":' + dumps_json(result['metadata']) + b',"authors":[')
+                for i, talent in enumerate(authors):
+                    f.write(b',' + dumps_json(talent) if i else dumps_json(talent))
+                f.write(b']}\n')
+            return
+
+        def dump(obj: Any, depth: int) -> bytes:
+            # JSON strings never contain raw newlines, so re-indenting is safe
+            return dumps_json(obj, indent=True).replace(b'\n', b'\n' + b'  ' * depth)
+
+        with open(output_path, 'wb') as f:
+            f.write(b'{\n  "metadata": ' + dump(result['metadata'], 1) + b',\n  "authors": [')
+            for i, talent in enumerate(authors):
+                f.write((b',\n    ' if i else b'\n    ') + dump(talent, 2))
+            f.write(b'\n  ]\n}\n' if authors else b']\n}\n')
+
+    def run(self, output_file: str, compact: bool = False) -> None:
         """
         Run the full pipeline to generate authors.json.
 
         Args:
             output_file: Path to output JSON file
+            compact: Write the output without indentation
         """
         print("Starting author data generation...")
+        self._set_run_timestamp()
 
         # Step 1: Load AMiner papers
         self.load_aminer_papers()
 
         # Step 2: Process all program JSON files
         print(f"\nProcessing program files from {self.program_dir}...")
-        json_files = list(self.program_dir.glob("*.json"))
+        json_files = [Path(p) for p in list_json_files(self.program_dir)]
+        self.prefetch_source_urls(json_files)
         for json_file in json_files:
             print(f"  Processing {json_file.name}...")
             self.process_program_file(json_file)
+        self.finalize_authors()
 
         # Step 3: Generate final JSON
         print("\nGenerating authors.json...")
@@ -335,8 +645,7 @@ class AuthorDataGenerator:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        self.write_authors_json(result, output_path, compact=compact)
 
         print(f"\n✓ Successfully generated {output_file}")
         print(f"  Total authors: {result['metadata']['total_authors']}")
@@ -347,6 +656,23 @@ class AuthorDataGenerator:
         print(f"  Match rate: {aminer_matched/result['metadata']['total_authors']*100:.1f}%")
 
 
+# Per-process generator used by _build_talent in worker processes
+_worker_generator: Optional[AuthorDataGenerator] = None
+
+
+def _init_talent_worker(author_index: Dict, run_timestamp: str) -> None:
+    """Set up the generator state needed by _build_talent in a worker process."""
+    global _worker_generator
+    _worker_generator = AuthorDataGenerator('', '', use_cache=False)
+    _worker_generator._author_index = author_index
+    _worker_generator._run_timestamp = run_timestamp
+
+
+def _build_talent(item: Tuple[str, AuthorAgg, List[Dict]]) -> Dict:
+    """Build one talent entry in a worker process."""
+    return _worker_generator.build_talent(*item)
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -367,12 +693,22 @@ def main():
         default='data/aaai-26/authors.json',
         help='Output file path (default: data/aaai-26/authors.json)'
     )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Write authors.json without indentation (smaller, faster to write and parse)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always re-parse AMiner paper files instead of using the on-disk cache'
+    )
 
     args = parser.parse_args()
 
     # Create generator and run
-    generator = AuthorDataGenerator(args.program_dir, args.aminer_dir)
-    generator.run(args.output)
+    generator = AuthorDataGenerator(args.program_dir, args.aminer_dir, use_cache=not args.no_cache)
+    generator.run(args.output, compact=args.compact)
 
 
 if __name__ == '__main__':
@@ -18,15 +18,31 @@ Example:
 import argparse
 import asyncio
 import json
+import os
 import re
 import shutil
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
 from agent_utils import MessageFormatter
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON file I/O
+    orjson = None
 
+
+# Code-block patterns used by parse_agent_result, tried in order: json-tagged
+# blocks take priority over untagged ones
+_JSON_BLOCK_RE = re.compile(r'```json\s*\n?(.*?)\n?```', re.DOTALL)
+_ANY_BLOCK_RE = re.compile(r'```\s*\n?(.*?)\n?```', re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+
+
+@lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Get the project root directory (parent of agent_scripts)."""
     return Path(__file__).parent.parent.resolve()
@@ -34,15 +50,40 @@ def get_project_root() -> Path:
 
 def load_json_file(file_path: Path) -> dict:
     """Load and parse a JSON file."""
+    if orjson is not None:
+        return orjson.loads(file_path.read_bytes())
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 def save_json_file(file_path: Path, data: dict) -> None:
-    """Save data to a JSON file with proper formatting."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write('\n')
+    """
+    Save data to a JSON file with proper formatting.
+
+    Writes to a temporary file first and renames it into place, so an
+    interrupted run never leaves a truncated file behind.
+    """
+    tmp_path = file_path.with_suffix('.json.tmp')
+    if orjson is not None:
+        with open(tmp_path, 'wb', buffering=-1) as f:
+            f.write(orjson.dumps(
+                data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            ))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=-1) as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+    os.replace(tmp_path, file_path)
+
+
+async def _aload(file_path: Path) -> dict:
+    """Load a JSON file in a worker thread so concurrent labeling isn't blocked on disk."""
+    return await asyncio.to_thread(load_json_file, file_path)
+
+
+async def _asave(file_path: Path, data: dict) -> None:
+    """Save a JSON file in a worker thread so concurrent labeling isn't blocked on disk."""
+    await asyncio.to_thread(save_json_file, file_path, data)
 
 
 def load_labels_definition(labels_file: Path | None, labels_json: str | None) -> dict:
@@ -72,6 +113,15 @@ def load_labels_definition(labels_file: Path | None, labels_json: str | None) ->
         sys.exit(1)
 
 
+def list_json_ids(directory: Path) -> set[str]:
+    """Return the stems of all .json files in a directory (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {e.name[:-5] for e in entries if e.name.endswith('.json')}
+    except FileNotFoundError:
+        return set()
+
+
 def get_validated_scholars(data: dict) -> list[dict]:
     """
     Extract scholars from input data supporting both 'talents' (scholars.json)
@@ -128,8 +178,7 @@ def truncate_list(items: list | None, max_items: int = 2) -> list | None:
 def build_scholar_context(
     scholar: dict,
     aminer_data: dict | None,
-    enriched_data: dict | None,
-    labels_definition: dict
+    enriched_data: dict | None
 ) -> dict:
     """
     Build a combined context for the Agent, truncating large lists.
@@ -138,7 +187,6 @@ def build_scholar_context(
         scholar: Scholar data from aaai-26-ai-talents.json
         aminer_data: AMiner cache data (if available)
         enriched_data: Enriched data from data/enriched/scholars/<id>.json
-        labels_definition: Labels definition to judge
 
     Returns:
         Combined context dictionary with truncated lists
@@ -179,25 +227,27 @@ def build_scholar_context(
         if enriched_fields:
             context["enriched_data"] = enriched_fields
 
-    # Add labels to judge
-    context["labels_to_judge"] = labels_definition.get("labels", [])
-
     return context
 
 
-def build_prompt(scholar_json: str) -> str:
-    """Build the prompt for the Agent."""
-    return f"""你是一个学者信息分析专家。我们需要你基于提供的学者信息，判断该学者是否符合指定的标签定义。
+# The instructions and labels_to_judge are identical for every scholar in a run, so they go
+# into the system prompt (a stable, cacheable prefix); the user prompt carries only the
+# scholar JSON.
+SYSTEM_PROMPT_PREFIX = """你是一个学者信息分析专家。我们需要你基于提供的学者信息，判断该学者是否符合指定的标签定义。
 
-学者的综合信息如下（注意：AMiner 的 projects、papers、patents 仅展示前 2 条，实际数据更多）：
+需要判断的标签定义（`labels_to_judge`）如下：
 
 ```json
-{scholar_json}
+"""
+
+SYSTEM_PROMPT_SUFFIX = """
 ```
 
+学者的综合信息会在用户消息中以 JSON 格式提供（注意：AMiner 的 projects、papers、patents 仅展示前 2 条，实际数据更多）。
+
 **任务说明：**
 
-请根据上述信息中的 `labels_to_judge` 字段，逐一判断该学者是否符合每个标签的定义。对于每个标签，你需要：
+请根据上述 `labels_to_judge`，逐一判断该学者是否符合每个标签的定义。对于每个标签，你需要：
 
 1. 仔细阅读标签的 `description`（判断标准）
 2. 综合分析所有可用信息（basic_info、aminer_detail、aminer_figure、enriched_data 等）
@@ -209,22 +259,22 @@ def build_prompt(scholar_json: str) -> str:
 **输出格式：**
 
 ```json
-{{
+{
   "results": [
-    {{
+    {
       "name": "Chinese",
       "value": true,
       "confidence": "high",
       "reason": "姓名为中文拼音（Zhang Wei），本科和博士均毕业于中国大陆高校（清华大学），目前在北京大学任教，个人主页使用中英双语。综合判断为华人学者。"
-    }},
-    {{
+    },
+    {
       "name": "Student",
       "value": false,
       "confidence": "high",
       "reason": "职称为 Associate Professor，个人主页明确显示 2018 年入职北京大学，已指导多名博士生，发表多篇论文作为通讯作者。明确不是学生身份。"
-    }}
+    }
   ]
-}}
+}
 ```
 
 **重要提醒：**
@@ -238,19 +288,203 @@ def build_prompt(scholar_json: str) -> str:
 如果遇到致命错误导致无法完成判断：
 
 ```json
-{{
+{
   "status": "error",
   "error": "错误描述"
-}}
+}
 ```"""
 
 
+SCHOLAR_PROMPT_PREFIX = """学者的综合信息如下：
+
+```json
+"""
+
+SCHOLAR_PROMPT_SUFFIX = """
+```
+
+请按照系统提示中的输出格式返回判断结果。"""
+
+
+def dumps_indented(data) -> str:
+    """Serialize to 2-space indented JSON, keeping non-ASCII characters as-is."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def build_system_prompt(labels_definition: dict) -> str:
+    """
+    Build the system prompt holding the instructions and labels to judge.
+
+    The labels are identical for every scholar in a run, so callers build the
+    prompt once and reuse it byte-for-byte, which keeps it eligible for prompt caching.
+    """
+    labels = labels_definition.get("labels", [])
+    return SYSTEM_PROMPT_PREFIX + dumps_indented(labels) + SYSTEM_PROMPT_SUFFIX
+
+
+def build_prompt(scholar_json: str) -> str:
+    """Build the per-scholar user prompt for the Agent."""
+    return SCHOLAR_PROMPT_PREFIX + scholar_json + SCHOLAR_PROMPT_SUFFIX
+
+
+def build_scholar_prompt(
+    scholar: dict,
+    aminer_data: dict | None,
+    enriched_data: dict | None
+) -> str:
+    """Build the labeling prompt for one scholar."""
+    context = build_scholar_context(scholar, aminer_data, enriched_data)
+    return build_prompt(dumps_indented(context))
+
+
+def is_batch_eligible(aminer_data: dict | None, enriched_data: dict) -> bool:
+    """
+    Whether a scholar has enough local data to be labeled without web tools.
+
+    Requires an AMiner detail record and enriched fields beyond bookkeeping keys.
+    """
+    if not aminer_data or not aminer_data.get("detail"):
+        return False
+    return any(k not in ("aminer_id", "last_updated", "labels") for k in enriched_data)
+
+
+async def label_scholars_batch(
+    prompts: dict[str, str],
+    system_prompt: str,
+    model: str
+) -> dict[str, dict]:
+    """
+    Label scholars through the Anthropic Message Batches API (no tool use).
+
+    The shared system prompt is marked for prompt caching, so only the
+    per-scholar prompts are processed in full for each request.
+
+    Args:
+        prompts: Mapping of AMiner ID (used as custom_id) to prompt
+        system_prompt: System prompt shared by all requests
+        model: Model name for the batch requests
+
+    Returns:
+        Parsed result per AMiner ID. Requests that did not succeed (errored,
+        canceled, expired) are omitted so callers can fall back to the agent.
+    """
+    import anthropic  # Checked in main() when --use-batch-api is set
+
+    client = anthropic.AsyncAnthropic()
+    batch = await client.messages.batches.create(requests=[
+        {
+            "custom_id": aminer_id,
+            "params": {
+                "model": model,
+                "max_tokens": BATCH_MAX_TOKENS,
+                "system": [{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        }
+        for aminer_id, prompt in prompts.items()
+    ])
+    print(f"Submitted batch {batch.id} with {len(prompts)} requests")
+
+    # Poll with exponential backoff until the batch has ended
+    delay = BATCH_POLL_INITIAL_SECONDS
+    while batch.processing_status != "ended":
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX_SECONDS)
+        batch = await client.messages.batches.retrieve(batch.id)
+        counts = batch.request_counts
+        print(f"  Batch {batch.id}: {counts.processing} processing, "
+              f"{counts.succeeded} succeeded, {counts.errored} errored")
+
+    results = {}
+    async for entry in await client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            continue
+        text = "\n".join(
+            block.text for block in entry.result.message.content
+            if getattr(block, "type", None) == "text"
+        )
+        results[entry.custom_id] = parse_agent_result(text.strip())
+    return results
+
+
+def _extract_result(message, chunks: list[str]) -> None:
+    """Collect the final string result of a ResultMessage."""
+    result = message.result
+    if isinstance(result, str) and result.strip():
+        chunks.append(result)
+
+
+def _extract_content(message, chunks: list[str]) -> None:
+    """Collect text from a message's content (a string or a sequence of blocks)."""
+    content = message.content
+    if isinstance(content, str):
+        if content.strip():
+            chunks.append(content)
+        return
+    for block in content:
+        handler = _lookup_handler(_BLOCK_HANDLERS, type(block))
+        if handler is not None:
+            handler(block, chunks)
+
+
+def _extract_text_block(block, chunks: list[str]) -> None:
+    """Collect the text of a TextBlock."""
+    if isinstance(block.text, str) and block.text.strip():
+        chunks.append(block.text)
+
+
+def _extract_dict_block(block: dict, chunks: list[str]) -> None:
+    """Collect the text of a dict-style content block."""
+    text = block.get("text")
+    if isinstance(text, str) and text.strip():
+        chunks.append(text)
+
+
+# Text extractors keyed by SDK message / content block type. SDK types are
+# registered lazily by _load_message_handlers(); lookups for unlisted types
+# resolve through the MRO and are cached (None means "no text to collect").
+_MESSAGE_HANDLERS: dict[type, Callable | None] = {}
+_BLOCK_HANDLERS: dict[type, Callable | None] = {dict: _extract_dict_block}
+
+
+def _load_message_handlers() -> None:
+    """Register the SDK message and block types (requires claude_agent_sdk)."""
+    if _MESSAGE_HANDLERS:
+        return
+    from claude_agent_sdk import AssistantMessage, ResultMessage, UserMessage
+    from claude_agent_sdk.types import TextBlock
+
+    _MESSAGE_HANDLERS.update({
+        AssistantMessage: _extract_content,
+        UserMessage: _extract_content,
+        ResultMessage: _extract_result,
+    })
+    _BLOCK_HANDLERS[TextBlock] = _extract_text_block
+
+
+def _lookup_handler(handlers: dict[type, Callable | None], cls: type) -> Callable | None:
+    """Find the handler for a type, falling back to its base classes."""
+    try:
+        return handlers[cls]
+    except KeyError:
+        handler = next((handlers[base] for base in cls.__mro__[1:] if base in handlers), None)
+        handlers[cls] = handler
+        return handler
+
+
 async def label_scholar(
     scholar: dict,
     aminer_data: dict | None,
     enriched_data: dict | None,
-    labels_definition: dict,
-    project_root: Path
+    system_prompt: str,
+    project_root: Path,
+    echo: Callable[[str], None] = print
 ) -> dict:
     """
     Use Claude Agent SDK to label scholar data.
@@ -259,25 +493,30 @@ async def label_scholar(
         scholar: Scholar data from aaai-26-ai-talents.json
         aminer_data: AMiner cache data (if available)
         enriched_data: Enriched data (if available)
-        labels_definition: Labels definition
+        system_prompt: System prompt from build_system_prompt
         project_root: Project root directory path
+        echo: Output function for formatted agent messages
 
     Returns:
         Result dictionary with label judgments or error info
     """
     try:
-        from claude_agent_sdk import query, ClaudeAgentOptions
+        from claude_agent_sdk import (
+            query, ClaudeAgentOptions, CLIConnectionError, CLINotFoundError, ProcessError
+        )
     except ImportError:
         print("Error: claude_agent_sdk is not installed. Please install it with:")
         print("  pip install claude-agent-sdk")
         sys.exit(1)
 
-    # Build context and prompt
-    context = build_scholar_context(scholar, aminer_data, enriched_data, labels_definition)
-    scholar_json = json.dumps(context, indent=2, ensure_ascii=False)
-    prompt = build_prompt(scholar_json)
+    # Transient failures (CLI connection drops, non-zero CLI exits, timeouts) are retried;
+    # a missing CLI is permanent.
+    retryable = (CLIConnectionError, ProcessError, TimeoutError, ConnectionError)
+
+    prompt = build_scholar_prompt(scholar, aminer_data, enriched_data)
 
     options = ClaudeAgentOptions(
+        system_prompt=system_prompt,
         cwd=str(project_root),
         setting_sources=["project"],
         allowed_tools=["WebSearch", "WebFetch", "Read"],
@@ -287,39 +526,53 @@ async def label_scholar(
     # NOTE: The SDK may emit multiple message types (AssistantMessage, ResultMessage, etc.).
     # We collect all text blocks rather than overwriting `result_text`, and we ignore non-string
     # `result` payloads to avoid clobbering the extracted answer.
-    result_chunks: list[str] = []
+    _load_message_handlers()
     formatter = MessageFormatter(indent="    ")
 
-    try:
-        async for message in query(prompt=prompt, options=options):
-            # Format and print each message
-            formatter.print(message)
-
-            # Some SDK message types may expose a final string result
-            if hasattr(message, "result") and isinstance(message.result, str):
-                if message.result.strip():
-                    result_chunks.append(message.result)
-
-            # Assistant content is typically a sequence of blocks (often tuple, not always list)
-            if hasattr(message, "content"):
-                if isinstance(message.content, str):
-                    if message.content.strip():
-                        result_chunks.append(message.content)
-                elif isinstance(message.content, (list, tuple)):
-                    for block in message.content:
-                        # TextBlock objects
-                        if hasattr(block, "text") and isinstance(block.text, str):
-                            if block.text.strip():
-                                result_chunks.append(block.text)
-                        # Dict-style blocks
-                        elif isinstance(block, dict) and isinstance(block.get("text"), str):
-                            if block["text"].strip():
-                                result_chunks.append(block["text"])
-    except Exception as e:
-        return {"status": "error", "error": f"Agent execution failed: {str(e)}"}
-
-    result_text = "\n".join(result_chunks).strip()
-    return parse_agent_result(result_text)
+    for attempt in range(1, LABEL_MAX_ATTEMPTS + 1):
+        result_chunks: list[str] = []
+        labels_result = None
+        stream = query(prompt=prompt, options=options)
+        try:
+            async for message in stream:
+                # Format and print each message
+                echo(formatter.format(message))
+                new_from = len(result_chunks)
+                handler = _lookup_handler(_MESSAGE_HANDLERS, type(message))
+                if handler is not None:
+                    handler(message, result_chunks)
+
+                # Stop streaming as soon as a complete labels result has been emitted
+                for chunk in result_chunks[new_from:]:
+                    labels_result = find_labels_result(chunk)
+                    if labels_result is not None:
+                        break
+                if labels_result is not None:
+                    break
+            break
+        except CLINotFoundError as e:
+            return {"status": "error", "error": f"Agent execution failed: {str(e)}", "attempts": attempt}
+        except retryable as e:
+            if attempt == LABEL_MAX_ATTEMPTS:
+                return {"status": "error", "error": f"Agent execution failed: {str(e)}", "attempts": attempt}
+            delay = min(LABEL_RETRY_BASE_SECONDS * 2 ** (attempt - 1), LABEL_RETRY_MAX_SECONDS)
+            echo(f"       {Colors.YELLOW}Retrying{Colors.ENDC} in {delay}s "
+                 f"(attempt {attempt + 1}/{LABEL_MAX_ATTEMPTS}): {e}")
+            await asyncio.sleep(delay)
+        except Exception as e:
+            return {"status": "error", "error": f"Agent execution failed: {str(e)}", "attempts": attempt}
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    if labels_result is not None:
+        result = labels_result
+    else:
+        result_text = "\n".join(result_chunks).strip()
+        result = parse_agent_result(result_text)
+    result["attempts"] = attempt
+    return result
 
 
 def parse_agent_result(result_text: str) -> dict:
@@ -336,47 +589,46 @@ def parse_agent_result(result_text: str) -> dict:
         return {"status": "error", "error": "Empty response from agent"}
 
     # Try to find JSON in code blocks first
-    json_patterns = [
-        r'```json\s*\n?(.*?)\n?```',
-        r'```\s*\n?(.*?)\n?```',
-    ]
-
-    for pattern in json_patterns:
-        matches = re.findall(pattern, result_text, re.DOTALL)
-        for match in matches:
-            try:
-                json_str = match.strip()
-                if json_str.startswith('{'):
-                    result = json.loads(json_str)
-                    return result
-            except json.JSONDecodeError:
-                continue
-
-    # Try to find any JSON object in the text
-    try:
-        start_idx = result_text.find('{')
-        while start_idx != -1:
-            depth = 0
-            for i, char in enumerate(result_text[start_idx:], start_idx):
-                if char == '{':
-                    depth += 1
-                elif char == '}':
-                    depth -= 1
-                    if depth == 0:
-                        json_str = result_text[start_idx:i+1]
-                        try:
-                            result = json.loads(json_str)
-                            return result
-                        except json.JSONDecodeError:
-                            pass
-                        break
+    for pattern in (_JSON_BLOCK_RE, _ANY_BLOCK_RE):
+        for match in pattern.finditer(result_text):
+            json_str = match.group(1).strip()
+            if json_str.startswith('{'):
+                try:
+                    return json.loads(json_str)
+                except json.JSONDecodeError:
+                    continue
+
+    # Try to find any JSON object in the text: decode one value at each '{'
+    start_idx = result_text.find('{')
+    while start_idx != -1:
+        try:
+            result, _ = _JSON_DECODER.raw_decode(result_text, start_idx)
+            return result
+        except json.JSONDecodeError:
             start_idx = result_text.find('{', start_idx + 1)
-    except Exception:
-        pass
 
     return {"status": "error", "error": f"Could not parse agent response: {result_text[:500]}..."}
 
 
+def find_labels_result(text: str) -> dict | None:
+    """
+    Return the first JSON object in text that carries a "results" array.
+
+    Used on each streamed text block so labeling can stop as soon as the agent
+    has produced its answer.
+    """
+    start_idx = text.find('{')
+    while start_idx != -1:
+        try:
+            obj, _ = _JSON_DECODER.raw_decode(text, start_idx)
+        except json.JSONDecodeError:
+            obj = None
+        if isinstance(obj, dict) and isinstance(obj.get("results"), list):
+            return obj
+        start_idx = text.find('{', start_idx + 1)
+    return None
+
+
 def archive_file(file_path: Path) -> Path:
     """
     Archive an existing file by adding timestamp to filename.
@@ -395,6 +647,20 @@ def archive_file(file_path: Path) -> Path:
     return archive_path
 
 
+# Retry policy for transient agent failures
+LABEL_MAX_ATTEMPTS = 6
+LABEL_RETRY_BASE_SECONDS = 10
+LABEL_RETRY_MAX_SECONDS = 300
+
+# Message Batches API settings (--use-batch-api)
+BATCH_MODEL = "claude-sonnet-4-5"
+BATCH_MAX_TOKENS = 2048
+BATCH_POLL_INITIAL_SECONDS = 10
+BATCH_POLL_MAX_SECONDS = 300
+BATCH_SIZE = 20
+BATCH_FLUSH_MS = 1000
+
+
 class Colors:
     """ANSI color codes for terminal output."""
     GREEN = '\033[92m'
@@ -413,6 +679,11 @@ async def process_scholars(
     labels_definition: dict,
     mode: str = "skip",
     target_ids: list[str] | None = None,
+    max_concurrency: int = 5,
+    use_batch_api: bool = False,
+    batch_model: str = BATCH_MODEL,
+    batch_size: int = BATCH_SIZE,
+    batch_flush_ms: int = BATCH_FLUSH_MS,
 ) -> dict:
     """
     Process all enriched scholars and label them.
@@ -424,6 +695,11 @@ async def process_scholars(
         labels_definition: Labels definition
         mode: Processing mode - "skip" or "overwrite"
         target_ids: Optional list of specific AMiner IDs to process
+        max_concurrency: Maximum number of scholars labeled concurrently
+        use_batch_api: Label scholars with rich local data via the Message Batches API
+        batch_model: Model used for batch requests
+        batch_size: Maximum number of requests per submitted batch
+        batch_flush_ms: Submit a partial batch after waiting this long for more scholars
 
     Returns:
         Statistics dictionary with processing results
@@ -438,23 +714,28 @@ async def process_scholars(
     scholars = get_validated_scholars(data)
     print(f"Found {len(scholars)} scholars with usable AMiner IDs")
 
-    # Filter to only those with enriched data
-    enriched_scholars = []
+    # List both data directories once instead of stat-ing files per scholar
+    enriched_ids = list_json_ids(enriched_dir)
+    aminer_ids = list_json_ids(aminer_dir)
+
+    # Keep scholars with enriched data (and matching target IDs, if given) in one pass
+    target_set = frozenset(target_ids) if target_ids else None
+    enriched_count = 0
+    selected = []
     for scholar in scholars:
         aminer_id = scholar.get("aminer_id")
-        enriched_file = enriched_dir / f"{aminer_id}.json"
-        if enriched_file.exists():
-            enriched_scholars.append(scholar)
-
-    print(f"Found {len(enriched_scholars)} scholars with enriched data")
-    scholars = enriched_scholars
-
-    # Filter by target IDs if specified
-    if target_ids:
-        scholars = [s for s in scholars if s.get("aminer_id") in target_ids]
+        if aminer_id in enriched_ids:
+            enriched_count += 1
+            if target_set is None or aminer_id in target_set:
+                selected.append(scholar)
+    scholars = selected
+
+    print(f"Found {enriched_count} scholars with enriched data")
+    if target_set is not None:
         print(f"Filtered to {len(scholars)} scholars matching target IDs")
 
-    # Sort by citation count (high to low), so we prioritize high-impact scholars first
+    # Sort by citation count (high to low), so we prioritize high-impact scholars first.
+    # list.sort computes each key once and is stable, so ties keep their file order.
     scholars.sort(key=get_citation_count, reverse=True)
 
     # Track statistics
@@ -467,70 +748,92 @@ async def process_scholars(
         "empty": 0,
         "failed": 0,
         "errors": [],  # List of (aminer_id, name, error_message)
+        "attempts": {},  # aminer_id -> agent attempts, for scholars that needed retries
         "label_names": label_names,
     }
+    expected_labels = frozenset(label_names)
+    # Built once so every agent and batch request shares an identical system prompt
+    system_prompt = build_system_prompt(labels_definition)
+
+    async def label_one(
+        idx: int,
+        scholar: dict,
+        out: Callable[[str], None],
+        batch_result: dict | None = None
+    ) -> None:
+        """
+        Label a single scholar, writing progress lines through `out`.
 
-    for idx, scholar in enumerate(scholars, 1):
+        If `batch_result` is given (from the Message Batches API), it is used
+        instead of running the agent.
+        """
         name = scholar.get("name", "Unknown")
         aminer_id = scholar.get("aminer_id")
         enriched_file = enriched_dir / f"{aminer_id}.json"
         aminer_file = aminer_dir / f"{aminer_id}.json"
 
         # Load existing enriched data
-        enriched_data = load_json_file(enriched_file)
+        enriched_data = await _aload(enriched_file)
 
         # Check if labels already exist
         if enriched_data.get("labels"):
             if mode == "skip":
-                print(f"[{idx}/{stats['total']}] {Colors.DIM}Skipping{Colors.ENDC} {name} ({aminer_id}) - labels already exist")
+                out(f"[{idx}/{stats['total']}] {Colors.DIM}Skipping{Colors.ENDC} {name} ({aminer_id}) - labels already exist")
                 stats["skipped"] += 1
-                continue
+                return
             else:
                 # Archive will be done when saving
-                print(f"[{idx}/{stats['total']}] Labels exist, will overwrite (archiving)")
+                out(f"[{idx}/{stats['total']}] Labels exist, will overwrite (archiving)")
 
-        print(f"[{idx}/{stats['total']}] {Colors.CYAN}Labeling{Colors.ENDC} {name} ({aminer_id})")
+        out(f"[{idx}/{stats['total']}] {Colors.CYAN}Labeling{Colors.ENDC} {name} ({aminer_id})")
 
         # Load AMiner cache if available
         aminer_data = None
-        if aminer_file.exists():
+        if aminer_id in aminer_ids:
             try:
-                aminer_data = load_json_file(aminer_file)
-                print(f"       Loaded AMiner cache")
+                aminer_data = await _aload(aminer_file)
+                out(f"       Loaded AMiner cache")
             except Exception as e:
-                print(f"       {Colors.YELLOW}Warning{Colors.ENDC}: Failed to load AMiner cache: {e}")
+                out(f"       {Colors.YELLOW}Warning{Colors.ENDC}: Failed to load AMiner cache: {e}")
 
         # Call Agent to label data
-        result = await label_scholar(scholar, aminer_data, enriched_data, labels_definition, project_root)
+        if batch_result is not None:
+            out(f"       Using Message Batches API result")
+            result = batch_result
+        else:
+            result = await label_scholar(
+                scholar, aminer_data, enriched_data, system_prompt, project_root, echo=out
+            )
+
+        if result.get("attempts", 1) > 1:
+            stats["attempts"][aminer_id] = result["attempts"]
 
         # Check result
         if result.get("status") == "error":
             error_msg = result.get("error", "Unknown error")
-            print(f"       {Colors.RED}[ERROR]{Colors.ENDC} {error_msg}")
+            out(f"       {Colors.RED}[ERROR]{Colors.ENDC} {error_msg}")
             stats["failed"] += 1
             stats["errors"].append((aminer_id, name, error_msg))
-            continue
+            return
 
         # Validate result structure
         if "results" not in result or not isinstance(result["results"], list):
             error_msg = "Invalid result structure: missing 'results' array"
-            print(f"       {Colors.RED}[ERROR]{Colors.ENDC} {error_msg}")
+            out(f"       {Colors.RED}[ERROR]{Colors.ENDC} {error_msg}")
             stats["failed"] += 1
             stats["errors"].append((aminer_id, name, error_msg))
-            continue
+            return
 
         # Check if all labels were judged
-        judged_labels = {r["name"] for r in result["results"]}
-        expected_labels = set(label_names)
-        if judged_labels != expected_labels:
-            missing = expected_labels - judged_labels
+        missing = expected_labels.difference(r["name"] for r in result["results"])
+        if missing:
             error_msg = f"Missing labels in result: {missing}"
-            print(f"       {Colors.YELLOW}[WARNING]{Colors.ENDC} {error_msg}")
+            out(f"       {Colors.YELLOW}[WARNING]{Colors.ENDC} {error_msg}")
 
         # Archive if overwriting
         if enriched_data.get("labels") and mode == "overwrite":
-            archive_path = archive_file(enriched_file)
-            print(f"       Archived to: {archive_path.name}")
+            archive_path = await asyncio.to_thread(archive_file, enriched_file)
+            out(f"       Archived to: {archive_path.name}")
 
         # Update labels field
         enriched_data["labels"] = {
@@ -539,12 +842,127 @@ async def process_scholars(
         }
 
         # Save updated enriched data
-        save_json_file(enriched_file, enriched_data)
+        await _asave(enriched_file, enriched_data)
         label_count = len(result["results"])
-        print(f"       {Colors.GREEN}[SUCCESS]{Colors.ENDC} Labeled {label_count} fields, saved to: {enriched_file.name}")
+        out(f"       {Colors.GREEN}[SUCCESS]{Colors.ENDC} Labeled {label_count} fields, saved to: {enriched_file.name}")
         stats["success"] += 1
         stats["processed"] += 1
 
+    # Workers run on one event loop, so stats updates between awaits need no lock.
+    # With concurrency, each scholar's output is buffered and printed as one block.
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def worker(idx: int, scholar: dict) -> None:
+        async with semaphore:
+            lines: list[str] = []
+            out = print if max_concurrency == 1 else lines.append
+            try:
+                await label_one(idx, scholar, out)
+            finally:
+                if lines:
+                    print("\n".join(lines))
+
+    async def label_via_batch(items: list[tuple[int, dict]]) -> None:
+        """
+        Label batch-eligible scholars via the batch API and the rest via the agent.
+
+        Eligible scholars are queued and submitted as rolling mini-batches of
+        up to `batch_size` requests (or whatever is queued after
+        `batch_flush_ms`), so early batches finish while later ones are built.
+        Other scholars start on the agent workers right away, and failed batch
+        requests are handed to the same workers as their batches resolve.
+        """
+        agent_tasks = []
+        pending = {}
+        futures: dict[str, asyncio.Future] = {}
+        queue: asyncio.Queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
+
+        async def submit(chunk: list[tuple[str, str]]) -> None:
+            try:
+                results = await label_scholars_batch(
+                    dict(chunk), system_prompt, batch_model
+                )
+            except Exception as e:
+                print(f"{Colors.YELLOW}Warning{Colors.ENDC}: Batch submission failed: {e}")
+                results = {}
+            for aminer_id, _ in chunk:
+                futures[aminer_id].set_result(results.get(aminer_id))
+
+        async def batcher() -> None:
+            submissions = []
+            done = False
+            while not done:
+                item = await queue.get()
+                if item is None:
+                    break
+                chunk = [item]
+                deadline = loop.time() + batch_flush_ms / 1000
+                while len(chunk) < batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if item is None:
+                        done = True
+                        break
+                    chunk.append(item)
+                submissions.append(asyncio.create_task(submit(chunk)))
+            await asyncio.gather(*submissions)
+
+        async def resolve(idx: int, scholar: dict) -> None:
+            result = await futures[scholar.get("aminer_id")]
+            if result is not None:
+                lines: list[str] = []
+                try:
+                    await label_one(idx, scholar, lines.append, batch_result=result)
+                finally:
+                    print("\n".join(lines))
+            else:
+                # Batch request failed; fall back to the agent
+                await worker(idx, scholar)
+
+        batcher_task = asyncio.create_task(batcher())
+        for idx, scholar in items:
+            aminer_id = scholar.get("aminer_id")
+            enriched_data = await _aload(enriched_dir / f"{aminer_id}.json")
+            if (enriched_data.get("labels") and mode == "skip") or aminer_id in pending:
+                agent_tasks.append(asyncio.create_task(worker(idx, scholar)))
+                continue
+
+            aminer_data = None
+            aminer_file = aminer_dir / f"{aminer_id}.json"
+            if aminer_id in aminer_ids:
+                try:
+                    aminer_data = await _aload(aminer_file)
+                except Exception:
+                    pass
+
+            if not is_batch_eligible(aminer_data, enriched_data):
+                agent_tasks.append(asyncio.create_task(worker(idx, scholar)))
+                continue
+
+            pending[aminer_id] = (idx, scholar)
+            futures[aminer_id] = loop.create_future()
+            queue.put_nowait((aminer_id, build_scholar_prompt(scholar, aminer_data, enriched_data)))
+        queue.put_nowait(None)
+
+        print(f"Batch-eligible scholars: {len(pending)}, agent scholars: {len(agent_tasks)}")
+        await asyncio.gather(
+            batcher_task,
+            *agent_tasks,
+            *(resolve(idx, scholar) for idx, scholar in pending.values()),
+        )
+
+    items = list(enumerate(scholars, 1))
+    if use_batch_api:
+        await label_via_batch(items)
+    else:
+        await asyncio.gather(*(worker(idx, scholar) for idx, scholar in items))
+
     return stats
 
 
@@ -560,6 +978,9 @@ def print_summary(stats: dict) -> None:
     print(f"  - Success:        {Colors.GREEN}{stats['success']}{Colors.ENDC}")
     print(f"  - Empty:          {Colors.YELLOW}{stats['empty']}{Colors.ENDC}")
     print(f"  - Failed:         {Colors.RED}{stats['failed']}{Colors.ENDC}")
+    if stats["attempts"]:
+        print(f"Retried:            {len(stats['attempts'])} scholars "
+              f"({sum(stats['attempts'].values()) - len(stats['attempts'])} retries)")
 
     if stats["errors"]:
         print(f"\n{Colors.RED}Errors:{Colors.ENDC}")
@@ -568,6 +989,14 @@ def print_summary(stats: dict) -> None:
 
 
 def main():
+    # Optional: run on uvloop's faster event loop when installed (not available on Windows)
+    run = asyncio.run
+    try:
+        import uvloop
+        run = getattr(uvloop, "run", asyncio.run)
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(
         description="Label scholar data using Claude Agent SDK",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -587,6 +1016,15 @@ Examples:
 
     # Custom directories
     python label_scholar_data.py --labels-file config/labels.json --enriched-dir ./enriched
+
+    # Label up to 10 scholars at a time
+    python label_scholar_data.py --labels-file config/labels.json --max-concurrency 10
+
+    # Label scholars with rich AMiner/enriched data via the Message Batches API
+    python label_scholar_data.py --labels-file config/labels.json --use-batch-api
+
+    # Submit batches of up to 50 requests
+    python label_scholar_data.py --labels-file config/labels.json --use-batch-api --batch-size 50
         """
     )
 
@@ -647,8 +1085,59 @@ Examples:
         help="File containing AMiner IDs to process (one per line)"
     )
 
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=5,
+        help="Maximum number of scholars labeled concurrently (default: 5)"
+    )
+
+    parser.add_argument(
+        "--use-batch-api",
+        action="store_true",
+        help="Label scholars with rich local data via the Anthropic Message Batches API "
+             "(no web tools, lower cost); others still use the agent"
+    )
+
+    parser.add_argument(
+        "--batch-model",
+        type=str,
+        default=BATCH_MODEL,
+        help=f"Model for --use-batch-api requests (default: {BATCH_MODEL})"
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=BATCH_SIZE,
+        help=f"Maximum requests per submitted batch with --use-batch-api (default: {BATCH_SIZE})"
+    )
+
+    parser.add_argument(
+        "--batch-flush-ms",
+        type=int,
+        default=BATCH_FLUSH_MS,
+        help=f"Submit a partial batch after this many milliseconds (default: {BATCH_FLUSH_MS})"
+    )
+
     args = parser.parse_args()
 
+    if args.max_concurrency < 1:
+        print("Error: --max-concurrency must be at least 1")
+        sys.exit(1)
+
+    if args.batch_size < 1:
+        print("Error: --batch-size must be at least 1")
+        sys.exit(1)
+
+    if args.use_batch_api:
+        try:
+            import anthropic  # noqa: F401
+        except ImportError:
+            print("Error: anthropic is not installed. Please install it with:")
+            print("  pip install anthropic")
+            sys.exit(1)
+
     # Load labels definition
     labels_file = Path(args.labels_file).resolve() if args.labels_file else None
     labels_definition = load_labels_definition(labels_file, args.labels_json)
@@ -714,18 +1203,27 @@ Examples:
     print(f"AMiner cache directory: {aminer_dir}")
     print(f"Enriched data directory: {enriched_dir}")
     print(f"Mode: {args.mode}")
+    print(f"Max concurrency: {args.max_concurrency}")
+    if args.use_batch_api:
+        print(f"Message Batches API: enabled ({args.batch_model}, "
+              f"batches of up to {args.batch_size}, flush after {args.batch_flush_ms} ms)")
     if target_ids:
         print(f"Target IDs: {len(target_ids)} specified")
     print()
 
     # Process scholars
-    stats = asyncio.run(process_scholars(
+    stats = run(process_scholars(
         json_file_path=json_file_path,
         aminer_dir=aminer_dir,
         enriched_dir=enriched_dir,
         labels_definition=labels_definition,
         mode=args.mode,
         target_ids=target_ids,
+        max_concurrency=args.max_concurrency,
+        use_batch_api=args.use_batch_api,
+        batch_model=args.batch_model,
+        batch_size=args.batch_size,
+        batch_flush_ms=args.batch_flush_ms,
     ))
 
     # Print summary
@@ -21,161 +21,233 @@ Example:
     # Run only specific steps
     python build_pipeline.py ../../data/aaai-26 --steps merge enrich-papers
 
+    # Rerun every step, even those whose inputs and outputs are unchanged since their last success
+    python build_pipeline.py ../../data/aaai-26 --no-resume
+
+    # Look up 8 papers concurrently during paper enrichment
+    python build_pipeline.py ../../data/aaai-26 --paper-concurrency 8
+
     # With AMiner credentials
     export AMINER_AUTH="Bearer xxx"
     export AMINER_SIGNATURE="xxx"
     export AMINER_TIMESTAMP="xxx"
     python build_pipeline.py ../../data/aaai-26
+
+    # Fail immediately instead of skipping enrich-authors without credentials
+    python build_pipeline.py ../../data/aaai-26 --strict-credentials
 """
 
 import argparse
+import hashlib
+import importlib
+import json
 import os
-import subprocess
+import signal
 import sys
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
+from typing import Callable
+
+try:
+    import resource
+except ImportError:  # Not available on Windows; profiles then omit CPU time and peak RSS
+    resource = None
 
-# Add parent directory to path for common_utils
+try:
+    import xxhash
+except ImportError:  # Optional: faster checkpoint hashing
+    xxhash = None
+
+# Add parent directory to path for common_utils, and this directory for the step scripts
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
 from common_utils import Colors
 
 
+@dataclass(slots=True, frozen=True)
+class PipelineStep:
+    """A pipeline step and the data it needs and produces."""
+    id: str
+    name: str
+    script: str
+    description: str
+    requires: tuple[str, ...]
+    produces: tuple[str, ...]
+    depends_on: tuple[str, ...] = ()
+
+
 # Pipeline steps definition
-PIPELINE_STEPS = [
-    {
-        "id": "merge",
-        "name": "Merge Tracks",
-        "script": "merge_tracks.py",
-        "description": "Merge track JSON files into papers.json",
-        "requires": ["program directory with track JSON files"],
-        "produces": ["papers.json"]
-    },
-    {
-        "id": "enrich-papers",
-        "name": "Enrich Papers",
-        "script": "enrich_papers_aminer.py",
-        "description": "Enrich papers with AMiner data",
-        "requires": ["papers.json"],
-        "produces": ["papers.json (updated)", "aminer/papers/*.json"]
-    },
-    {
-        "id": "enrich-authors",
-        "name": "Enrich Authors",
-        "script": "enrich_authors_aminer.py",
-        "description": "Extract authors and enrich with AMiner data",
-        "requires": ["papers.json", "AMiner API credentials"],
-        "produces": ["authors.json", "aminer/authors/*.json"]
-    },
-    {
-        "id": "generate-indexes",
-        "name": "Generate Indexes",
-        "script": "generate_indexes.py",
-        "description": "Generate index files for frontend",
-        "requires": ["papers.json", "authors.json"],
-        "produces": ["indexes/*.json"]
-    }
-]
+PIPELINE_STEPS = (
+    PipelineStep(
+        id="merge",
+        name="Merge Tracks",
+        script="merge_tracks.py",
+        description="Merge track JSON files into papers.json",
+        requires=("program directory with track JSON files",),
+        produces=("papers.json",)
+    ),
+    PipelineStep(
+        id="enrich-papers",
+        name="Enrich Papers",
+        script="enrich_papers_aminer.py",
+        description="Enrich papers with AMiner data",
+        requires=("papers.json",),
+        produces=("papers.json (updated)", "aminer/papers/*.json"),
+        depends_on=("merge",)
+    ),
+    PipelineStep(
+        id="enrich-authors",
+        name="Enrich Authors",
+        script="enrich_authors_aminer.py",
+        description="Extract authors and enrich with AMiner data",
+        requires=("papers.json", "AMiner API credentials"),
+        produces=("authors.json", "aminer/authors/*.json"),
+        # Reads aminer_paper_id and the cached paper details written by enrich-papers
+        depends_on=("enrich-papers",)
+    ),
+    PipelineStep(
+        id="generate-indexes",
+        name="Generate Indexes",
+        script="generate_indexes.py",
+        description="Generate index files for frontend",
+        requires=("papers.json", "authors.json"),
+        produces=("indexes/*.json",),
+        depends_on=("merge", "enrich-authors")
+    )
+)
+
+STEP_MAP = {step.id: step for step in PIPELINE_STEPS}
+ALL_STEP_IDS = tuple(step.id for step in PIPELINE_STEPS)
+
+# Horizontal rule for headers and summaries
+_HR = "=" * 70
+
+# Per-step completion checkpoints, relative to the conference directory
+PIPELINE_STATE_FILE = ".pipeline_state.json"
 
+# Result of a step that ran to completion but reported failed items; it is not
+# checkpointed, so the next run retries them
+STEP_INCOMPLETE = "incomplete"
 
-def print_step_header(step_num: int, total_steps: int, step: dict):
+
+def print_step_header(step_num: int, total_steps: int, step: PipelineStep):
     """Print step header."""
-    print("\n" + "=" * 70)
-    print(f"{Colors.BOLD}Step {step_num}/{total_steps}: {step['name']}{Colors.ENDC}")
-    print("=" * 70)
-    print(f"{Colors.DIM}{step['description']}{Colors.ENDC}")
+    print("\n" + _HR)
+    print(f"{Colors.BOLD}Step {step_num}/{total_steps}: {step.name}{Colors.ENDC}")
+    print(_HR)
+    print(f"{Colors.DIM}{step.description}{Colors.ENDC}")
     print()
 
 
-def run_merge_tracks(conference_dir: Path, program_dir: Path) -> bool:
-    """Run merge_tracks.py script."""
-    script_path = Path(__file__).parent / "merge_tracks.py"
-    papers_json = conference_dir / "papers.json"
-
-    cmd = [
-        sys.executable,
-        str(script_path),
-        str(program_dir),
-        "-o", str(papers_json)
-    ]
+def run_script_main(script: str, argv: list[str]) -> bool | str:
+    """
+    Run a pipeline script's main() in this process.
 
-    print(f"{Colors.CYAN}Running: {' '.join(cmd)}{Colors.ENDC}\n")
+    Avoids a fresh interpreter (and re-imports) per step. The script's exit
+    status is taken from SystemExit, so failures are reported as before.
+    Scripts that process items return their stats from main(); if any items
+    failed, STEP_INCOMPLETE is returned instead of True.
+    """
+    print(f"{Colors.CYAN}Running: {script} {' '.join(argv)}{Colors.ENDC}\n")
 
+    result = None
     try:
-        result = subprocess.run(cmd, check=True)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"\n{Colors.RED}Error: merge_tracks.py failed with exit code {e.returncode}{Colors.ENDC}")
+        module = importlib.import_module(Path(script).stem)
+        result = module.main(argv)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            print(f"\n{Colors.RED}Error: {script} failed with exit code {e.code}{Colors.ENDC}")
+            return False
+    except Exception as e:
+        print(f"\n{Colors.RED}Error: {script} failed: {e}{Colors.ENDC}")
         return False
 
+    if isinstance(result, dict) and result.get("failed"):
+        print(f"\n{Colors.YELLOW}Warning: {script} finished with {result['failed']} failed items; "
+              f"they will be retried on the next run{Colors.ENDC}")
+        return STEP_INCOMPLETE
+    return True
 
-def run_enrich_papers(conference_dir: Path, force: bool = False, delay: float = 1.0) -> bool:
-    """Run enrich_papers_aminer.py script."""
-    script_path = Path(__file__).parent / "enrich_papers_aminer.py"
-    papers_json = conference_dir / "papers.json"
 
-    cmd = [
-        sys.executable,
-        str(script_path),
-        str(papers_json),
-        "--delay", str(delay)
-    ]
+def preload_step_modules(steps_to_run: list[str]) -> threading.Thread:
+    """
+    Import the selected step scripts in a background thread.
 
-    if force:
-        cmd.append("--force")
+    Later steps' imports (requests, shared utilities) then overlap with the
+    work of earlier steps. Import errors are ignored here; they are reported
+    when the step itself runs.
+    """
+    modules = [Path(STEP_MAP[step_id].script).stem for step_id in steps_to_run]
 
-    print(f"{Colors.CYAN}Running: {' '.join(cmd)}{Colors.ENDC}\n")
+    def preload():
+        for module in modules:
+            try:
+                importlib.import_module(module)
+            except Exception:
+                pass
 
-    try:
-        result = subprocess.run(cmd, check=True)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"\n{Colors.RED}Error: enrich_papers_aminer.py failed with exit code {e.returncode}{Colors.ENDC}")
-        return False
+    thread = threading.Thread(target=preload, name="preload-steps", daemon=True)
+    thread.start()
+    return thread
 
 
-def run_enrich_authors(conference_dir: Path, force: bool = False, delay: float = 2.0) -> bool:
-    """Run enrich_authors_aminer.py script."""
-    script_path = Path(__file__).parent / "enrich_authors_aminer.py"
+def run_merge_tracks(conference_dir: Path, program_dir: Path) -> bool:
+    """Run merge_tracks.py script."""
     papers_json = conference_dir / "papers.json"
+    return run_script_main("merge_tracks.py", [str(program_dir), "-o", str(papers_json)])
 
-    cmd = [
-        sys.executable,
-        str(script_path),
-        str(papers_json),
-        "--delay", str(delay)
-    ]
 
+def run_enrich_papers(
+    conference_dir: Path,
+    force: bool = False,
+    delay: float = 1.0,
+    concurrency: int = 1,
+    use_cache: bool = True,
+    adaptive_rate: bool = False
+) -> bool | str:
+    """Run enrich_papers_aminer.py script."""
+    papers_json = conference_dir / "papers.json"
+
+    argv = [str(papers_json), "--delay", str(delay), "--concurrency", str(concurrency)]
     if force:
-        cmd.append("--force")
+        argv.append("--force")
+    if not use_cache:
+        argv.append("--no-cache")
+    if adaptive_rate:
+        argv.append("--adaptive-rate")
 
-    print(f"{Colors.CYAN}Running: {' '.join(cmd)}{Colors.ENDC}\n")
+    return run_script_main("enrich_papers_aminer.py", argv)
 
-    try:
-        result = subprocess.run(cmd, check=True)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"\n{Colors.RED}Error: enrich_authors_aminer.py failed with exit code {e.returncode}{Colors.ENDC}")
-        return False
 
+def run_enrich_authors(
+    conference_dir: Path,
+    force: bool = False,
+    delay: float = 2.0,
+    concurrency: int = 1
+) -> bool | str | None:
+    """Run enrich_authors_aminer.py script. Returns None if skipped for missing credentials."""
+    if not check_aminer_credentials():
+        print(f"{Colors.YELLOW}Warning: AMiner credentials not found{Colors.ENDC}")
+        print(f"{Colors.YELLOW}Please set AMINER_AUTH, AMINER_SIGNATURE, and AMINER_TIMESTAMP environment variables{Colors.ENDC}")
+        print(f"{Colors.RED}Skipping author enrichment{Colors.ENDC}")
+        return None
 
-def run_generate_indexes(conference_dir: Path) -> bool:
-    """Run generate_indexes.py script."""
-    script_path = Path(__file__).parent / "generate_indexes.py"
+    papers_json = conference_dir / "papers.json"
 
-    cmd = [
-        sys.executable,
-        str(script_path),
-        str(conference_dir)
-    ]
+    argv = [str(papers_json), "--delay", str(delay), "--concurrency", str(concurrency)]
+    if force:
+        argv.append("--force")
 
-    print(f"{Colors.CYAN}Running: {' '.join(cmd)}{Colors.ENDC}\n")
+    return run_script_main("enrich_authors_aminer.py", argv)
 
-    try:
-        result = subprocess.run(cmd, check=True)
-        return result.returncode == 0
-    except subprocess.CalledProcessError as e:
-        print(f"\n{Colors.RED}Error: generate_indexes.py failed with exit code {e.returncode}{Colors.ENDC}")
-        return False
+
+def run_generate_indexes(conference_dir: Path, jobs: int = 1) -> bool:
+    """Run generate_indexes.py script."""
+    return run_script_main("generate_indexes.py", [str(conference_dir), "--jobs", str(jobs)])
 
 
 def check_aminer_credentials() -> bool:
@@ -187,17 +259,212 @@ def check_aminer_credentials() -> bool:
     return bool(auth and sig and ts)
 
 
+def aminer_credentials_problem() -> str | None:
+    """
+    Describe what is wrong with the AMiner credentials, or None if they look usable.
+
+    Only the presence of the variables and the form of AMINER_AUTH are checked;
+    whether the API accepts them is found out by enrich-authors itself.
+    """
+    if not check_aminer_credentials():
+        return "AMINER_AUTH, AMINER_SIGNATURE and AMINER_TIMESTAMP must all be set"
+    if not os.environ["AMINER_AUTH"].strip().startswith("Bearer "):
+        return 'AMINER_AUTH should have the form "Bearer <token>"'
+    return None
+
+
+def pipeline_levels(steps_to_run: list[str]) -> list[list[str]]:
+    """
+    Group the selected steps into levels in dependency order.
+
+    Uses Kahn's algorithm over the transitive closure of `depends_on`, restricted
+    to the steps in this run: a step waits for every selected step it depends
+    on, also through steps that are left out (e.g. enrich-authors still waits
+    for merge, via enrich-papers). Within a level, steps keep their pipeline order.
+    """
+    selected = set(steps_to_run)
+    order = [step.id for step in PIPELINE_STEPS if step.id in selected]
+
+    # PIPELINE_STEPS is in dependency order, so each step's ancestors are known before it
+    ancestors: dict[str, set[str]] = {}
+    for step in PIPELINE_STEPS:
+        ancestors[step.id] = set(step.depends_on).union(*(ancestors[dep] for dep in step.depends_on))
+    deps = {step_id: ancestors[step_id] & selected for step_id in order}
+
+    levels = []
+    done = set()
+    while len(done) < len(order):
+        level = [step_id for step_id in order if step_id not in done and deps[step_id] <= done]
+        levels.append(level)
+        done.update(level)
+    return levels
+
+
+def build_step_runners(
+    conference_dir: Path,
+    program_dir: Path,
+    force: bool,
+    paper_delay: float,
+    author_delay: float,
+    paper_concurrency: int = 1,
+    use_cache: bool = True,
+    index_jobs: int = 1,
+    adaptive_rate: bool = False,
+    author_concurrency: int = 1
+) -> dict[str, Callable[[], bool | str | None]]:
+    """
+    Bind each pipeline step to its arguments.
+
+    Returns a dispatch table mapping step ID to a no-argument callable that
+    runs the step and returns its result (None if the step was skipped).
+    """
+    return {
+        "merge": partial(run_merge_tracks, conference_dir, program_dir),
+        "enrich-papers": partial(
+            run_enrich_papers, conference_dir, force, paper_delay, paper_concurrency, use_cache, adaptive_rate
+        ),
+        "enrich-authors": partial(run_enrich_authors, conference_dir, force, author_delay, author_concurrency),
+        "generate-indexes": partial(run_generate_indexes, conference_dir, index_jobs),
+    }
+
+
+def step_input_files(step_id: str, conference_dir: Path, program_dir: Path) -> list[Path]:
+    """Files a step reads; a step whose inputs are unchanged since its last success can be skipped."""
+    if step_id == "merge":
+        return sorted(program_dir.glob("*.json"))
+    if step_id == "generate-indexes":
+        return [conference_dir / "papers.json", conference_dir / "authors.json"]
+    return [conference_dir / "papers.json"]
+
+
+def step_output_files(step_id: str, conference_dir: Path) -> list[Path]:
+    """Files a step writes in the conference directory; a changed or missing output invalidates its checkpoint."""
+    if step_id == "enrich-authors":
+        return [conference_dir / "authors.json"]
+    if step_id == "generate-indexes":
+        return sorted((conference_dir / "indexes").glob("*.json"))
+    return [conference_dir / "papers.json"]
+
+
+def hash_files(paths: list[Path]) -> str:
+    """
+    Hash the names and contents of the given files (missing files included as such).
+
+    Uses xxh3 when xxhash is installed and BLAKE2b otherwise. Checkpoints never
+    leave this machine, so a non-cryptographic hash is enough; the result is
+    prefixed with the algorithm so checkpoints from the other one never match.
+    """
+    if xxhash is not None:
+        algorithm, digest = "xxh3_64", xxhash.xxh3_64()
+    else:
+        algorithm, digest = "blake2b", hashlib.blake2b(digest_size=16)
+
+    for path in paths:
+        digest.update(path.name.encode("utf-8") + b"\0")
+        if not path.exists():
+            digest.update(b"missing\0")
+            continue
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return f"{algorithm}:{digest.hexdigest()}"
+
+
+def load_pipeline_state(conference_dir: Path) -> dict:
+    """Load the step checkpoints written by earlier runs (empty if none or unreadable)."""
+    state_path = conference_dir / PIPELINE_STATE_FILE
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_pipeline_state(conference_dir: Path, state: dict) -> None:
+    """Save the step checkpoints, replacing the file atomically."""
+    state_path = conference_dir / PIPELINE_STATE_FILE
+    tmp_path = state_path.with_name(state_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp_path, state_path)
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process so far, in MB."""
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def profile_step(step_id: str, runner: Callable[[], bool | str | None]) -> tuple[bool | str | None, dict]:
+    """
+    Run one pipeline step (see build_step_runners) and measure it.
+
+    Returns the step result and a profile with wall time, CPU time and the
+    process peak RSS after the step. Steps run in this process, so peak RSS is
+    the process-wide high-water mark so far, not just this step's.
+    """
+    usage_before = resource.getrusage(resource.RUSAGE_SELF) if resource else None
+    t0 = time.perf_counter()
+
+    result = runner()
+
+    profile = {
+        "step": step_id,
+        "status": (
+            "skipped" if result is None else
+            STEP_INCOMPLETE if result == STEP_INCOMPLETE else
+            "ok" if result else "failed"
+        ),
+        "wall": round(time.perf_counter() - t0, 3)
+    }
+    if usage_before is not None:
+        usage_after = resource.getrusage(resource.RUSAGE_SELF)
+        profile["cpu_user"] = round(usage_after.ru_utime - usage_before.ru_utime, 3)
+        profile["cpu_sys"] = round(usage_after.ru_stime - usage_before.ru_stime, 3)
+        profile["peak_rss_mb"] = round(peak_rss_mb(), 1)
+    return result, profile
+
+
+def save_profile(conference_dir: Path, per_step: list[dict], start_time: datetime) -> Path:
+    """Append this run's step profiles to <conference_dir>/pipeline_profile.jsonl."""
+    profile_path = conference_dir / "pipeline_profile.jsonl"
+    run_at = start_time.isoformat(timespec="seconds")
+    with open(profile_path, "a", encoding="utf-8") as f:
+        for profile in per_step:
+            f.write(json.dumps({"run_at": run_at, **profile}, ensure_ascii=False) + "\n")
+    return profile_path
+
+
 def run_pipeline(
     conference_dir: Path,
     program_dir: Path,
     steps_to_run: list[str],
     force: bool = False,
     paper_delay: float = 1.0,
-    author_delay: float = 2.0
+    author_delay: float = 2.0,
+    paper_concurrency: int = 1,
+    use_cache: bool = True,
+    index_jobs: int = 1,
+    resume: bool = False,
+    adaptive_rate: bool = False,
+    author_concurrency: int = 1
 ) -> dict:
     """
     Run the pipeline.
 
+    Steps are run one at a time, in dependency order (see pipeline_levels).
+
+    After each successful step, a checkpoint with the hashes of its input and
+    output files (as left by the step) is saved to PIPELINE_STATE_FILE. With
+    `resume`, a step whose inputs and outputs still match its checkpoint is
+    skipped. Steps that report failed items (STEP_INCOMPLETE) count as
+    completed but are not checkpointed, so the next run retries them.
+
     Args:
         conference_dir: Conference directory
         program_dir: Program directory with track JSON files
@@ -205,44 +472,90 @@ def run_pipeline(
         force: Force re-processing
         paper_delay: Delay for paper enrichment
         author_delay: Delay for author enrichment
+        paper_concurrency: Papers looked up concurrently during paper enrichment
+        use_cache: Reuse cached AMiner title search results during paper enrichment
+        index_jobs: Worker processes used by generate-indexes
+        resume: Skip steps whose inputs and outputs are unchanged since their last success
+        adaptive_rate: Let paper enrichment tune its delay from API responses
+        author_concurrency: Authors fetched concurrently during author enrichment
 
     Returns:
-        Statistics dictionary
+        Statistics dictionary (with per-step profiles in "per_step"). On
+        KeyboardInterrupt the pipeline stops, the step that was running is
+        recorded as "interrupted" and stats["interrupted"] is set.
     """
     stats = {
         "total_steps": len(steps_to_run),
         "completed": 0,
+        "incomplete": 0,
         "failed": 0,
-        "skipped": 0
+        "skipped": 0,
+        "interrupted": False,
+        "per_step": []
     }
 
-    step_map = {step["id"]: step for step in PIPELINE_STEPS}
-
-    for idx, step_id in enumerate(steps_to_run, 1):
-        step = step_map[step_id]
-        print_step_header(idx, stats["total_steps"], step)
-
-        success = False
-
-        if step_id == "merge":
-            success = run_merge_tracks(conference_dir, program_dir)
-        elif step_id == "enrich-papers":
-            success = run_enrich_papers(conference_dir, force, paper_delay)
-        elif step_id == "enrich-authors":
-            # Check credentials before running
-            if not check_aminer_credentials():
-                print(f"{Colors.YELLOW}Warning: AMiner credentials not found{Colors.ENDC}")
-                print(f"{Colors.YELLOW}Please set AMINER_AUTH, AMINER_SIGNATURE, and AMINER_TIMESTAMP environment variables{Colors.ENDC}")
-                print(f"{Colors.RED}Skipping author enrichment{Colors.ENDC}")
-                stats["skipped"] += 1
-                continue
-            success = run_enrich_authors(conference_dir, force, author_delay)
-        elif step_id == "generate-indexes":
-            success = run_generate_indexes(conference_dir)
-
-        if success:
+    runners = build_step_runners(
+        conference_dir, program_dir, force, paper_delay, author_delay, paper_concurrency, use_cache, index_jobs,
+        adaptive_rate, author_concurrency
+    )
+    state = load_pipeline_state(conference_dir)
+    idx = 0
+
+    def run_or_resume(step_id: str) -> bool | str | None:
+        if resume:
+            checkpoint = state.get(step_id, {})
+            if (
+                checkpoint.get("input_hash") == hash_files(step_input_files(step_id, conference_dir, program_dir))
+                and checkpoint.get("output_hash") == hash_files(step_output_files(step_id, conference_dir))
+            ):
+                print(f"{Colors.GREEN}Inputs and outputs unchanged since last successful run at "
+                      f"{checkpoint.get('completed_at')}; skipping{Colors.ENDC}")
+                return None
+        return runners[step_id]()
+
+    def checkpoint_step(step_id: str) -> None:
+        outputs = step_output_files(step_id, conference_dir)
+        state[step_id] = {
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+            "input_hash": hash_files(step_input_files(step_id, conference_dir, program_dir)),
+            "output_hash": hash_files(outputs)
+        }
+        # Earlier steps whose outputs this step rewrote (papers.json) stay valid
+        for other_id in state:
+            other_outputs = step_output_files(other_id, conference_dir) if other_id in STEP_MAP else []
+            if other_id != step_id and set(other_outputs) & set(outputs):
+                state[other_id]["output_hash"] = hash_files(other_outputs)
+        save_pipeline_state(conference_dir, state)
+
+    # The steps form one dependency chain, so every level holds a single step
+    for step_id in [step_id for level in pipeline_levels(steps_to_run) for step_id in level]:
+        idx += 1
+        print_step_header(idx, stats["total_steps"], STEP_MAP[step_id])
+
+        step_start = time.perf_counter()
+        try:
+            success, profile = profile_step(step_id, partial(run_or_resume, step_id))
+        except KeyboardInterrupt:
+            wall = round(time.perf_counter() - step_start, 3)
+            stats["per_step"].append({"step": step_id, "status": "interrupted", "wall": wall})
+            stats["interrupted"] = True
+            print(f"\n{Colors.RED}Pipeline interrupted during: {step_id}{Colors.ENDC}")
+            break
+
+        stats["per_step"].append(profile)
+        if success is None:
+            stats["skipped"] += 1
+        elif success == STEP_INCOMPLETE:
+            print(f"\n{Colors.YELLOW}✓ Step {idx}/{stats['total_steps']} completed with failed items "
+                  f"(not checkpointed){Colors.ENDC}")
+            stats["completed"] += 1
+            stats["incomplete"] += 1
+            state.pop(step_id, None)
+            save_pipeline_state(conference_dir, state)
+        elif success:
             print(f"\n{Colors.GREEN}✓ Step {idx}/{stats['total_steps']} completed successfully{Colors.ENDC}")
             stats["completed"] += 1
+            checkpoint_step(step_id)
         else:
             print(f"\n{Colors.RED}✗ Step {idx}/{stats['total_steps']} failed{Colors.ENDC}")
             stats["failed"] += 1
@@ -257,17 +570,35 @@ def print_summary(stats: dict, start_time: datetime):
     duration = datetime.now() - start_time
     duration_str = str(duration).split('.')[0]  # Remove microseconds
 
-    print("\n" + "=" * 70)
+    print("\n" + _HR)
     print(f"{Colors.BOLD}Pipeline Summary{Colors.ENDC}")
-    print("=" * 70)
+    print(_HR)
     print(f"Total steps:     {stats['total_steps']}")
     print(f"Completed:       {Colors.GREEN}{stats['completed']}{Colors.ENDC}")
+    if stats["incomplete"]:
+        print(f"  - With failures: {Colors.YELLOW}{stats['incomplete']}{Colors.ENDC}")
     print(f"Failed:          {Colors.RED}{stats['failed']}{Colors.ENDC}")
     print(f"Skipped:         {Colors.YELLOW}{stats['skipped']}{Colors.ENDC}")
+    if stats["interrupted"]:
+        interrupted = [profile["step"] for profile in stats["per_step"] if profile["status"] == "interrupted"]
+        print(f"Interrupted:     {Colors.RED}{', '.join(interrupted)}{Colors.ENDC}")
     print(f"Duration:        {duration_str}")
     print()
 
-    if stats["failed"] > 0:
+    slowest = sorted(stats["per_step"], key=lambda profile: profile["wall"], reverse=True)[:3]
+    if slowest:
+        print(f"{Colors.BOLD}Slowest steps:{Colors.ENDC}")
+        for profile in slowest:
+            line = f"  {profile['step']:<18} {profile['wall']:>9.2f}s wall"
+            if "cpu_user" in profile:
+                cpu = profile["cpu_user"] + profile["cpu_sys"]
+                line += f"  {cpu:>9.2f}s cpu  {profile['peak_rss_mb']:>8.1f} MB peak RSS"
+            print(line)
+        print()
+
+    if stats["interrupted"]:
+        print(f"{Colors.RED}Pipeline interrupted; completed steps are checkpointed for the next run{Colors.ENDC}")
+    elif stats["failed"] > 0:
         print(f"{Colors.RED}Pipeline completed with errors{Colors.ENDC}")
     elif stats["completed"] == stats["total_steps"]:
         print(f"{Colors.GREEN}Pipeline completed successfully!{Colors.ENDC}")
@@ -296,14 +627,14 @@ def main():
     parser.add_argument(
         "--start-from",
         type=str,
-        choices=["merge", "enrich-papers", "enrich-authors", "generate-indexes"],
+        choices=ALL_STEP_IDS,
         help="Start pipeline from a specific step"
     )
 
     parser.add_argument(
         "--steps",
         nargs="+",
-        choices=["merge", "enrich-papers", "enrich-authors", "generate-indexes"],
+        choices=ALL_STEP_IDS,
         help="Run only specific steps"
     )
 
@@ -313,6 +644,18 @@ def main():
         help="Force re-processing (passed to enrich scripts)"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not use cached AMiner title search results (passed to enrich-papers)"
+    )
+
+    parser.add_argument(
+        "--strict-credentials",
+        action="store_true",
+        help="Abort before running any step if enrich-authors is selected and AMiner credentials are missing or malformed"
+    )
+
     parser.add_argument(
         "--paper-delay",
         type=float,
@@ -320,6 +663,19 @@ def main():
         help="Delay between paper API requests in seconds (default: 1.0)"
     )
 
+    parser.add_argument(
+        "--adaptive-rate",
+        action="store_true",
+        help="Let paper enrichment adapt its delay to observed API responses, starting at --paper-delay"
+    )
+
+    parser.add_argument(
+        "--paper-concurrency",
+        type=int,
+        default=1,
+        help="Papers looked up concurrently during paper enrichment (default: 1)"
+    )
+
     parser.add_argument(
         "--author-delay",
         type=float,
@@ -327,6 +683,26 @@ def main():
         help="Delay between author API requests in seconds (default: 2.0)"
     )
 
+    parser.add_argument(
+        "--author-concurrency",
+        type=int,
+        default=1,
+        help="Authors fetched concurrently during author enrichment (default: 1)"
+    )
+
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Run all steps even if their inputs and outputs are unchanged since their last successful run"
+    )
+
+    parser.add_argument(
+        "--index-jobs",
+        type=int,
+        default=1,
+        help="Worker processes used to build index files (default: 1)"
+    )
+
     args = parser.parse_args()
 
     # Resolve paths
@@ -341,37 +717,55 @@ def main():
         sys.exit(1)
 
     # Determine steps to run
-    all_step_ids = [step["id"] for step in PIPELINE_STEPS]
-
     if args.steps:
         steps_to_run = args.steps
     elif args.start_from:
-        start_index = all_step_ids.index(args.start_from)
-        steps_to_run = all_step_ids[start_index:]
+        start_index = ALL_STEP_IDS.index(args.start_from)
+        steps_to_run = list(ALL_STEP_IDS[start_index:])
     else:
-        steps_to_run = all_step_ids
+        steps_to_run = list(ALL_STEP_IDS)
+
+    # Skip up-to-date steps only for full/--start-from runs; explicitly chosen steps always run
+    resume = not (args.steps or args.force or args.no_resume)
 
     # Print configuration
-    print("=" * 70)
+    print(_HR)
     print(f"{Colors.BOLD}Paper Data Pipeline{Colors.ENDC}")
-    print("=" * 70)
+    print(_HR)
     print(f"Conference directory: {conference_dir}")
     print(f"Program directory:    {program_dir}")
     print(f"Steps to run:         {', '.join(steps_to_run)}")
     print(f"Force re-processing:  {args.force}")
-    print(f"Paper delay:          {args.paper_delay}s")
+    print(f"Resume:               {resume}")
+    print(f"Search cache:         {not args.no_cache}")
+    print(f"Paper delay:          {args.paper_delay}s{' (adaptive)' if args.adaptive_rate else ''}")
+    print(f"Paper concurrency:    {args.paper_concurrency}")
     print(f"Author delay:         {args.author_delay}s")
+    print(f"Author concurrency:   {args.author_concurrency}")
+    print(f"Index jobs:           {args.index_jobs}")
 
-    # Check AMiner credentials if needed
+    # Check AMiner credentials if needed, before any step has spent time
     if "enrich-authors" in steps_to_run:
-        if check_aminer_credentials():
+        problem = aminer_credentials_problem()
+        if problem is None:
             print(f"AMiner credentials:   {Colors.GREEN}✓ Found{Colors.ENDC}")
         else:
-            print(f"AMiner credentials:   {Colors.YELLOW}⚠ Not found{Colors.ENDC}")
-            print(f"{Colors.DIM}Set AMINER_AUTH, AMINER_SIGNATURE, and AMINER_TIMESTAMP environment variables{Colors.ENDC}")
+            label = "Not found" if not check_aminer_credentials() else "Malformed"
+            print(f"AMiner credentials:   {Colors.YELLOW}⚠ {label}{Colors.ENDC}")
+            print(f"{Colors.DIM}{problem}{Colors.ENDC}")
+            if args.strict_credentials:
+                print(f"\n{Colors.RED}Error: AMiner credentials required by enrich-authors (--strict-credentials){Colors.ENDC}")
+                sys.exit(2)
+
+    # Treat SIGTERM like Ctrl-C, so both stop the pipeline with a partial summary
+    def handle_sigterm(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
 
     # Start pipeline
     start_time = datetime.now()
+    preload_step_modules(steps_to_run)
 
     stats = run_pipeline(
         conference_dir=conference_dir,
@@ -379,12 +773,25 @@ def main():
         steps_to_run=steps_to_run,
         force=args.force,
         paper_delay=args.paper_delay,
-        author_delay=args.author_delay
+        author_delay=args.author_delay,
+        paper_concurrency=args.paper_concurrency,
+        use_cache=not args.no_cache,
+        index_jobs=args.index_jobs,
+        resume=resume,
+        adaptive_rate=args.adaptive_rate,
+        author_concurrency=args.author_concurrency
     )
 
     # Print summary
     print_summary(stats, start_time)
 
+    if stats["per_step"]:
+        profile_path = save_profile(conference_dir, stats["per_step"], start_time)
+        print(f"{Colors.DIM}Step profile appended to: {profile_path}{Colors.ENDC}")
+
+    if stats["interrupted"]:
+        sys.exit(130)
+
     # Exit with appropriate code
     sys.exit(0 if stats["failed"] == 0 else 1)
 
@@ -36,33 +36,51 @@ Example:
 
     # Custom output path
     python enrich_authors_aminer.py ../../data/aaai-26/papers.json -o ../../data/aaai-26/authors.json
+
+    # Fetch up to 8 authors at a time, starting at most 2 requests per second
+    python enrich_authors_aminer.py ../../data/aaai-26/papers.json --concurrency 8 --delay 0.5
+
+    # Same average rate, but let up to 5 requests start at once after an idle stretch
+    python enrich_authors_aminer.py ../../data/aaai-26/papers.json --concurrency 8 --delay 0.5 --burst 5
 """
 
 import argparse
+import asyncio
 import os
 import sys
-import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import requests
 
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop (not available on Windows)
+    uvloop = None
+
 # Add parent directory to path for common_utils and sibling directory for utils
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from common_utils import (
     Colors,
     get_project_root,
+    load_json_document,
     load_json_file,
-    save_json_file,
+    save_json_document,
 )
 
 # Add scholars directory to path for shared utilities
 sys.path.insert(0, str(Path(__file__).parent.parent / "scholars"))
 from aminer_scholar_utils import (
     DEFAULT_API_BASE_URL,
+    SCHOLAR_BATCH_SIZE,
+    clean_credential,
+    fetch_scholars_batch,
     get_api_credentials as get_api_credentials_from_env,
+    list_cached_scholar_ids,
     process_single_scholar,
     print_processing_summary,
 )
@@ -70,6 +88,17 @@ from aminer_scholar_utils import (
 # Data source identifier
 DATA_SOURCE = "papers_enrichment_v1"
 
+# Worker threads reading cached paper details in extract_authors_from_papers
+PAPER_CACHE_READERS = 32
+
+# Pause of the request rate limiter after the API answered 429 Too Many Requests
+THROTTLE_PAUSE_SECONDS = 30.0
+
+# Consecutive failed fetches that open the circuit breaker, and how long
+# requests then pause before trying again
+BREAKER_THRESHOLD = 10
+BREAKER_COOLDOWN_SECONDS = 60.0
+
 
 # Use get_api_credentials from aminer_scholar_utils (imported as get_api_credentials_from_env)
 
@@ -86,6 +115,27 @@ DATA_SOURCE = "papers_enrichment_v1"
 # convert_api_to_enriched_format is now available from aminer_scholar_utils via process_single_scholar
 
 
+@lru_cache(maxsize=8192)
+def _load_paper_authors(path_str: str, mtime_ns: int, size: int) -> list[dict]:
+    # Only the authors list is kept; the rest of the paper detail is dropped right away
+    paper_data = load_json_file(Path(path_str))
+    return paper_data.get("detail", {}).get("authors", [])
+
+
+def load_paper_authors(paper_cache_file: Path) -> Optional[list[dict]]:
+    """
+    Get detail.authors from a cached paper, or None if the paper isn't cached.
+
+    Results are memoized per (path, mtime_ns, size), like load_json_cached, but
+    hold just the authors list rather than the whole paper document.
+    """
+    try:
+        st = paper_cache_file.stat()
+    except FileNotFoundError:
+        return None
+    return _load_paper_authors(str(paper_cache_file), st.st_mtime_ns, st.st_size)
+
+
 def extract_authors_from_papers(
     papers_json_path: Path,
     papers_cache_dir: Path
@@ -101,7 +151,7 @@ def extract_authors_from_papers(
         Dictionary mapping aminer_id to author info (name and paper_ids)
     """
     print(f"Loading papers.json: {papers_json_path}")
-    papers_data = load_json_file(papers_json_path)
+    papers_data = load_json_document(papers_json_path)
     papers = papers_data.get("papers", [])
     print(f"Found {len(papers)} papers in the file\n")
 
@@ -110,36 +160,35 @@ def extract_authors_from_papers(
     papers_without_cache = 0
     total_authors_found = 0
 
-    for idx, paper in enumerate(papers, 1):
-        paper_id = paper.get("paper_id", "Unknown")
-        aminer_paper_id = paper.get("aminer_paper_id")
+    entries = [
+        (idx, paper.get("paper_id", "Unknown"), papers_cache_dir / f"{paper['aminer_paper_id']}.json")
+        for idx, paper in enumerate(papers, 1)
+        if paper.get("aminer_paper_id")
+    ]
 
-        if not aminer_paper_id:
-            continue
+    # Cache reads overlap in threads; authors_map is only touched from this loop
+    with ThreadPoolExecutor(max_workers=PAPER_CACHE_READERS) as executor:
+        loaded = executor.map(load_paper_authors, [entry[2] for entry in entries])
+        for (idx, paper_id, _), authors in zip(entries, loaded):
+            if authors is None:
+                papers_without_cache += 1
+                continue
 
-        # Load paper details from cache
-        paper_cache_file = papers_cache_dir / f"{aminer_paper_id}.json"
-        if not paper_cache_file.exists():
-            papers_without_cache += 1
-            continue
+            papers_with_cache += 1
 
-        papers_with_cache += 1
-        paper_data = load_json_file(paper_cache_file)
-        authors = paper_data.get("detail", {}).get("authors", [])
+            # Extract authors with AMiner IDs
+            for author in authors:
+                author_id = author.get("id")
+                author_name = author.get("name", "")
 
-        # Extract authors with AMiner IDs
-        for author in authors:
-            author_id = author.get("id")
-            author_name = author.get("name", "")
+                if author_id:  # Only process authors with AMiner ID
+                    if not authors_map[author_id]["name"]:
+                        authors_map[author_id]["name"] = author_name
+                        total_authors_found += 1
+                    authors_map[author_id]["paper_ids"].append(paper_id)
 
-            if author_id:  # Only process authors with AMiner ID
-                if not authors_map[author_id]["name"]:
-                    authors_map[author_id]["name"] = author_name
-                    total_authors_found += 1
-                authors_map[author_id]["paper_ids"].append(paper_id)
-
-        if idx % 100 == 0:
-            print(f"Processed {idx}/{len(papers)} papers, found {total_authors_found} unique authors with AMiner IDs")
+            if idx % 100 == 0:
+                print(f"Processed {idx}/{len(papers)} papers, found {total_authors_found} unique authors with AMiner IDs")
 
     print(f"\nExtraction complete:")
     print(f"  Papers with cache: {papers_with_cache}")
@@ -149,6 +198,120 @@ def extract_authors_from_papers(
     return dict(authors_map)
 
 
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by concurrent fetch workers.
+
+    Holds up to `capacity` tokens, refilled at `rate` tokens per second. Each
+    acquire() takes one token and only waits when the bucket is empty, so up to
+    `capacity` requests can go out back to back while the long-run rate stays
+    at `rate`. A rate of 0 disables limiting, but not pause().
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.last_refill: Optional[float] = None
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                # Pauses apply even when rate limiting is disabled
+                if self.rate <= 0:
+                    return
+
+                if self.last_refill is not None:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for `seconds` and drop any saved-up burst."""
+        now = asyncio.get_running_loop().time()
+        self._paused_until = max(self._paused_until, now + seconds)
+        self.tokens = 0.0
+        self.last_refill = self._paused_until
+
+
+class CircuitBreaker:
+    """
+    Stops the run from hammering an API that keeps failing.
+
+    Opens after `threshold` consecutive failed fetches, at which point the
+    caller pauses requests for a cooldown before trying again. If it opens a
+    second time without any fetch succeeding in between, the API is treated
+    as down (expired credentials, data-proxy offline) and `tripped` is set so
+    the run can stop instead of failing every remaining author.
+    """
+
+    def __init__(self, threshold: int = BREAKER_THRESHOLD):
+        self.threshold = threshold
+        self.failures = 0
+        self.openings = 0
+        self.tripped = False
+
+    def record(self, ok: bool) -> bool:
+        """Record a fetch result; returns True if this failure opened the breaker."""
+        if ok:
+            self.failures = 0
+            self.openings = 0
+            return False
+
+        self.failures += 1
+        if self.failures < self.threshold:
+            return False
+
+        self.failures = 0
+        self.openings += 1
+        if self.openings >= 2:
+            self.tripped = True
+        return True
+
+
+def build_author_entry(
+    aminer_id: str,
+    name: str,
+    paper_ids: list[str],
+    aminer_data: dict,
+    enriched_data: Optional[dict]
+) -> dict:
+    """Build an authors.json entry from the scholar's AMiner and enriched data."""
+    detail = aminer_data.get("detail", {})
+    enriched = enriched_data if isinstance(enriched_data, dict) else {}
+
+    # Extract indices from enriched data (nested under "indices" key)
+    indices = enriched.get("indices", {})
+    orgs = detail.get("orgs")
+
+    return {
+        "name": name,
+        "normalized_name": name.lower(),
+        "aminer_id": aminer_id,
+        "aminer_name": detail.get("name", name),
+        "aminer_name_zh": detail.get("name_zh", ""),
+        "papers": sorted(paper_ids),
+        "paper_count": len(paper_ids),
+        "h_index": indices.get("hindex"),
+        "n_citation": indices.get("citations"),
+        "n_pubs": indices.get("pubs"),
+        "organization": orgs[0] if orgs else "",
+        "position": detail.get("position", "")
+    }
+
+
 def process_authors(
     authors_map: dict[str, dict],
     aminer_dir: Path,
@@ -161,11 +324,26 @@ def process_authors(
     delay: float = 2.0,
     force_refresh: bool = False,
     update_existing: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    concurrency: int = 1,
+    burst: int = 1,
+    batch_size: int = SCHOLAR_BATCH_SIZE
 ) -> tuple[list[dict], dict]:
     """
     Process all authors and enrich with AMiner data.
 
+    Authors whose scholar data is already cached are handled first without any
+    API call. The rest are fetched with up to `concurrency` requests in flight
+    (in worker threads). Request starts go through a TokenBucket: on average
+    one per `delay` seconds, with bursts of up to `burst` requests. After a
+    429 response, no new requests start for THROTTLE_PAUSE_SECONDS. A
+    CircuitBreaker pauses requests after BREAKER_THRESHOLD failures in a row
+    and gives up if that happens twice, setting stats["aborted"].
+
+    With `batch_size` > 1, authors to fetch are first requested `batch_size` at
+    a time from the data-proxy batch endpoint; any the batches didn't return
+    (or all of them, if the endpoint is unavailable) are fetched one by one.
+
     Args:
         authors_map: Dictionary mapping aminer_id to author info
         aminer_dir: Directory for AMiner cache files
@@ -179,10 +357,38 @@ def process_authors(
         force_refresh: Force refresh API cache
         update_existing: Update existing cache with merge (preserves extra fields like email)
         verbose: Whether to print detailed progress
+        concurrency: Maximum number of API requests in flight
+        burst: Requests that may start back to back before `delay` applies
+        batch_size: Authors per batch API request (1 = one request per author)
 
     Returns:
         Tuple of (authors_list, statistics)
     """
+    run = getattr(uvloop, "run", asyncio.run)
+    return run(_process_authors_async(
+        authors_map, aminer_dir, enriched_dir, api_base_url, authorization, signature, timestamp,
+        force, delay, force_refresh, update_existing, verbose, concurrency, burst, batch_size
+    ))
+
+
+async def _process_authors_async(
+    authors_map: dict[str, dict],
+    aminer_dir: Path,
+    enriched_dir: Path,
+    api_base_url: str,
+    authorization: str,
+    signature: str,
+    timestamp: str,
+    force: bool,
+    delay: float,
+    force_refresh: bool,
+    update_existing: bool,
+    verbose: bool,
+    concurrency: int,
+    burst: int,
+    batch_size: int
+) -> tuple[list[dict], dict]:
+    """Async implementation of process_authors."""
     # Ensure output directories exist
     aminer_dir.mkdir(parents=True, exist_ok=True)
     enriched_dir.mkdir(parents=True, exist_ok=True)
@@ -197,26 +403,23 @@ def process_authors(
         "api_updated": 0,
         "success": 0,
         "failed": 0,
-        "failed_ids": []
+        "failed_ids": [],
+        "aborted": False
     }
 
-    authors_list = []
-
-    for idx, (aminer_id, author_info) in enumerate(authors_map.items(), 1):
-        name = author_info["name"]
-        paper_ids = author_info["paper_ids"]
+    # Entries by AMiner ID, filled in whatever order authors finish
+    author_entries: dict[str, dict] = {}
 
-        # Check for invalid AMiner IDs (defensive programming)
-        if not aminer_id or aminer_id == "failed" or aminer_id.strip() == "":
-            reason = "no AMiner ID" if not aminer_id or aminer_id.strip() == "" else "invalid AMiner ID"
-            print(f"[{idx}/{stats['total']}] {Colors.YELLOW}Skipped{Colors.ENDC} {name} ({reason})")
-            stats["skipped"] += 1
-            continue
+    # Fetch time recorded for every scholar saved in this run
+    run_started_at = datetime.now(timezone.utc).isoformat()
 
-        print(f"[{idx}/{stats['total']}] {Colors.CYAN}Processing{Colors.ENDC} {name} ({aminer_id})")
+    # Scholars cached in both directories, listed once up front
+    use_cache = not force and not update_existing
+    cached_ids = list_cached_scholar_ids(aminer_dir, enriched_dir) if use_cache else set()
 
+    def process_scholar(aminer_id: str, api_response: Optional[dict] = None) -> tuple:
         # Process the scholar using shared utility
-        aminer_data, enriched_data, status, error_msg = process_single_scholar(
+        return process_single_scholar(
             aminer_id=aminer_id,
             aminer_dir=aminer_dir,
             enriched_dir=enriched_dir,
@@ -228,71 +431,136 @@ def process_authors(
             force=force,
             force_refresh=force_refresh,
             update_existing=update_existing,
-            verbose=verbose
+            verbose=verbose,
+            cached_ids=cached_ids,
+            api_response=api_response,
+            fetched_at=run_started_at
         )
 
+    def record_result(aminer_id, name, paper_ids, aminer_data, enriched_data, status, error_msg, out) -> None:
         # Update statistics
         if status == "cache_hit":
             stats["cache_hit"] += 1
-            print(f"       Papers: {len(paper_ids)} | {Colors.DIM}Cache hit{Colors.ENDC}")
+            out(f"       Papers: {len(paper_ids)} | {Colors.DIM}Cache hit{Colors.ENDC}")
         elif status == "api_success":
             stats["api_call"] += 1
-            print(f"       Papers: {len(paper_ids)} | {Colors.GREEN}API success{Colors.ENDC}")
+            out(f"       Papers: {len(paper_ids)} | {Colors.GREEN}API success{Colors.ENDC}")
         elif status == "api_updated":
             stats["api_call"] += 1
             stats["api_updated"] += 1
-            print(f"       Papers: {len(paper_ids)} | {Colors.CYAN}API updated{Colors.ENDC}")
+            out(f"       Papers: {len(paper_ids)} | {Colors.CYAN}API updated{Colors.ENDC}")
         elif status == "api_no_change":
             stats["api_call"] += 1
-            print(f"       Papers: {len(paper_ids)} | {Colors.DIM}No changes{Colors.ENDC}")
+            out(f"       Papers: {len(paper_ids)} | {Colors.DIM}No changes{Colors.ENDC}")
         elif status == "api_failed":
             stats["api_call"] += 1
             stats["failed"] += 1
             stats["failed_ids"].append(aminer_id)
             stats["processed"] += 1
             error_display = f": {error_msg}" if error_msg else ""
-            print(f"       Papers: {len(paper_ids)} | {Colors.RED}[FAILED]{Colors.ENDC} API call failed{error_display}")
-            continue
-
-        # Build author entry for authors.json
-        detail = aminer_data.get("detail", {})
-        enriched = enriched_data if isinstance(enriched_data, dict) else {}
-
-        # Extract indices from enriched data (nested under "indices" key)
-        indices = enriched.get("indices", {})
-
-        author_entry = {
-            "name": name,
-            "normalized_name": name.lower(),
-            "aminer_id": aminer_id,
-            "aminer_name": detail.get("name", name),
-            "aminer_name_zh": detail.get("name_zh", ""),
-            "papers": sorted(paper_ids),
-            "paper_count": len(paper_ids),
-            "h_index": indices.get("hindex"),
-            "n_citation": indices.get("citations"),
-            "n_pubs": indices.get("pubs"),
-            "organization": detail.get("orgs", [""])[0] if detail.get("orgs") else "",
-            "position": detail.get("position", "")
-        }
-
-        authors_list.append(author_entry)
+            out(f"       Papers: {len(paper_ids)} | {Colors.RED}[FAILED]{Colors.ENDC} API call failed{error_display}")
+            return
+
+        author_entries[aminer_id] = build_author_entry(aminer_id, name, paper_ids, aminer_data, enriched_data)
         stats["success"] += 1
         stats["processed"] += 1
 
-        print(f"       {Colors.GREEN}[SUCCESS]{Colors.ENDC}")
-
-        # Rate limiting
-        if idx < stats["total"] and delay > 0 and stats["api_call"] > 0:
-            time.sleep(delay)
+        out(f"       {Colors.GREEN}[SUCCESS]{Colors.ENDC}")
 
+    # Phase 1: handle cached authors (no API call needed) and collect the ones to fetch
+    to_fetch = []
+    for idx, (aminer_id, author_info) in enumerate(authors_map.items(), 1):
+        # Check for invalid AMiner IDs (defensive programming)
+        if not aminer_id or aminer_id == "failed" or aminer_id.strip() == "":
+            reason = "no AMiner ID" if not aminer_id or aminer_id.strip() == "" else "invalid AMiner ID"
+            print(f"[{idx}/{stats['total']}] {Colors.YELLOW}Skipped{Colors.ENDC} {author_info['name']} ({reason})")
+            stats["skipped"] += 1
+        elif aminer_id in cached_ids:
+            print(f"[{idx}/{stats['total']}] {Colors.CYAN}Processing{Colors.ENDC} {author_info['name']} ({aminer_id})")
+            result = process_scholar(aminer_id)
+            record_result(aminer_id, author_info["name"], author_info["paper_ids"], *result, print)
+        else:
+            to_fetch.append((idx, aminer_id, author_info))
+
+    async def fetch_authors() -> None:
+        print(f"\n{Colors.CYAN}Fetching {len(to_fetch)} authors from API "
+              f"(concurrency {concurrency}){Colors.ENDC}\n")
+
+        semaphore = asyncio.Semaphore(concurrency)
+        bucket = TokenBucket(1.0 / delay if delay > 0 else 0, capacity=burst)
+        breaker = CircuitBreaker()
+
+        async def fetch_batch(aminer_ids: list[str]) -> Optional[dict[str, dict]]:
+            async with semaphore:
+                await bucket.acquire()
+                return await asyncio.to_thread(
+                    fetch_scholars_batch, aminer_ids, api_base_url,
+                    authorization, signature, timestamp, force_refresh
+                )
+
+        # Responses fetched in batches; the first batch also checks that the endpoint exists
+        prefetched: dict[str, dict] = {}
+        if batch_size > 1 and len(to_fetch) > 1:
+            fetch_ids = [aminer_id for _, aminer_id, _ in to_fetch]
+            batches = [fetch_ids[i:i + batch_size] for i in range(0, len(fetch_ids), batch_size)]
+            first = await fetch_batch(batches[0])
+            if first is None:
+                print(f"{Colors.YELLOW}Batch API request failed, fetching authors one by one{Colors.ENDC}\n")
+            else:
+                for batch_result in [first, *await asyncio.gather(*(fetch_batch(b) for b in batches[1:]))]:
+                    prefetched.update(batch_result or {})
+                print(f"{Colors.CYAN}Fetched {len(prefetched)}/{len(fetch_ids)} authors in "
+                      f"{len(batches)} batch requests{Colors.ENDC}\n")
+
+        async def worker(idx: int, aminer_id: str, author_info: dict) -> None:
+            # With concurrency, each author's output is buffered and printed as one block
+            async with semaphore:
+                api_response = prefetched.pop(aminer_id, None)
+                if api_response is None:
+                    await bucket.acquire()
+                if breaker.tripped:
+                    return
+                lines: list[str] = []
+                out = print if concurrency == 1 else lines.append
+                try:
+                    name = author_info["name"]
+                    out(f"[{idx}/{stats['total']}] {Colors.CYAN}Processing{Colors.ENDC} {name} ({aminer_id})")
+                    result = await asyncio.to_thread(process_scholar, aminer_id, api_response)
+                    error_msg = result[3]
+                    if error_msg and "429" in error_msg:
+                        out(f"       {Colors.YELLOW}Rate limited by the API, pausing requests for "
+                            f"{THROTTLE_PAUSE_SECONDS:.0f}s{Colors.ENDC}")
+                        bucket.pause(THROTTLE_PAUSE_SECONDS)
+                    record_result(aminer_id, name, author_info["paper_ids"], *result, out)
+
+                    if breaker.record(result[2] != "api_failed"):
+                        if breaker.tripped:
+                            stats["aborted"] = True
+                            out(f"       {Colors.RED}API keeps failing after a cooldown, "
+                                f"stopping the remaining fetches{Colors.ENDC}")
+                        else:
+                            out(f"       {Colors.YELLOW}{breaker.threshold} API failures in a row, pausing requests "
+                                f"for {BREAKER_COOLDOWN_SECONDS:.0f}s{Colors.ENDC}")
+                            bucket.pause(BREAKER_COOLDOWN_SECONDS)
+                finally:
+                    if lines:
+                        print("\n".join(lines))
+
+        await asyncio.gather(*(worker(*entry) for entry in to_fetch))
+
+    # Phase 2: fetch uncached authors from the API
+    if to_fetch:
+        await fetch_authors()
+
+    # Phase 3: build the author list in input order, however the fetches finished
+    authors_list = [author_entries[aminer_id] for aminer_id in authors_map if aminer_id in author_entries]
     return authors_list, stats
 
 
 # print_summary is replaced by print_processing_summary from aminer_scholar_utils
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Extract authors from papers.json and enrich with AMiner data",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -376,6 +644,28 @@ def main():
         help="Delay between API requests in seconds (default: 2.0)"
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum number of authors fetched from the API concurrently (default: 1)"
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=SCHOLAR_BATCH_SIZE,
+        help=f"Authors requested per batch API call (default: {SCHOLAR_BATCH_SIZE}, 1 = one call per author). "
+             "Falls back to one call per author if the data-proxy has no batch endpoint"
+    )
+
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=1,
+        help="API requests that may start back to back before --delay applies (default: 1)"
+    )
+
     parser.add_argument(
         "--force-refresh",
         action="store_true",
@@ -388,7 +678,17 @@ def main():
         help="Print detailed progress for each API call"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1:
+        print(f"{Colors.RED}Error: --concurrency must be at least 1{Colors.ENDC}")
+        sys.exit(1)
+    if args.burst < 1:
+        print(f"{Colors.RED}Error: --burst must be at least 1{Colors.ENDC}")
+        sys.exit(1)
+    if not 1 <= args.batch_size <= 100:
+        print(f"{Colors.RED}Error: --batch-size must be between 1 and 100{Colors.ENDC}")
+        sys.exit(1)
 
     # Resolve file path
     papers_json_path = Path(args.papers_json).resolve()
@@ -402,18 +702,10 @@ def main():
     else:
         output_path = papers_json_path.parent / "authors.json"
 
-    # Get credentials
-    authorization = args.authorization
-    signature = args.signature
-    timestamp = args.timestamp
-
-    # Clean up command line arguments
-    if authorization:
-        authorization = authorization.strip().replace('\n', '').replace('\r', '')
-    if signature:
-        signature = signature.strip().replace('\n', '').replace('\r', '')
-    if timestamp:
-        timestamp = timestamp.strip().replace('\n', '').replace('\r', '')
+    # Get credentials (cleaned up, as they are often pasted with line breaks)
+    authorization = clean_credential(args.authorization)
+    signature = clean_credential(args.signature)
+    timestamp = clean_credential(args.timestamp)
 
     # Fall back to environment variables
     if not authorization or not signature or not timestamp:
@@ -461,7 +753,9 @@ def main():
     print(f"Enriched directory: {enriched_dir}")
     print(f"Force refresh: {args.force}")
     print(f"Update existing: {args.update_existing}")
-    print(f"Delay: {args.delay}s")
+    print(f"Delay: {args.delay}s (burst {args.burst})")
+    print(f"Concurrency: {args.concurrency}")
+    print(f"Batch size: {args.batch_size}")
     print()
 
     # Extract authors from papers
@@ -497,9 +791,19 @@ def main():
         delay=args.delay,
         force_refresh=args.force_refresh,
         update_existing=args.update_existing,
-        verbose=args.verbose
+        verbose=args.verbose,
+        concurrency=args.concurrency,
+        burst=args.burst,
+        batch_size=args.batch_size
     )
 
+    if stats["aborted"]:
+        print_processing_summary(stats)
+        print(f"\n{Colors.RED}Error: Stopped after repeated API failures, {output_path.name} was not written. "
+              f"Check the data-proxy and refresh the AMiner credentials, then re-run "
+              f"(authors fetched so far are cached).{Colors.ENDC}")
+        sys.exit(1)
+
     # Sort authors by name
     authors_list.sort(key=lambda x: x["normalized_name"])
 
@@ -514,12 +818,15 @@ def main():
     }
 
     print(f"\n{Colors.CYAN}Saving authors.json...{Colors.ENDC}")
-    save_json_file(output_path, output_data)
+    save_json_document(output_path, output_data)
     print(f"{Colors.GREEN}Saved to: {output_path}{Colors.ENDC}")
 
     # Print summary
     print_processing_summary(stats)
 
+    # Returned for build_pipeline, which retries steps with failed items
+    return stats
+
 
 if __name__ == "__main__":
     main()
@@ -21,21 +21,45 @@ Example:
 
     # Custom output directory and delay
     python enrich_papers_aminer.py ../../data/aaai-26/papers.json --output-dir ./output --delay 2.0
+
+    # Look up 8 papers at a time, starting at most 4 lookups per second
+    python enrich_papers_aminer.py ../../data/aaai-26/papers.json --concurrency 8 --delay 0.25
+
+    # Let the delay adapt to the API's actual rate limit
+    python enrich_papers_aminer.py ../../data/aaai-26/papers.json --concurrency 8 --adaptive-rate
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import os
 import shutil
 import sys
 import time
-import urllib.error
-import urllib.parse
-import urllib.request
+import unicodedata
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON file I/O
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: faster event loop (not available on Windows)
+    uvloop = None
+
+# Add parent directory to path for common_utils
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from common_utils import load_json_document, save_json_document
+
 
 def get_project_root() -> Path:
     """Get the project root directory (grandparent of papers directory)."""
@@ -45,114 +69,109 @@ def get_project_root() -> Path:
 # AMiner API Configuration
 AMINER_BASE_URL = "https://datacenter.aminer.cn/gateway/open_platform/api"
 
+# Bump to invalidate cached title search results (e.g. if the search API changes)
+SEARCH_CACHE_VERSION = "v2"
+
+# Save papers.json every N processed papers (and at the end of the run); keep it
+# a divisor of the 100-paper backup interval so each backup sees the latest data
+SAVE_EVERY = 25
+
 
 def get_aminer_api_key() -> Optional[str]:
     """Get AMiner API key from environment variable."""
     return os.environ.get("AMINER_API_KEY")
 
 
-def search_paper_api(title: str, size: int = 1, retry_count: int = 3, retry_delay: int = 10) -> dict:
+# Connection pool size, enough for concurrent lookups (see --concurrency)
+HTTP_POOL_SIZE = 32
+
+
+def _create_session() -> requests.Session:
     """
-    Search for papers by title on AMiner API with retry logic.
+    Create the HTTP session shared by all AMiner API calls.
 
-    Args:
-        title: Paper title to search
-        size: Number of results to return
-        retry_count: Number of retries on failure
-        retry_delay: Delay between retries in seconds
+    Keeps TLS connections to the AMiner gateway alive between papers instead of
+    a new handshake per call, and retries throttled (429, honouring
+    Retry-After), failing (5xx) and dropped requests up to 3 times with
+    backoff (0s, 10s, 20s).
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+
+def _get_api(endpoint: str, params: dict) -> dict:
+    """
+    GET an AMiner open platform endpoint through the shared session.
 
     Returns:
-        API response dict with success/data fields
+        API response dict with success/data fields (success False with a
+        message if the request failed after retries)
     """
     api_key = get_aminer_api_key()
     if not api_key:
         return {"success": False, "msg": "AMINER_API_KEY not set", "data": None}
 
-    params = {
-        "title": title,
-        "page": 0,
-        "size": min(size, 20)  # Max 20
-    }
-
-    query_string = urllib.parse.urlencode(params)
-    url = f"{AMINER_BASE_URL}/paper/search?{query_string}"
-
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json;charset=utf-8"
     }
 
-    for attempt in range(retry_count):
-        try:
-            req = urllib.request.Request(url, headers=headers, method="GET")
-            with urllib.request.urlopen(req, timeout=30) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8") if e.fp else ""
-            if attempt < retry_count - 1:
-                print(f"       {Colors.YELLOW}HTTP Error {e.code}, retrying in {retry_delay}s... (attempt {attempt + 1}/{retry_count}){Colors.ENDC}")
-                time.sleep(retry_delay)
-            else:
-                return {"success": False, "msg": f"HTTP {e.code}: {error_body}", "data": None}
-        except urllib.error.URLError as e:
-            if attempt < retry_count - 1:
-                print(f"       {Colors.YELLOW}Network error, retrying in {retry_delay}s... (attempt {attempt + 1}/{retry_count}){Colors.ENDC}")
-                time.sleep(retry_delay)
-            else:
-                return {"success": False, "msg": f"Network error: {str(e)}", "data": None}
-        except Exception as e:
-            return {"success": False, "msg": f"Unexpected error: {str(e)}", "data": None}
+    try:
+        response = _SESSION.get(f"{AMINER_BASE_URL}/{endpoint}", params=params, headers=headers, timeout=30)
+    except requests.RequestException as e:
+        return {"success": False, "msg": f"Network error: {str(e)}", "data": None}
+
+    if not response.ok:
+        return {"success": False, "msg": f"HTTP {response.status_code}: {response.text}", "data": None}
 
-    return {"success": False, "msg": "Max retries exceeded", "data": None}
+    try:
+        return response.json()
+    except ValueError as e:
+        return {"success": False, "msg": f"Unexpected error: {str(e)}", "data": None}
 
 
-def get_paper_detail_api(paper_id: str, retry_count: int = 3, retry_delay: int = 10) -> dict:
+def search_paper_api(title: str, size: int = 1) -> dict:
     """
-    Get paper details by ID from AMiner API with retry logic.
+    Search for papers by title on AMiner API (transient failures are retried by the session).
 
     Args:
-        paper_id: Paper ID
-        retry_count: Number of retries on failure
-        retry_delay: Delay between retries in seconds
+        title: Paper title to search
+        size: Number of results to return
 
     Returns:
         API response dict with success/data fields
     """
-    api_key = get_aminer_api_key()
-    if not api_key:
-        return {"success": False, "msg": "AMINER_API_KEY not set", "data": None}
+    params = {
+        "title": title,
+        "page": 0,
+        "size": min(size, 20)  # Max 20
+    }
+    return _get_api("paper/search", params)
 
-    params = {"id": paper_id}
-    query_string = urllib.parse.urlencode(params)
-    url = f"{AMINER_BASE_URL}/paper/detail?{query_string}"
 
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json;charset=utf-8"
-    }
+def get_paper_detail_api(paper_id: str) -> dict:
+    """
+    Get paper details by ID from AMiner API (transient failures are retried by the session).
 
-    for attempt in range(retry_count):
-        try:
-            req = urllib.request.Request(url, headers=headers, method="GET")
-            with urllib.request.urlopen(req, timeout=30) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
-            error_body = e.read().decode("utf-8") if e.fp else ""
-            if attempt < retry_count - 1:
-                print(f"       {Colors.YELLOW}HTTP Error {e.code}, retrying in {retry_delay}s... (attempt {attempt + 1}/{retry_count}){Colors.ENDC}")
-                time.sleep(retry_delay)
-            else:
-                return {"success": False, "msg": f"HTTP {e.code}: {error_body}", "data": None}
-        except urllib.error.URLError as e:
-            if attempt < retry_count - 1:
-                print(f"       {Colors.YELLOW}Network error, retrying in {retry_delay}s... (attempt {attempt + 1}/{retry_count}){Colors.ENDC}")
-                time.sleep(retry_delay)
-            else:
-                return {"success": False, "msg": f"Network error: {str(e)}", "data": None}
-        except Exception as e:
-            return {"success": False, "msg": f"Unexpected error: {str(e)}", "data": None}
+    Args:
+        paper_id: Paper ID
 
-    return {"success": False, "msg": "Max retries exceeded", "data": None}
+    Returns:
+        API response dict with success/data fields
+    """
+    return _get_api("paper/detail", {"id": paper_id})
 
 
 class Colors:
@@ -169,16 +188,25 @@ class Colors:
 
 def load_json_file(file_path: Path) -> dict:
     """Load and parse a JSON file."""
+    if orjson is not None:
+        return orjson.loads(Path(file_path).read_bytes())
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
 def save_json_file(file_path: Path, data: dict) -> None:
-    """Save data to a JSON file with proper formatting."""
+    """Save data to a JSON file with proper formatting (atomically, via a temporary file)."""
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write('\n')
+    tmp_path = file_path.with_name(file_path.name + '.tmp')
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        ))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+    os.replace(tmp_path, file_path)
 
 
 def backup_file(file_path: Path, project_root: Path) -> Path:
@@ -229,7 +257,7 @@ def search_paper_by_title(title: str, verbose: bool = False) -> tuple[Optional[s
     if verbose:
         print(f"       Searching title: {title[:60]}...", end="", flush=True)
 
-    search_result = search_paper_api(title=title, size=1, retry_count=3, retry_delay=10)
+    search_result = search_paper_api(title=title, size=1)
 
     if search_result.get("success"):
         data = search_result.get("data", [])
@@ -249,6 +277,67 @@ def search_paper_by_title(title: str, verbose: bool = False) -> tuple[Optional[s
         return None, "failed"
 
 
+def normalize_title(title: str) -> str:
+    """Normalize a title for cache lookups (Unicode NFKC, case and whitespace insensitive)."""
+    return " ".join(unicodedata.normalize("NFKC", title).lower().split())
+
+
+def search_cache_path(cache_dir: Path, title: str) -> Path:
+    """Path of the cached search result for a title."""
+    key = hashlib.sha1(f"{normalize_title(title)}:{SEARCH_CACHE_VERSION}".encode("utf-8")).hexdigest()
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def legacy_search_cache_path(cache_dir: Path, paper_id: str) -> Path:
+    """Path of a v1 cache entry, which was keyed by paper ID."""
+    key = hashlib.sha1(f"{paper_id}:v1".encode("utf-8")).hexdigest()
+    return cache_dir / key[:2] / f"{key}.json"
+
+
+def load_cached_search(cache_dir: Path, paper_id: str, title: str) -> Optional[tuple[Optional[str], str]]:
+    """
+    Return the cached (aminer_id, status) for a paper's title, or None on a miss.
+
+    Results are keyed by normalized title, so they are shared by papers with
+    the same title and survive paper ID changes. Entries from the v1 cache
+    (keyed by paper ID) are still reused if the title is unchanged, and are
+    migrated to the title key.
+    """
+    try:
+        entry = load_json_file(search_cache_path(cache_dir, title))
+    except (OSError, json.JSONDecodeError):
+        entry = None
+    if entry and normalize_title(entry.get("title", "")) == normalize_title(title):
+        return entry.get("aminer_id"), entry["status"]
+
+    try:
+        entry = load_json_file(legacy_search_cache_path(cache_dir, paper_id))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if entry.get("title") != title:
+        return None
+    save_cached_search(cache_dir, paper_id, title, entry.get("aminer_id"), entry["status"])
+    return entry.get("aminer_id"), entry["status"]
+
+
+def save_cached_search(
+    cache_dir: Path,
+    paper_id: str,
+    title: str,
+    aminer_id: Optional[str],
+    status: str
+) -> None:
+    """Cache a title search result; written atomically so readers never see partial files."""
+    cache_file = search_cache_path(cache_dir, title)
+    save_json_file(cache_file, {
+        "paper_id": paper_id,
+        "title": title,
+        "aminer_id": aminer_id,
+        "status": status,
+        "cached_at": datetime.now(timezone.utc).isoformat()
+    })
+
+
 def fetch_paper_detail_data(aminer_id: str, verbose: bool = False) -> Optional[dict]:
     """
     Fetch detailed information about a paper from AMiner with automatic retry.
@@ -263,7 +352,7 @@ def fetch_paper_detail_data(aminer_id: str, verbose: bool = False) -> Optional[d
     if verbose:
         print(f"       Fetching details...", end="", flush=True)
 
-    detail_result = get_paper_detail_api(aminer_id, retry_count=3, retry_delay=10)
+    detail_result = get_paper_detail_api(aminer_id)
 
     if detail_result.get("success"):
         data = detail_result.get("data", [])
@@ -352,17 +441,87 @@ def update_paper_with_aminer(
     return modified
 
 
+# Adaptive rate limiting (--adaptive-rate): bounds of the request interval,
+# consecutive fast lookups before it is halved, and the latency (EWMA, seconds)
+# above which lookups count as slow. Retried API calls back off for 10s+, so a
+# throttled (429) or failing (5xx) lookup always shows up as slow.
+ADAPTIVE_MIN_DELAY = 0.1
+ADAPTIVE_MAX_DELAY = 30.0
+ADAPTIVE_SUCCESS_STREAK = 20
+ADAPTIVE_SLOW_SECONDS = 5.0
+
+
+class RateLimiter:
+    """
+    Space out request starts to at most `rate` per second across concurrent workers.
+
+    Each acquire() reserves the next free slot, so the aggregate rate stays the
+    same however many papers are in flight.
+
+    With `adaptive`, record() tunes the interval from observed lookups: it is
+    halved after ADAPTIVE_SUCCESS_STREAK consecutive fast successes and doubled
+    on any failed or slow one, so the rate settles near what the API allows.
+    """
+
+    def __init__(self, rate: float, adaptive: bool = False):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.adaptive = adaptive
+        self.latency_ewma: Optional[float] = None
+        self._streak = 0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    def record(self, ok: bool, latency: float) -> Optional[float]:
+        """Record a lookup's outcome; returns the new interval if it changed."""
+        if not self.adaptive:
+            return None
+
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma = 0.8 * self.latency_ewma + 0.2 * latency
+
+        old_interval = self.interval
+        if ok and latency < ADAPTIVE_SLOW_SECONDS and self.latency_ewma < ADAPTIVE_SLOW_SECONDS:
+            self._streak += 1
+            if self._streak >= ADAPTIVE_SUCCESS_STREAK:
+                self._streak = 0
+                self.interval = max(ADAPTIVE_MIN_DELAY, self.interval / 2)
+        else:
+            self._streak = 0
+            self.interval = min(ADAPTIVE_MAX_DELAY, max(self.interval, ADAPTIVE_MIN_DELAY) * 2)
+
+        return self.interval if self.interval != old_interval else None
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
 def process_papers(
     json_file_path: Path,
     output_dir: Path,
     force: bool = False,
     target_paper_ids: Optional[list[str]] = None,
     delay: float = 1.0,
-    verbose: bool = False
+    verbose: bool = False,
+    concurrency: int = 1,
+    cache_dir: Optional[Path] = None,
+    adaptive_rate: bool = False
 ) -> dict:
     """
     Process all papers in the papers.json file and enrich with AMiner data.
 
+    Up to `concurrency` papers are looked up at once; API calls run in worker
+    threads while papers.json updates stay on the event loop. Paper lookups
+    start at most once per `delay` seconds overall.
+
     Args:
         json_file_path: Path to the papers.json file
         output_dir: Directory to save individual paper JSON files
@@ -370,15 +529,38 @@ def process_papers(
         target_paper_ids: Optional list of specific paper IDs to process
         delay: Delay between API requests in seconds
         verbose: Whether to print detailed progress
+        concurrency: Maximum number of papers processed concurrently
+        cache_dir: Directory of cached title search results (None disables the cache).
+            Cached results are not read with `force`, but fresh results are still stored.
+        adaptive_rate: Tune the delay from observed API responses, starting at `delay`
 
     Returns:
         Statistics dictionary with processing results
     """
+    run = getattr(uvloop, "run", asyncio.run)
+    return run(_process_papers_async(
+        json_file_path, output_dir, force, target_paper_ids, delay, verbose, concurrency, cache_dir,
+        adaptive_rate
+    ))
+
+
+async def _process_papers_async(
+    json_file_path: Path,
+    output_dir: Path,
+    force: bool,
+    target_paper_ids: Optional[list[str]],
+    delay: float,
+    verbose: bool,
+    concurrency: int,
+    cache_dir: Optional[Path],
+    adaptive_rate: bool
+) -> dict:
+    """Async implementation of process_papers."""
     project_root = get_project_root()
 
     # Load the JSON file
     print(f"Loading papers.json: {json_file_path}")
-    data = load_json_file(json_file_path)
+    data = load_json_document(json_file_path)
 
     # Get papers
     papers = data.get("papers", [])
@@ -392,6 +574,10 @@ def process_papers(
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Detail files already saved, listed once instead of an exists() check per paper
+    with os.scandir(output_dir) as entries:
+        cached_ids = {e.name[:-5] for e in entries if e.name.endswith(".json")}
+
     # Track statistics
     stats = {
         "total": len(papers),
@@ -400,108 +586,173 @@ def process_papers(
         "success": 0,
         "not_found": 0,
         "failed": 0,
+        "search_cache_hit": 0,
+        "final_delay": None,
         "failed_ids": []
     }
 
     json_modified = False
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = RateLimiter(1.0 / delay if delay > 0 else 0, adaptive=adaptive_rate)
+    # Searches by normalized title, so papers sharing a title hit the API once
+    searches: dict[str, asyncio.Task] = {}
 
-    for idx, paper in enumerate(papers, 1):
+    async def search_title(paper_id: str, title: str, out) -> tuple[Optional[str], str]:
+        # Rate limiting
+        await limiter.acquire()
+
+        # Search for paper on AMiner
+        started = time.perf_counter()
+        aminer_id, status = await asyncio.to_thread(search_paper_by_title, title, verbose)
+        new_interval = limiter.record(status != "failed", time.perf_counter() - started)
+        if new_interval is not None:
+            out(f"       {Colors.DIM}Adaptive delay now {new_interval:.2f}s{Colors.ENDC}")
+        if status in ("success", "not_found"):
+            if cache_dir:
+                save_cached_search(cache_dir, paper_id, title, aminer_id, status)
+        elif searches.get(normalize_title(title)) is asyncio.current_task():
+            # Only share success/not_found results; later papers search again
+            del searches[normalize_title(title)]
+        return aminer_id, status
+
+    async def start_search(paper_id: str, title: str, out) -> tuple[Optional[str], str]:
+        search = searches[normalize_title(title)] = asyncio.ensure_future(search_title(paper_id, title, out))
+        return await search
+
+    async def enrich_one(idx: int, paper: dict, out) -> None:
+        nonlocal json_modified
         title = paper.get("title", "Unknown")
         paper_id = paper.get("paper_id", "Unknown")
-        existing_aminer_id = paper.get("aminer_paper_id")
-        validation_status = paper.get("aminer_validation", {}).get("status")
-
-        # Check if should skip
-        if not force:
-            if existing_aminer_id:
-                print(f"[{idx}/{stats['total']}] {Colors.DIM}Skipping{Colors.ENDC} {paper_id}: {title[:50]}... (already has AMiner ID)")
-                stats["skipped"] += 1
-                continue
-            if validation_status == "not_found":
-                print(f"[{idx}/{stats['total']}] {Colors.DIM}Skipping{Colors.ENDC} {paper_id}: {title[:50]}... (marked as not_found)")
-                stats["skipped"] += 1
-                continue
-
-        print(f"[{idx}/{stats['total']}] {Colors.CYAN}Processing{Colors.ENDC} {paper_id}: {title[:50]}...")
 
-        # Search for paper on AMiner
-        aminer_id, status = search_paper_by_title(title, verbose=verbose)
+        # Reuse a cached search result for this title (e.g. after merge rebuilt papers.json)
+        cached = None
+        if cache_dir and not force:
+            cached = load_cached_search(cache_dir, paper_id, title)
+
+        if cached:
+            out(f"[{idx}/{stats['total']}] {Colors.CYAN}Processing{Colors.ENDC} {paper_id}: {title[:50]}... {Colors.DIM}(cached search){Colors.ENDC}")
+            aminer_id, status = cached
+            stats["search_cache_hit"] += 1
+        elif normalize_title(title) in searches:
+            # Another paper with this title is (or was) searched in this run
+            out(f"[{idx}/{stats['total']}] {Colors.CYAN}Processing{Colors.ENDC} {paper_id}: {title[:50]}... {Colors.DIM}(shared search){Colors.ENDC}")
+            aminer_id, status = await searches[normalize_title(title)]
+            if status == "failed":
+                # The shared search failed; search for this paper on its own
+                aminer_id, status = await start_search(paper_id, title, out)
+            else:
+                stats["search_cache_hit"] += 1
+        else:
+            out(f"[{idx}/{stats['total']}] {Colors.CYAN}Processing{Colors.ENDC} {paper_id}: {title[:50]}...")
+            aminer_id, status = await start_search(paper_id, title, out)
 
         if status == "success" and aminer_id:
             # Check if detail cache already exists
-            cache_file = output_dir / f"{aminer_id}.json"
-
-            if cache_file.exists():
+            if aminer_id in cached_ids:
                 # Cache exists, skip API call
                 if verbose:
-                    print(f"       {Colors.DIM}Cache exists, skipping API call{Colors.ENDC}")
+                    out(f"       {Colors.DIM}Cache exists, skipping API call{Colors.ENDC}")
 
                 # Update papers.json
                 if update_paper_with_aminer(paper, aminer_id, "success"):
                     json_modified = True
 
-                print(f"       {Colors.GREEN}[SUCCESS]{Colors.ENDC} Using cached detail: {aminer_id}.json")
+                out(f"       {Colors.GREEN}[SUCCESS]{Colors.ENDC} Using cached detail: {aminer_id}.json")
                 stats["success"] += 1
             else:
                 # Cache doesn't exist, fetch from API
-                detail = fetch_paper_detail_data(aminer_id, verbose=verbose)
+                detail = await asyncio.to_thread(fetch_paper_detail_data, aminer_id, verbose)
 
                 if detail:
-                    # Save paper detail data
-                    save_paper_detail(
-                        output_dir=output_dir,
-                        aminer_id=aminer_id,
-                        detail=detail
-                    )
+                    # Save paper detail data (off the event loop, so other lookups keep going)
+                    await asyncio.to_thread(save_paper_detail, output_dir, aminer_id, detail)
+                    cached_ids.add(aminer_id)
 
                     # Update papers.json
                     if update_paper_with_aminer(paper, aminer_id, "success"):
                         json_modified = True
 
-                    print(f"       {Colors.GREEN}[SUCCESS]{Colors.ENDC} Saved detail to: {aminer_id}.json")
+                    out(f"       {Colors.GREEN}[SUCCESS]{Colors.ENDC} Saved detail to: {aminer_id}.json")
                     stats["success"] += 1
                 else:
                     # Detail fetch failed (after retries)
                     if update_paper_with_aminer(paper, None, "failed"):
                         json_modified = True
-                    print(f"       {Colors.RED}[FAILED]{Colors.ENDC} Could not fetch paper details (after retries)")
-                    print(f"       {Colors.YELLOW}Waiting 10s before continuing...{Colors.ENDC}")
-                    time.sleep(10)
+                    out(f"       {Colors.RED}[FAILED]{Colors.ENDC} Could not fetch paper details (after retries)")
+                    out(f"       {Colors.YELLOW}Waiting 10s before continuing...{Colors.ENDC}")
+                    await asyncio.sleep(10)
                     stats["failed"] += 1
                     stats["failed_ids"].append(paper_id)
         elif status == "not_found":
             # Paper not found on AMiner
             if update_paper_with_aminer(paper, None, "not_found"):
                 json_modified = True
-            print(f"       {Colors.YELLOW}[NOT FOUND]{Colors.ENDC} No matching paper on AMiner")
+            out(f"       {Colors.YELLOW}[NOT FOUND]{Colors.ENDC} No matching paper on AMiner")
             stats["not_found"] += 1
         else:
             # Search failed (after retries)
             if update_paper_with_aminer(paper, None, "failed"):
                 json_modified = True
-            print(f"       {Colors.RED}[FAILED]{Colors.ENDC} Search API call failed (after retries)")
-            print(f"       {Colors.YELLOW}Waiting 10s before continuing...{Colors.ENDC}")
-            time.sleep(10)
+            out(f"       {Colors.RED}[FAILED]{Colors.ENDC} Search API call failed (after retries)")
+            out(f"       {Colors.YELLOW}Waiting 10s before continuing...{Colors.ENDC}")
+            await asyncio.sleep(10)
             stats["failed"] += 1
             stats["failed_ids"].append(paper_id)
 
         stats["processed"] += 1
 
-        # Save after every paper (if modified) to prevent data loss
-        if json_modified:
-            save_json_file(json_file_path, data)
+        # Save periodically (if modified); papers lost to a crash are redone from the search cache
+        if json_modified and stats["processed"] % SAVE_EVERY == 0:
+            save_json_document(json_file_path, data)
 
         # Backup every 100 processed papers
         if json_modified and stats["processed"] % 100 == 0:
-            print(f"\n{Colors.CYAN}[Checkpoint] Creating backup... ({stats['processed']}/{stats['total']}){Colors.ENDC}")
+            out(f"\n{Colors.CYAN}[Checkpoint] Creating backup... ({stats['processed']}/{stats['total']}){Colors.ENDC}")
             backup_path = backup_file(json_file_path, project_root)
             if backup_path:
-                print(f"Backup saved to: {backup_path}")
-            print(f"{Colors.GREEN}Checkpoint backup created{Colors.ENDC}\n")
+                out(f"Backup saved to: {backup_path}")
+            out(f"{Colors.GREEN}Checkpoint backup created{Colors.ENDC}\n")
+
+    async def worker(idx: int, paper: dict) -> None:
+        # With concurrency, each paper's output is buffered and printed as one block
+        async with semaphore:
+            lines: list[str] = []
+            out = print if concurrency == 1 else lines.append
+            try:
+                await enrich_one(idx, paper, out)
+            finally:
+                if lines:
+                    print("\n".join(lines))
+
+    # Pre-filter papers that need no work, so workers are only scheduled for the rest
+    if force:
+        todo = list(enumerate(papers, 1))
+    else:
+        todo = []
+        has_id_count = not_found_count = 0
+        for idx, paper in enumerate(papers, 1):
+            if paper.get("aminer_paper_id"):
+                has_id_count += 1
+            elif paper.get("aminer_validation", {}).get("status") == "not_found":
+                not_found_count += 1
+            else:
+                todo.append((idx, paper))
+        stats["skipped"] = has_id_count + not_found_count
+        if has_id_count:
+            print(f"{Colors.DIM}Skipping {has_id_count} papers that already have an AMiner ID{Colors.ENDC}")
+        if not_found_count:
+            print(f"{Colors.DIM}Skipping {not_found_count} papers marked as not_found{Colors.ENDC}")
+        if stats["skipped"]:
+            print()
 
-        # Rate limiting
-        if idx < stats["total"] and delay > 0:
-            time.sleep(delay)
+    try:
+        await asyncio.gather(*(worker(idx, paper) for idx, paper in todo))
+    finally:
+        # Final save, also on Ctrl-C (only if we didn't just save at a checkpoint)
+        if json_modified and stats["processed"] % SAVE_EVERY != 0:
+            save_json_document(json_file_path, data)
+    if adaptive_rate:
+        stats["final_delay"] = limiter.interval
 
     # Final backup if modified (only if we didn't just backup at a checkpoint)
     if json_modified and stats["processed"] % 100 != 0:
@@ -525,6 +776,9 @@ def print_summary(stats: dict) -> None:
     print(f"  - Success:        {Colors.GREEN}{stats['success']}{Colors.ENDC}")
     print(f"  - Not Found:      {Colors.YELLOW}{stats['not_found']}{Colors.ENDC}")
     print(f"  - Failed:         {Colors.RED}{stats['failed']}{Colors.ENDC}")
+    print(f"Search cache hits:  {stats['search_cache_hit']}")
+    if stats["final_delay"] is not None:
+        print(f"Final delay:        {stats['final_delay']:.2f}s (adaptive)")
 
     if stats["failed_ids"]:
         print(f"\n{Colors.RED}Failed Paper IDs:{Colors.ENDC}")
@@ -532,7 +786,7 @@ def print_summary(stats: dict) -> None:
             print(f"  - {paper_id}")
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Enrich papers.json with AMiner data",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -552,6 +806,19 @@ def main():
         help="Output directory for paper detail JSON files (default: data/aminer/papers)"
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default=None,
+        help="Directory for cached title search results (default: data/aminer/cache/paper_search)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write cached title search results"
+    )
+
     parser.add_argument(
         "--force",
         action="store_true",
@@ -572,13 +839,31 @@ def main():
         help="Delay between API requests in seconds (default: 0.5)"
     )
 
+    parser.add_argument(
+        "--adaptive-rate",
+        action="store_true",
+        help="Adjust the delay from observed API responses (halved after a run of fast "
+             "successes, doubled on failures or slow responses), starting at --delay"
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum number of papers looked up concurrently (default: 1)"
+    )
+
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="Print detailed progress for each API call"
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1:
+        print(f"{Colors.RED}Error: --concurrency must be at least 1{Colors.ENDC}")
+        sys.exit(1)
 
     # Resolve file path
     json_file_path = Path(args.json_file).resolve()
@@ -594,11 +879,20 @@ def main():
         # Default: data/aminer/papers (global cache)
         output_dir = project_root / "data" / "aminer" / "papers"
 
+    if args.no_cache:
+        cache_dir = None
+    elif args.cache_dir:
+        cache_dir = Path(args.cache_dir).resolve()
+    else:
+        cache_dir = project_root / "data" / "aminer" / "cache" / "paper_search"
+
     print(f"{Colors.BOLD}Enrich Papers with AMiner Data{Colors.ENDC}")
     print(f"Input file: {json_file_path}")
     print(f"Output directory: {output_dir}")
+    print(f"Search cache: {cache_dir or 'disabled'}")
     print(f"Force refresh: {args.force}")
-    print(f"Delay: {args.delay}s")
+    print(f"Delay: {args.delay}s{' (adaptive)' if args.adaptive_rate else ''}")
+    print(f"Concurrency: {args.concurrency}")
     if args.target_paper_ids:
         print(f"Target paper IDs: {len(args.target_paper_ids)} specified")
     print()
@@ -610,12 +904,18 @@ def main():
         force=args.force,
         target_paper_ids=args.target_paper_ids,
         delay=args.delay,
-        verbose=args.verbose
+        verbose=args.verbose,
+        concurrency=args.concurrency,
+        cache_dir=cache_dir,
+        adaptive_rate=args.adaptive_rate
     )
 
     # Print summary
     print_summary(stats)
 
+    # Returned for build_pipeline, which retries steps with failed items
+    return stats
+
 
 if __name__ == "__main__":
     main()
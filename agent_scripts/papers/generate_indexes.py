@@ -20,11 +20,15 @@ Example:
 
     # Generate specific indexes only
     python generate_indexes.py ../../data/aaai-26 --types papers_by_author authors_with_aminer
+
+    # Build the indexes in 4 worker processes
+    python generate_indexes.py ../../data/aaai-26 --jobs 4
 """
 
 import argparse
 import sys
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -32,7 +36,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from common_utils import (
     Colors,
-    load_json_file,
+    load_json_document,
     save_json_file,
 )
 
@@ -196,9 +200,43 @@ def generate_stats(papers: list[dict], authors: list[dict]) -> dict:
     }
 
 
+# Inputs each index type is built from
+INDEX_INPUTS = {
+    "papers_by_author": ("papers",),
+    "authors_with_aminer": ("authors",),
+    "papers_by_track": ("papers",),
+    "stats": ("papers", "authors"),
+}
+
+
+def build_index(index_type: str, papers: list[dict], authors: list[dict], indexes_dir: Path) -> str:
+    """
+    Build one index and save it to <indexes_dir>/<index_type>.json.
+
+    Runs in a worker process when generating with several jobs, so it only
+    takes plain data and returns the summary message instead of printing.
+    """
+    if index_type == "papers_by_author":
+        index_data = generate_papers_by_author_index(papers)
+        message = f"Generated with {len(index_data)} authors"
+    elif index_type == "authors_with_aminer":
+        index_data = generate_authors_with_aminer_index(authors)
+        message = f"Generated with {len(authors)} authors"
+    elif index_type == "papers_by_track":
+        index_data = generate_papers_by_track_index(papers)
+        message = f"Generated with {len(index_data)} tracks"
+    else:
+        index_data = generate_stats(papers, authors)
+        message = "Generated statistics"
+
+    save_json_file(indexes_dir / f"{index_type}.json", index_data)
+    return message
+
+
 def generate_indexes(
     conference_dir: Path,
-    index_types: list[str] = None
+    index_types: list[str] = None,
+    jobs: int = 1
 ) -> dict:
     """
     Generate all or specific index files.
@@ -206,6 +244,7 @@ def generate_indexes(
     Args:
         conference_dir: Conference directory containing papers.json and authors.json
         index_types: List of index types to generate (None = all)
+        jobs: Number of worker processes building indexes in parallel (1 = in this process)
 
     Returns:
         Statistics about generated indexes
@@ -226,14 +265,14 @@ def generate_indexes(
 
     # Load data
     print(f"Loading papers.json...")
-    papers_data = load_json_file(papers_json)
+    papers_data = load_json_document(papers_json)
     papers = papers_data.get("papers", [])
     print(f"  Loaded {len(papers)} papers\n")
 
     authors = []
     if authors_exist:
         print(f"Loading authors.json...")
-        authors_data = load_json_file(authors_json)
+        authors_data = load_json_document(authors_json)
         authors = authors_data.get("authors", [])
         print(f"  Loaded {len(authors)} authors\n")
 
@@ -241,7 +280,7 @@ def generate_indexes(
     indexes_dir.mkdir(parents=True, exist_ok=True)
 
     # Determine which indexes to generate
-    all_types = ["papers_by_author", "authors_with_aminer", "papers_by_track", "stats"]
+    all_types = list(INDEX_INPUTS)
     if index_types:
         types_to_generate = [t for t in index_types if t in all_types]
     else:
@@ -256,41 +295,31 @@ def generate_indexes(
         "skipped": []
     }
 
-    # Generate papers_by_author
-    if "papers_by_author" in types_to_generate:
-        print(f"{Colors.CYAN}Generating papers_by_author.json...{Colors.ENDC}")
-        index_data = generate_papers_by_author_index(papers)
-        output_path = indexes_dir / "papers_by_author.json"
-        save_json_file(output_path, index_data)
-        print(f"{Colors.GREEN}  Generated with {len(index_data)} authors{Colors.ENDC}\n")
-        stats["generated"].append("papers_by_author")
-
-    # Generate authors_with_aminer
-    if "authors_with_aminer" in types_to_generate and authors_exist:
-        print(f"{Colors.CYAN}Generating authors_with_aminer.json...{Colors.ENDC}")
-        index_data = generate_authors_with_aminer_index(authors)
-        output_path = indexes_dir / "authors_with_aminer.json"
-        save_json_file(output_path, index_data)
-        print(f"{Colors.GREEN}  Generated with {len(authors)} authors{Colors.ENDC}\n")
-        stats["generated"].append("authors_with_aminer")
-
-    # Generate papers_by_track
-    if "papers_by_track" in types_to_generate:
-        print(f"{Colors.CYAN}Generating papers_by_track.json...{Colors.ENDC}")
-        index_data = generate_papers_by_track_index(papers)
-        output_path = indexes_dir / "papers_by_track.json"
-        save_json_file(output_path, index_data)
-        print(f"{Colors.GREEN}  Generated with {len(index_data)} tracks{Colors.ENDC}\n")
-        stats["generated"].append("papers_by_track")
-
-    # Generate stats
-    if "stats" in types_to_generate:
-        print(f"{Colors.CYAN}Generating stats.json...{Colors.ENDC}")
-        stats_data = generate_stats(papers, authors)
-        output_path = indexes_dir / "stats.json"
-        save_json_file(output_path, stats_data)
-        print(f"{Colors.GREEN}  Generated statistics{Colors.ENDC}\n")
-        stats["generated"].append("stats")
+    if jobs > 1 and len(types_to_generate) > 1:
+        # Each worker gets only the data its index is built from
+        print(f"{Colors.CYAN}Generating {len(types_to_generate)} indexes with {jobs} processes...{Colors.ENDC}\n")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(types_to_generate))) as executor:
+            futures = [
+                executor.submit(
+                    build_index,
+                    index_type,
+                    papers if "papers" in INDEX_INPUTS[index_type] else [],
+                    authors if "authors" in INDEX_INPUTS[index_type] else [],
+                    indexes_dir
+                )
+                for index_type in types_to_generate
+            ]
+            for index_type, future in zip(types_to_generate, futures):
+                message = future.result()
+                print(f"{Colors.GREEN}  {index_type}.json: {message}{Colors.ENDC}")
+                stats["generated"].append(index_type)
+        print()
+    else:
+        for index_type in types_to_generate:
+            print(f"{Colors.CYAN}Generating {index_type}.json...{Colors.ENDC}")
+            message = build_index(index_type, papers, authors, indexes_dir)
+            print(f"{Colors.GREEN}  {message}{Colors.ENDC}\n")
+            stats["generated"].append(index_type)
 
     return stats
 
@@ -310,7 +339,7 @@ def print_summary(stats: dict) -> None:
             print(f"  {Colors.YELLOW}-{Colors.ENDC} {index_type}")
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description="Generate index files for optimized frontend queries",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -326,11 +355,19 @@ def main():
     parser.add_argument(
         "--types",
         nargs="+",
-        choices=["papers_by_author", "authors_with_aminer", "papers_by_track", "stats"],
+        choices=list(INDEX_INPUTS),
         help="Specific index types to generate (default: all)"
     )
 
-    args = parser.parse_args()
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes building indexes in parallel (default: 1, i.e. in this process). "
+             "Each worker is sent a copy of the papers/authors it needs, so this only pays off for large data"
+    )
+
+    args = parser.parse_args(argv)
 
     # Resolve directory path
     conference_dir = Path(args.conference_dir).resolve()
@@ -353,7 +390,8 @@ def main():
     # Generate indexes
     stats = generate_indexes(
         conference_dir=conference_dir,
-        index_types=args.types
+        index_types=args.types,
+        jobs=args.jobs
     )
 
     # Print summary
@@ -31,6 +31,15 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON file I/O
+    orjson = None
+
+# Add parent directory to path for common_utils
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from common_utils import save_json_document
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -52,6 +61,8 @@ def get_project_root() -> Path:
 def load_json_file(file_path: Path) -> dict:
     """Load and parse a JSON file."""
     try:
+        if orjson is not None:
+            return orjson.loads(file_path.read_bytes())
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except json.JSONDecodeError as e:
@@ -62,14 +73,6 @@ def load_json_file(file_path: Path) -> dict:
         raise
 
 
-def save_json_file(file_path: Path, data: dict) -> None:
-    """Save data to a JSON file with proper formatting."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write('\n')
-
-
 def validate_json_structure(data: dict, file_path: Path) -> bool:
     """
     Validate that JSON data has the expected structure.
@@ -276,7 +279,7 @@ def print_statistics(stats: Dict[str, any], duplicate_count: int) -> None:
         print(f"  No Validation: {aminer['no_validation']}")
 
 
-def main():
+def main(argv: list[str] | None = None):
     parser = argparse.ArgumentParser(
         description='Merge multiple track JSON files into a single papers.json file',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -312,7 +315,7 @@ def main():
         help='Conference name for metadata (auto-detected from path if not provided)'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate input directory
     if not args.input_dir.exists():
@@ -368,7 +371,7 @@ def main():
     }
 
     # Save merged file
-    save_json_file(output_path, merged_data)
+    save_json_document(output_path, merged_data)
 
     # Print statistics
     print_statistics(stats, len(duplicate_ids))
@@ -14,15 +14,58 @@ from pathlib import Path
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path for common_utils
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from common_utils import Colors, load_json_file, save_json_file
+from common_utils import Colors, load_json_cached, save_json_file
 
 
 # API Configuration
 DEFAULT_API_BASE_URL = "http://localhost:37804"
 SCHOLAR_DETAIL_ENDPOINT = "/api/aminer/scholar/detail"
+SCHOLAR_DETAIL_BATCH_ENDPOINT = "/api/aminer/scholar/detail/batch"
+
+# Scholars per batch detail request (the data-proxy accepts up to 100)
+SCHOLAR_BATCH_SIZE = 50
+
+# Connection pool size, enough for concurrent fetches (see --concurrency)
+HTTP_POOL_SIZE = 32
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all API calls.
+
+    Keeps connections to the data-proxy alive between scholars instead of
+    opening a new one per request, and retries transient failures (429/5xx,
+    honouring Retry-After) with a short backoff before the caller's own retry.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET"}),
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+# Line breaks picked up when credentials are pasted from a browser or shell
+_LINE_BREAKS = str.maketrans("", "", "\r\n")
+
+
+def clean_credential(value: Optional[str]) -> Optional[str]:
+    """Remove line breaks and surrounding whitespace from a credential."""
+    if not value:
+        return value
+    return value.translate(_LINE_BREAKS).strip()
 
 
 def get_api_credentials() -> tuple[Optional[str], Optional[str], Optional[str]]:
@@ -37,20 +80,31 @@ def get_api_credentials() -> tuple[Optional[str], Optional[str], Optional[str]]:
     timestamp = os.environ.get("AMINER_TIMESTAMP")
 
     # Clean up credentials
-    if authorization:
-        authorization = authorization.strip().replace('\n', '').replace('\r', '')
-    if signature:
-        signature = signature.strip().replace('\n', '').replace('\r', '')
-    if timestamp:
-        timestamp = timestamp.strip().replace('\n', '').replace('\r', '')
+    return clean_credential(authorization), clean_credential(signature), clean_credential(timestamp)
+
+
+def list_cached_scholar_ids(aminer_dir: Path, enriched_dir: Path) -> set[str]:
+    """
+    Get the IDs of scholars cached in both directories.
+
+    Scans each directory once with os.scandir, which is much cheaper than a
+    pair of exists() checks per scholar when processing thousands of them.
+    """
+    def json_stems(directory: Path) -> set[str]:
+        try:
+            with os.scandir(directory) as entries:
+                return {e.name[:-5] for e in entries if e.name.endswith(".json")}
+        except FileNotFoundError:
+            return set()
 
-    return authorization, signature, timestamp
+    return json_stems(aminer_dir) & json_stems(enriched_dir)
 
 
 def load_cached_scholar_data(
     aminer_dir: Path,
     enriched_dir: Path,
-    aminer_id: str
+    aminer_id: str,
+    cached_ids: Optional[set[str]] = None
 ) -> Optional[tuple[dict, dict]]:
     """
     Load cached scholar data if exists.
@@ -59,6 +113,8 @@ def load_cached_scholar_data(
         aminer_dir: Directory for AMiner cache files
         enriched_dir: Directory for enriched data files
         aminer_id: Scholar's AMiner ID
+        cached_ids: Result of list_cached_scholar_ids, used instead of
+            checking that the files exist (None = check the files)
 
     Returns:
         Tuple of (aminer_data, enriched_data) or None if cache doesn't exist
@@ -67,9 +123,14 @@ def load_cached_scholar_data(
     enriched_file = enriched_dir / f"{aminer_id}.json"
 
     # Both files must exist to use cache
-    if aminer_file.exists() and enriched_file.exists():
-        aminer_data = load_json_file(aminer_file)
-        enriched_data = load_json_file(enriched_file)
+    if cached_ids is not None:
+        is_cached = aminer_id in cached_ids
+    else:
+        is_cached = aminer_file.exists() and enriched_file.exists()
+
+    if is_cached:
+        aminer_data = load_json_cached(aminer_file)
+        enriched_data = load_json_cached(enriched_file)
         return (aminer_data, enriched_data)
 
     return None
@@ -114,7 +175,7 @@ def fetch_scholar_from_api(
     }
 
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=60)
+        response = _SESSION.get(url, headers=headers, params=params, timeout=60)
         response.raise_for_status()
         result = response.json()
 
@@ -134,7 +195,66 @@ def fetch_scholar_from_api(
         return (None, error_msg)
 
 
-def convert_api_to_aminer_format(api_response: dict, aminer_id: str, data_source: str) -> dict:
+def fetch_scholars_batch(
+    aminer_ids: list[str],
+    api_base_url: str,
+    authorization: str,
+    signature: str,
+    timestamp: str,
+    force_refresh: bool = False
+) -> Optional[dict[str, dict]]:
+    """
+    Fetch several scholars with one data-proxy batch request.
+
+    Args:
+        aminer_ids: Scholars' AMiner IDs (at most SCHOLAR_BATCH_SIZE)
+        api_base_url: Base URL of the API
+        authorization: Authorization token
+        signature: X-Signature value
+        timestamp: X-Timestamp value
+        force_refresh: Force refresh cache
+
+    Returns:
+        Dictionary mapping AMiner ID -> API response (same format as
+        fetch_scholar_from_api) for the scholars that were fetched, or None if
+        the request failed, e.g. because the data-proxy has no batch endpoint.
+        Scholars missing from the result should be fetched one by one.
+    """
+    url = f"{api_base_url}{SCHOLAR_DETAIL_BATCH_ENDPOINT}"
+    headers = {
+        "Authorization": authorization,
+        "X-Signature": signature,
+        "X-Timestamp": timestamp,
+    }
+    payload = {
+        "ids": list(aminer_ids),
+        "force_refresh": force_refresh,
+    }
+
+    try:
+        response = _SESSION.post(url, headers=headers, json=payload, timeout=120)
+        response.raise_for_status()
+        result = response.json()
+    except Exception:
+        return None
+
+    data = result.get("data")
+    if not result.get("success") or not isinstance(data, dict):
+        return None
+
+    return {
+        aminer_id: api_response
+        for aminer_id, api_response in data.items()
+        if isinstance(api_response, dict) and api_response.get("success")
+    }
+
+
+def convert_api_to_aminer_format(
+    api_response: dict,
+    aminer_id: str,
+    data_source: str,
+    fetched_at: Optional[str] = None
+) -> dict:
     """
     Convert API response to AMiner JSON format for data/aminer/scholars.
 
@@ -142,6 +262,7 @@ def convert_api_to_aminer_format(api_response: dict, aminer_id: str, data_source
         api_response: Response from API
         aminer_id: Scholar's AMiner ID
         data_source: Data source identifier
+        fetched_at: ISO timestamp to record (default: now)
 
     Returns:
         Dictionary in AMiner format
@@ -167,7 +288,7 @@ def convert_api_to_aminer_format(api_response: dict, aminer_id: str, data_source
     # Build AMiner format structure
     aminer_data = {
         "aminer_id": aminer_id,
-        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "fetched_at": fetched_at or datetime.now(timezone.utc).isoformat(),
         "source": data_source,
         "detail": detail,
     }
@@ -175,7 +296,12 @@ def convert_api_to_aminer_format(api_response: dict, aminer_id: str, data_source
     return aminer_data
 
 
-def convert_api_to_enriched_format(api_response: dict, aminer_id: str, data_source: str) -> dict:
+def convert_api_to_enriched_format(
+    api_response: dict,
+    aminer_id: str,
+    data_source: str,
+    fetched_at: Optional[str] = None
+) -> dict:
     """
     Convert API response to enriched format for data/enriched/scholars.
 
@@ -183,6 +309,7 @@ def convert_api_to_enriched_format(api_response: dict, aminer_id: str, data_sour
         api_response: Response from API
         aminer_id: Scholar's AMiner ID
         data_source: Data source identifier
+        fetched_at: ISO timestamp to record as last_updated (default: now)
 
     Returns:
         Dictionary in enriched format
@@ -192,7 +319,7 @@ def convert_api_to_enriched_format(api_response: dict, aminer_id: str, data_sour
     # Build enriched data structure
     enriched_data = {
         "aminer_id": aminer_id,
-        "last_updated": datetime.now(timezone.utc).isoformat(),
+        "last_updated": fetched_at or datetime.now(timezone.utc).isoformat(),
         "source": data_source,
     }
 
@@ -273,7 +400,10 @@ def process_single_scholar(
     force: bool = False,
     force_refresh: bool = False,
     update_existing: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    cached_ids: Optional[set[str]] = None,
+    api_response: Optional[dict] = None,
+    fetched_at: Optional[str] = None
 ) -> tuple[Optional[dict], Optional[dict], str]:
     """
     Process a single scholar and enrich with AMiner data.
@@ -291,32 +421,38 @@ def process_single_scholar(
         force_refresh: Force refresh API cache
         update_existing: Update existing cache with merge (preserves extra fields like email)
         verbose: Whether to print detailed progress
+        cached_ids: IDs known to be cached (see list_cached_scholar_ids), saves
+            the per-scholar file checks
+        api_response: Response already fetched for this scholar (see
+            fetch_scholars_batch), used instead of the first API call
+        fetched_at: ISO timestamp recorded in the saved files (default: now),
+            e.g. one shared timestamp for a whole run
 
     Returns:
         Tuple of (aminer_data, enriched_data, status, error_msg)
         - status can be: "cache_hit", "api_success", "api_updated", "api_no_change", "api_failed"
         - error_msg is None unless status is "api_failed"
     """
-    # Ensure output directories exist
-    aminer_dir.mkdir(parents=True, exist_ok=True)
-    enriched_dir.mkdir(parents=True, exist_ok=True)
-
-    # Load existing enriched data if available (for merge mode)
-    enriched_file = enriched_dir / f"{aminer_id}.json"
-    existing_enriched_data = None
-    if enriched_file.exists():
-        existing_enriched_data = load_json_file(enriched_file)
-
     # Check cache first
     cached_data = None
     if not force and not update_existing:
-        cached_data = load_cached_scholar_data(aminer_dir, enriched_dir, aminer_id)
+        cached_data = load_cached_scholar_data(aminer_dir, enriched_dir, aminer_id, cached_ids)
         if cached_data:
             aminer_data, enriched_data = cached_data
             if verbose:
                 print(f"       {Colors.DIM}Using cached scholar data{Colors.ENDC}")
             return (aminer_data, enriched_data, "cache_hit", None)
 
+    # Ensure output directories exist
+    aminer_dir.mkdir(parents=True, exist_ok=True)
+    enriched_dir.mkdir(parents=True, exist_ok=True)
+
+    # Load existing enriched data if available (for merge mode)
+    enriched_file = enriched_dir / f"{aminer_id}.json"
+    existing_enriched_data = None
+    if update_existing and enriched_file.exists():
+        existing_enriched_data = load_json_cached(enriched_file)
+
     # Fetch from API if no cache, force refresh, or update_existing mode
     if verbose:
         if update_existing and existing_enriched_data:
@@ -324,15 +460,18 @@ def process_single_scholar(
         else:
             print(f"       {Colors.CYAN}Fetching from API{Colors.ENDC}")
 
-    api_response, error_msg = fetch_scholar_from_api(
-        aminer_id,
-        api_base_url,
-        authorization,
-        signature,
-        timestamp,
-        force_refresh,
-        verbose
-    )
+    if api_response is not None:
+        error_msg = None
+    else:
+        api_response, error_msg = fetch_scholar_from_api(
+            aminer_id,
+            api_base_url,
+            authorization,
+            signature,
+            timestamp,
+            force_refresh,
+            verbose
+        )
 
     # Retry with force_refresh if failed (may be due to stale cache)
     if not api_response and error_msg:
@@ -362,13 +501,13 @@ def process_single_scholar(
 
     if api_response:
         # Convert to AMiner format
-        aminer_data = convert_api_to_aminer_format(api_response, aminer_id, data_source)
+        aminer_data = convert_api_to_aminer_format(api_response, aminer_id, data_source, fetched_at)
         save_json_file(aminer_dir / f"{aminer_id}.json", aminer_data)
         if verbose:
             print(f"       {Colors.GREEN}✓{Colors.ENDC} Saved AMiner data")
 
         # Convert to enriched format
-        new_enriched_data = convert_api_to_enriched_format(api_response, aminer_id, data_source)
+        new_enriched_data = convert_api_to_enriched_format(api_response, aminer_id, data_source, fetched_at)
 
         # Merge with existing data if in update mode and existing data exists
         if update_existing and existing_enriched_data:
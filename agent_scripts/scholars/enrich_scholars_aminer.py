@@ -56,6 +56,7 @@ from typing import Optional
 sys.path.insert(0, str(Path(__file__).parent))
 from aminer_scholar_utils import (
     DEFAULT_API_BASE_URL,
+    clean_credential,
     get_api_credentials,
     process_single_scholar,
     print_processing_summary,
@@ -363,18 +364,10 @@ def main():
     if args.output:
         output_path = Path(args.output).resolve()
 
-    # Get credentials
-    authorization = args.authorization
-    signature = args.signature
-    timestamp = args.timestamp
-
-    # Clean up command line arguments
-    if authorization:
-        authorization = authorization.strip().replace('\n', '').replace('\r', '')
-    if signature:
-        signature = signature.strip().replace('\n', '').replace('\r', '')
-    if timestamp:
-        timestamp = timestamp.strip().replace('\n', '').replace('\r', '')
+    # Get credentials (cleaned up, as they are often pasted with line breaks)
+    authorization = clean_credential(args.authorization)
+    signature = clean_credential(args.signature)
+    timestamp = clean_credential(args.timestamp)
 
     # Fall back to environment variables
     if not authorization or not signature or not timestamp:
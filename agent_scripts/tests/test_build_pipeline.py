@@ -0,0 +1,27 @@
+"""Tests for papers/build_pipeline.py."""
+
+import sys
+from itertools import combinations
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "papers"))
+from build_pipeline import ALL_STEP_IDS, pipeline_levels
+
+
+@pytest.mark.parametrize("steps", [
+    ["merge", "enrich-authors"],
+    ["enrich-papers", "generate-indexes"],
+    ["merge", "generate-indexes"],
+    ["merge", "enrich-papers", "enrich-authors", "generate-indexes"],
+])
+def test_pipeline_levels_keeps_chain_through_unselected_steps(steps):
+    # The steps form a single chain, so no two selected steps may share a level
+    assert pipeline_levels(steps) == [[step_id] for step_id in steps]
+
+
+def test_pipeline_levels_never_groups_steps_for_any_subset():
+    for size in range(1, len(ALL_STEP_IDS) + 1):
+        for steps in combinations(ALL_STEP_IDS, size):
+            assert pipeline_levels(list(steps)) == [[step_id] for step_id in steps]
@@ -0,0 +1,32 @@
+"""Tests for papers/enrich_authors_aminer.py."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "papers"))
+from enrich_authors_aminer import TokenBucket
+
+
+def test_token_bucket_without_rate_does_not_wait():
+    async def run():
+        bucket = TokenBucket(0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(5):
+            await bucket.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(run()) < 0.05
+
+
+def test_token_bucket_pause_applies_with_rate_zero():
+    async def run():
+        bucket = TokenBucket(0)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        bucket.pause(0.2)
+        await bucket.acquire()
+        return loop.time() - start
+
+    assert asyncio.run(run()) >= 0.19
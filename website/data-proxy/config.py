@@ -20,6 +20,9 @@ class Settings(BaseSettings):
     avatar_cache_ttl: int = 31536000  # 365 days in seconds (effectively permanent)
     email_cache_ttl: int = 2592000  # 30 days in seconds (same as aminer_cache_ttl)
 
+    # Maximum scholar IDs per /aminer/scholar/detail/batch request
+    aminer_batch_max_size: int = 100
+
     # Firecrawl Configuration
     firecrawl_api_url: str = "https://firecrawl.ihainan.me/v1"
     firecrawl_timeout: float = 180.0  # Firecrawl can be slow, allow 3 minutes
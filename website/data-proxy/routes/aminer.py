@@ -7,9 +7,10 @@ from typing import Optional
 
 from fastapi import APIRouter, HTTPException, Query, Header
 from fastapi.responses import Response
+from pydantic import BaseModel
 
 from config import settings
-from services.aminer_service import get_scholar_detail
+from services.aminer_service import get_scholar_detail, get_scholar_details
 from services.avatar_service import get_scholar_avatar
 from services.email_service import get_scholar_email_image
 from services.cache_service import clear_cache_directory
@@ -19,6 +20,12 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/aminer", tags=["AMiner"])
 
 
+class ScholarDetailBatchRequest(BaseModel):
+    """Request body for the batch scholar detail endpoint."""
+    ids: list[str]
+    force_refresh: bool = False
+
+
 @router.get("/scholar/detail")
 async def get_aminer_scholar_detail_endpoint(
     id: str = Query(..., description="AMiner scholar ID"),
@@ -58,6 +65,63 @@ async def get_aminer_scholar_detail_endpoint(
     return await get_scholar_detail(id, authorization, x_signature, x_timestamp, force_refresh)
 
 
+@router.post("/scholar/detail/batch")
+async def get_aminer_scholar_detail_batch_endpoint(
+    request: ScholarDetailBatchRequest,
+    authorization: Optional[str] = Header(None, description="AMiner authorization token"),
+    x_signature: Optional[str] = Header(None, alias="X-Signature", description="AMiner API signature"),
+    x_timestamp: Optional[str] = Header(None, alias="X-Timestamp", description="AMiner API timestamp"),
+):
+    """
+    Get details for several scholars in one request.
+
+    Cached scholars are served from the cache; all others are fetched from the
+    AMiner web API in a single request. Responses are cached per scholar, shared
+    with /aminer/scholar/detail.
+
+    Headers required:
+    - Authorization: AMiner bearer token
+    - X-Signature: Request signature
+    - X-Timestamp: Request timestamp
+
+    Request body:
+    - ids: Scholar AMiner IDs (required, at most settings.aminer_batch_max_size)
+    - force_refresh: Force refresh cache (optional, default: false)
+
+    Returns:
+        {"code": 200, "success": true, "data": {id: detail}, "errors": {id: message}}
+        where each detail has the same format as /aminer/scholar/detail
+    """
+    logger.info(
+        f"[API Request] POST /aminer/scholar/detail/batch - {len(request.ids)} scholar IDs, "
+        f"Force Refresh: {request.force_refresh}"
+    )
+
+    # Validate required headers
+    if not authorization:
+        logger.warning("[API Request] Missing Authorization header for scholar batch")
+        raise HTTPException(status_code=400, detail="Authorization header is required")
+    if not x_signature:
+        logger.warning("[API Request] Missing X-Signature header for scholar batch")
+        raise HTTPException(status_code=400, detail="X-Signature header is required")
+    if not x_timestamp:
+        logger.warning("[API Request] Missing X-Timestamp header for scholar batch")
+        raise HTTPException(status_code=400, detail="X-Timestamp header is required")
+
+    if not request.ids:
+        raise HTTPException(status_code=400, detail="ids must not be empty")
+    if len(request.ids) > settings.aminer_batch_max_size:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many ids: {len(request.ids)} (max {settings.aminer_batch_max_size})"
+        )
+
+    result = await get_scholar_details(
+        request.ids, authorization, x_signature, x_timestamp, request.force_refresh
+    )
+    return {"code": 200, "success": True, **result}
+
+
 @router.post("/cache/clear")
 def clear_aminer_cache_endpoint():
     """Clear all cached AMiner web API responses."""
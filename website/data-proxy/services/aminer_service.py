@@ -41,12 +41,39 @@ async def fetch_aminer_web_api(
     Returns:
         Raw API response from AMiner web API
 
+    Raises:
+        HTTPException: If API request fails after all retry attempts
+    """
+    return await fetch_aminer_web_api_batch([scholar_id], authorization, x_signature, x_timestamp)
+
+
+async def fetch_aminer_web_api_batch(
+    scholar_ids: list[str],
+    authorization: str,
+    x_signature: str,
+    x_timestamp: str
+) -> dict:
+    """
+    Fetch data for one or more scholars from AMiner web API with automatic retry.
+
+    The getPerson API takes a list of IDs, so several scholars share one request.
+
+    Args:
+        scholar_ids: AMiner scholar IDs
+        authorization: Authorization token from header
+        x_signature: X-Signature from header
+        x_timestamp: X-Timestamp from header
+
+    Returns:
+        Raw API response from AMiner web API (one person entry per found scholar)
+
     Raises:
         HTTPException: If API request fails after all retry attempts
     """
     import asyncio
 
     url = "https://apiv2.aminer.cn/magic?a=getPerson__personapi.get___"
+    label = f"scholar {scholar_ids[0]}" if len(scholar_ids) == 1 else f"{len(scholar_ids)} scholars"
 
     headers = {
         "Accept": "application/json, text/plain, */*",
@@ -58,7 +85,7 @@ async def fetch_aminer_web_api(
 
     payload = [{
         "action": "personapi.get",
-        "parameters": {"ids": [scholar_id]},
+        "parameters": {"ids": list(scholar_ids)},
         "schema": {
             "person": [
                 "id", "name", "name_zh", "avatar", "num_view", "is_follow",
@@ -79,9 +106,9 @@ async def fetch_aminer_web_api(
     for attempt in range(1, max_attempts + 1):
         try:
             if attempt > 1:
-                logger.warning(f"[AMiner API] Retry attempt {attempt - 1}/{max_attempts - 1} for scholar {scholar_id}")
+                logger.warning(f"[AMiner API] Retry attempt {attempt - 1}/{max_attempts - 1} for {label}")
             else:
-                logger.info(f"[AMiner API] Fetching scholar data for ID: {scholar_id}")
+                logger.info(f"[AMiner API] Fetching data for {label}")
 
             logger.debug(f"[AMiner API] Request URL: {url}")
             logger.debug(f"[AMiner API] Request payload: {json.dumps(payload, ensure_ascii=False)}")
@@ -90,7 +117,7 @@ async def fetch_aminer_web_api(
             response.raise_for_status()
 
             result = response.json()
-            logger.info(f"[AMiner API] Successfully fetched data for scholar {scholar_id} (attempt {attempt})")
+            logger.info(f"[AMiner API] Successfully fetched data for {label} (attempt {attempt})")
             logger.debug(f"[AMiner API] Full response: {json.dumps(result, ensure_ascii=False, indent=2)}")
 
             return result
@@ -98,20 +125,47 @@ async def fetch_aminer_web_api(
         except httpx.HTTPError as e:
             if attempt < max_attempts:
                 logger.warning(
-                    f"[AMiner API] Request failed for scholar {scholar_id} (attempt {attempt}/{max_attempts}), "
+                    f"[AMiner API] Request failed for {label} (attempt {attempt}/{max_attempts}), "
                     f"retrying in {retry_delay}s... Error: {str(e)}"
                 )
                 await asyncio.sleep(retry_delay)
             else:
                 # All attempts exhausted
-                logger.error(f"[AMiner API] Failed to fetch scholar {scholar_id} after {max_attempts} attempts: {str(e)}")
+                logger.error(f"[AMiner API] Failed to fetch {label} after {max_attempts} attempts: {str(e)}")
                 raise HTTPException(
                     status_code=502,
                     detail=f"Failed to fetch from AMiner API after {max_attempts} attempts: {str(e)}"
                 )
 
     # This should never be reached, but just in case
-    raise HTTPException(status_code=502, detail=f"Unexpected error fetching scholar {scholar_id}")
+    raise HTTPException(status_code=502, detail=f"Unexpected error fetching {label}")
+
+
+def split_web_api_response(web_response: dict) -> dict[str, dict]:
+    """
+    Split a multi-scholar AMiner web API response into per-scholar responses.
+
+    Each part has the same shape as a single-scholar response, so it can be
+    converted and cached exactly like one.
+
+    Args:
+        web_response: Raw response from AMiner web API
+
+    Returns:
+        Dictionary mapping scholar ID -> single-scholar web API response
+        (scholars missing from the response are left out)
+    """
+    try:
+        first_item = web_response["data"][0]
+        persons = first_item.get("data") or []
+    except (KeyError, IndexError, TypeError, AttributeError):
+        return {}
+
+    return {
+        person["id"]: {**web_response, "data": [{**first_item, "data": [person]}]}
+        for person in persons
+        if isinstance(person, dict) and person.get("id")
+    }
 
 
 def convert_web_api_to_official_format(web_response: dict) -> dict:
@@ -247,36 +301,20 @@ def extract_enriched_fields(web_response: dict) -> dict:
     return enriched
 
 
-async def get_scholar_detail(
-    scholar_id: str,
-    authorization: str,
-    x_signature: str,
-    x_timestamp: str,
-    force_refresh: bool = False
-) -> dict:
+def read_cached_scholar_detail(scholar_id: str) -> Optional[dict]:
     """
-    Get scholar detail from AMiner web API with caching.
+    Get a scholar's detail from the cache.
 
     Args:
         scholar_id: AMiner scholar ID
-        authorization: Authorization token
-        x_signature: Request signature
-        x_timestamp: Request timestamp
-        force_refresh: Force refresh cache
 
     Returns:
-        Scholar detail in official API format
-
-    Raises:
-        HTTPException: If request fails
+        Scholar detail in official API format, or None if not cached, expired or unreadable
     """
-    logger.info(f"[Scholar Detail] Request for ID: {scholar_id}, Force Refresh: {force_refresh}")
-
-    # Check cache
     cache_path = get_cache_path(settings.aminer_cache_dir, scholar_id)
     cache_stats = get_cache_stats(cache_path)
 
-    if not force_refresh and cache_stats["exists"] and is_cache_valid(cache_path, settings.aminer_cache_ttl):
+    if cache_stats["exists"] and is_cache_valid(cache_path, settings.aminer_cache_ttl):
         # Return cached response
         logger.info(f"[Cache] HIT for scholar {scholar_id} - Age: {cache_stats['age_days']:.1f} days ({cache_stats['age_hours']:.1f} hours)")
         logger.info(f"[Cache] Returning cached data from: {cache_path}")
@@ -295,18 +333,28 @@ async def get_scholar_detail(
         else:
             logger.error(f"[Cache] Failed to read cache for {scholar_id}")
             logger.info(f"[Cache] Falling back to fetching fresh data")
+    elif not cache_stats["exists"]:
+        logger.info(f"[Cache] MISS for scholar {scholar_id} - No cache file found")
     else:
-        if force_refresh:
-            logger.info(f"[Cache] Force refresh requested for scholar {scholar_id}")
-        elif not cache_stats["exists"]:
-            logger.info(f"[Cache] MISS for scholar {scholar_id} - No cache file found")
-        else:
-            logger.info(f"[Cache] EXPIRED for scholar {scholar_id} - Age: {cache_stats['age_days']:.1f} days (TTL: 15 days)")
+        logger.info(f"[Cache] EXPIRED for scholar {scholar_id} - Age: {cache_stats['age_days']:.1f} days (TTL: 15 days)")
 
-    # Fetch from AMiner web API
-    logger.info(f"[Data Source] Fetching fresh data from AMiner web API for scholar {scholar_id}")
-    web_response = await fetch_aminer_web_api(scholar_id, authorization, x_signature, x_timestamp)
+    return None
+
+
+def build_scholar_detail(scholar_id: str, web_response: dict) -> dict:
+    """
+    Convert a scholar's web API response to official format and cache it.
+
+    Args:
+        scholar_id: AMiner scholar ID
+        web_response: Raw single-scholar response from AMiner web API
+
+    Returns:
+        Scholar detail in official API format
 
+    Raises:
+        HTTPException: If AMiner reported an error or the response is invalid
+    """
     logger.info(f"[Data Processing] Converting web API response to official format")
     logger.debug(f"[Data Processing] Raw web API response: {json.dumps(web_response, ensure_ascii=False, indent=2)}")
 
@@ -333,6 +381,7 @@ async def get_scholar_detail(
         official_response["enriched"] = enriched_fields
 
     # Cache both raw response and official format
+    cache_path = get_cache_path(settings.aminer_cache_dir, scholar_id)
     cache_data = {
         "raw_response": web_response,
         "official_format": official_response
@@ -342,5 +391,105 @@ async def get_scholar_detail(
     else:
         logger.error(f"[Cache] Failed to cache response for {scholar_id}")
 
+    return official_response
+
+
+async def get_scholar_detail(
+    scholar_id: str,
+    authorization: str,
+    x_signature: str,
+    x_timestamp: str,
+    force_refresh: bool = False
+) -> dict:
+    """
+    Get scholar detail from AMiner web API with caching.
+
+    Args:
+        scholar_id: AMiner scholar ID
+        authorization: Authorization token
+        x_signature: Request signature
+        x_timestamp: Request timestamp
+        force_refresh: Force refresh cache
+
+    Returns:
+        Scholar detail in official API format
+
+    Raises:
+        HTTPException: If request fails
+    """
+    logger.info(f"[Scholar Detail] Request for ID: {scholar_id}, Force Refresh: {force_refresh}")
+
+    # Check cache
+    if force_refresh:
+        logger.info(f"[Cache] Force refresh requested for scholar {scholar_id}")
+    else:
+        cached_detail = read_cached_scholar_detail(scholar_id)
+        if cached_detail is not None:
+            return cached_detail
+
+    # Fetch from AMiner web API
+    logger.info(f"[Data Source] Fetching fresh data from AMiner web API for scholar {scholar_id}")
+    web_response = await fetch_aminer_web_api(scholar_id, authorization, x_signature, x_timestamp)
+
+    official_response = build_scholar_detail(scholar_id, web_response)
+
     logger.info(f"[API Response] Successfully processed scholar {scholar_id}")
     return official_response
+
+
+async def get_scholar_details(
+    scholar_ids: list[str],
+    authorization: str,
+    x_signature: str,
+    x_timestamp: str,
+    force_refresh: bool = False
+) -> dict:
+    """
+    Get details for several scholars, fetching all uncached ones in one AMiner request.
+
+    Args:
+        scholar_ids: AMiner scholar IDs
+        authorization: Authorization token
+        x_signature: Request signature
+        x_timestamp: Request timestamp
+        force_refresh: Force refresh cache
+
+    Returns:
+        Dictionary with "data" (scholar ID -> detail in official API format) and
+        "errors" (scholar ID -> error message) for scholars that failed
+    """
+    logger.info(f"[Scholar Detail] Batch request for {len(scholar_ids)} IDs, Force Refresh: {force_refresh}")
+
+    details = {}
+    errors = {}
+    to_fetch = []
+    for scholar_id in dict.fromkeys(scholar_ids):
+        cached_detail = None if force_refresh else read_cached_scholar_detail(scholar_id)
+        if cached_detail is not None:
+            details[scholar_id] = cached_detail
+        else:
+            to_fetch.append(scholar_id)
+
+    if to_fetch:
+        logger.info(f"[Data Source] Fetching fresh data from AMiner web API for {len(to_fetch)} scholars")
+        try:
+            web_response = await fetch_aminer_web_api_batch(to_fetch, authorization, x_signature, x_timestamp)
+        except HTTPException as e:
+            return {"data": details, "errors": {scholar_id: e.detail for scholar_id in to_fetch}}
+
+        responses = split_web_api_response(web_response)
+        for scholar_id in to_fetch:
+            # A failed request (succeed: false) has no person entries; build_scholar_detail reports it
+            scholar_response = responses.get(scholar_id)
+            if scholar_response is None and web_response.get("data") and web_response["data"][0].get("succeed") is False:
+                scholar_response = web_response
+            if scholar_response is None:
+                errors[scholar_id] = "Scholar not found or unavailable"
+                continue
+            try:
+                details[scholar_id] = build_scholar_detail(scholar_id, scholar_response)
+            except HTTPException as e:
+                errors[scholar_id] = e.detail
+
+    logger.info(f"[API Response] Batch processed: {len(details)} succeeded, {len(errors)} failed")
+    return {"data": details, "errors": errors}